@@ -0,0 +1,58 @@
+"""
+Benchmark metadata conversion throughput.
+
+Measures documents per second when converting OEP-1.6.0 example metadata to OEMetadata-2.0
+one by one and via `omi.conversion.convert_metadata_batch` with different numbers of worker processes.
+Additionally, measures conversion time of a single document holding a resource with many schema fields.
+
+Run via::
+
+    python benchmarks/conversion.py
+"""
+
+import os
+import time
+from copy import deepcopy
+
+from omi import base, conversion
+
+DOCUMENTS = 2000
+LARGE_FIELD_COUNTS = (1_000, 10_000, 100_000)
+
+
+def _metadata_with_fields(field_count: int) -> dict:
+    metadata = base.get_metadata_specification("OEP-1.6.0").example
+    fields = metadata["resources"][0]["schema"]["fields"]
+    metadata["resources"][0]["schema"]["fields"] = [
+        {**deepcopy(fields[i % len(fields)]), "name": f"field_{i}"} for i in range(field_count)
+    ]
+    return metadata
+
+
+def main() -> None:
+    """Print documents per second for sequential and batch conversion."""
+    metadata = base.get_metadata_specification("OEP-1.6.0").example
+    metadatas = [metadata] * DOCUMENTS
+
+    start = time.perf_counter()
+    for md in metadatas:
+        conversion.convert_metadata(md, "OEMetadata-2.0")
+    print(f"{'loop':>12}: {DOCUMENTS / (time.perf_counter() - start):8.1f} docs/s")
+
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        start = time.perf_counter()
+        for _ in conversion.convert_metadata_batch(metadatas, "OEMetadata-2.0", workers=workers):
+            pass
+        print(f"{workers:>4} workers: {DOCUMENTS / (time.perf_counter() - start):8.1f} docs/s")
+        workers *= 2
+
+    for field_count in LARGE_FIELD_COUNTS:
+        metadata = _metadata_with_fields(field_count)
+        start = time.perf_counter()
+        conversion.convert_metadata(metadata, "OEMetadata-2.0")
+        print(f"{field_count:>7} fields: {(time.perf_counter() - start) * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
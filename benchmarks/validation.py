@@ -0,0 +1,48 @@
+"""
+Benchmark metadata validation throughput.
+
+Compares validating metadata via plain `jsonschema.validate` (building a new validator per document)
+against `omi.validation.validate_metadata` using the cached validator registry.
+
+Run via::
+
+    python benchmarks/validation.py
+"""
+
+import time
+import warnings
+from collections.abc import Callable
+
+import jsonschema
+
+from omi import base, validation
+
+DOCUMENTS = 500
+
+
+def _documents_per_second(func: Callable, metadata: dict) -> float:
+    start = time.perf_counter()
+    for _ in range(DOCUMENTS):
+        func(metadata)
+    return DOCUMENTS / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Print documents per second for uncached and cached validation."""
+    warnings.simplefilter("ignore")
+    for version in ("OEP-1.5.2", "OEP-1.6.0", "OEMetadata-2.0"):
+        metadata = base.get_metadata_specification(version).example
+
+        def uncached(md: dict, version: str = version) -> None:
+            jsonschema.validate(md, base.get_metadata_specification(version).schema)
+
+        def cached(md: dict) -> None:
+            validation.validate_metadata(md, check_license=False)
+
+        before = _documents_per_second(uncached, metadata)
+        after = _documents_per_second(cached, metadata)
+        print(f"{version:>16}: {before:8.1f} docs/s before, {after:8.1f} docs/s after ({after / before:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,15 +3,22 @@
 from __future__ import annotations
 
 import json
+import marshal
 import pathlib
 import re
-from dataclasses import dataclass
+from copy import deepcopy
+from functools import cache
+from typing import TYPE_CHECKING
 
-import requests
 from oemetadata.v1 import v152, v160
 from oemetadata.v2 import v20
 
-from .settings import OEP_URL
+from .oep import OEPError, get_oep_client, process_oep_tables
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable, Iterable
+
+    from .oep import OEPTableResult
 
 # Order matters! First entry equals latest version of metadata format
 METADATA_FORMATS = {"OEP": ["OEMetadata-2.0", "OEP-1.6.0", "OEP-1.5.2"], "INSPIRE": []}
@@ -22,19 +29,73 @@ class MetadataError(Exception):
     """Raised when a metadata error is encountered."""
 
 
-@dataclass
 class MetadataSpecification:
-    """Metadata schema class, holding JSON schema and (optional) template and example for given schema."""
+    """
+    Metadata schema class, holding JSON schema and (optional) template and example for given schema.
+
+    Each part can be given either as dict or as callable returning the dict. Callables are only evaluated
+    on first access, which allows loading template and example lazily.
+    The JSON schema is shared between all callers and must not be modified (use `copy_metadata` to get a copy
+    instead). Template and example are returned as independent copies on every access, so callers can modify them
+    freely. Specifications are equal, if their schema, template and example are equal.
+    """
 
-    schema: dict
-    template: dict | None = None
-    example: dict | None = None
+    __hash__ = None
+
+    def __init__(
+        self,
+        schema: dict | Callable[[], dict],
+        template: dict | Callable[[], dict] | None = None,
+        example: dict | Callable[[], dict] | None = None,
+    ) -> None:
+        """Init specification from given schema, template and example."""
+        self.__sources = {"schema": schema, "template": template, "example": example}
+        self.__loaded = {}
+
+    def __load(self, item: str) -> dict | bytes | None:
+        """Load item once and keep it in memory; template and example are stored as marshalled snapshot."""
+        if item not in self.__loaded:
+            source = self.__sources[item]
+            data = source() if callable(source) else source
+            if item != "schema" and data is not None:
+                data = marshal.dumps(data)
+            self.__loaded[item] = data
+        return self.__loaded[item]
+
+    def __eq__(self, other: object) -> bool:
+        """Compare schema, template and example of specifications."""
+        if not isinstance(other, MetadataSpecification):
+            return NotImplemented
+        return (self.schema, self.template, self.example) == (other.schema, other.template, other.example)
+
+    def __repr__(self) -> str:
+        """Return representation holding schema, template and example."""
+        return f"MetadataSpecification(schema={self.schema!r}, template={self.template!r}, example={self.example!r})"
+
+    @property
+    def schema(self) -> dict:
+        """Return (shared) JSON schema, which must not be modified."""
+        return self.__load("schema")
+
+    @property
+    def template(self) -> dict | None:
+        """Return copy of metadata template."""
+        snapshot = self.__load("template")
+        return None if snapshot is None else marshal.loads(snapshot)  # noqa: S302
+
+    @property
+    def example(self) -> dict | None:
+        """Return copy of metadata example."""
+        snapshot = self.__load("example")
+        return None if snapshot is None else marshal.loads(snapshot)  # noqa: S302
 
 
 def get_metadata_from_oep_table(oep_table: str, oep_schema: str = "model_draft") -> dict:
     """
     Get metadata from OEP table.
 
+    Metadata is fetched via shared OEP client (see `omi.oep.get_oep_client`), thus responses are cached.
+
     Parameters
     ----------
     oep_table: str
@@ -47,13 +108,40 @@ def get_metadata_from_oep_table(oep_table: str, oep_schema: str = "model_draft")
     dict
         Metadata in OEMetadata format
     """
-    response = requests.get(f"{OEP_URL}/api/v0/schema/{oep_schema}/tables/{oep_table}/meta/", timeout=90)
-    if response.status_code != requests.codes.ok:
-        raise MetadataError(f"Could not retrieve metadata from OEP table '{oep_schema}.{oep_table}'.")
-    metadata = response.json()
+    try:
+        metadata = get_oep_client().get_table_metadata(oep_table, oep_schema)
+    except OEPError:
+        raise MetadataError(f"Could not retrieve metadata from OEP table '{oep_schema}.{oep_table}'.") from None
     if not metadata:
         raise MetadataError(f"Metadata from '{oep_schema}.{oep_table}' is empty.")
-    return metadata
+    # Response is cached by OEP client, thus a copy is returned to keep cache unaffected by changes of caller
+    return copy_metadata(metadata)
+
+
+async def get_metadata_from_oep_tables(
+    tables: Iterable[tuple[str, str]],
+    *,
+    concurrency: int = 10,
+) -> AsyncIterator[OEPTableResult]:
+    """
+    Get metadata from many OEP tables concurrently.
+
+    Results are yielded as soon as they arrive, thus not necessarily in order of given tables.
+
+    Parameters
+    ----------
+    tables: Iterable[tuple[str, str]]
+        Pairs of OEP schema name and table name
+    concurrency: int
+        Maximum number of concurrent requests
+
+    Yields
+    ------
+    OEPTableResult
+        Result per table, holding metadata in OEMetadata format or error (i.e. MetadataError)
+    """
+    async for result in process_oep_tables(get_metadata_from_oep_table, tables, concurrency=concurrency):
+        yield result
 
 
 def get_metadata_version(metadata: dict) -> str:
@@ -79,6 +167,29 @@ def get_metadata_version(metadata: dict) -> str:
     raise MetadataError(msg)
 
 
+def copy_metadata(metadata: dict) -> dict:
+    """
+    Return deep copy of metadata.
+
+    Metadata consisting of JSON types only is copied via `marshal`, which is much faster than `copy.deepcopy`.
+    For any other content, it falls back to `copy.deepcopy`.
+
+    Parameters
+    ----------
+    metadata: dict
+        Metadata
+
+    Returns
+    -------
+    dict
+        Independent copy of metadata
+    """
+    try:
+        return marshal.loads(marshal.dumps(metadata))  # noqa: S302
+    except ValueError:
+        return deepcopy(metadata)
+
+
 def __normalize_metadata_version(version: str) -> str:
     """
     Normalize a metadata version string by stripping patch numbers.
@@ -151,10 +262,13 @@ def get_metadata_specification(metadata_version: str) -> MetadataSpecification:
     return METADATA_SPECIFICATIONS[metadata_format](metadata_version)
 
 
+@cache
 def __get_metadata_specs_for_oep(metadata_version: str) -> MetadataSpecification:
     """
     Return OEP metadata schema for given metadata version.
 
+    Specification is created once per process; template and example files are only read on first access.
+
     Parameters
     ----------
     metadata_version: str
@@ -168,11 +282,15 @@ def __get_metadata_specs_for_oep(metadata_version: str) -> MetadataSpecification
     metadata_modules = {"OEP-1.5.2": v152, "OEP-1.6.0": v160, "OEMetadata-2.0": v20}
     metadata_module = metadata_modules[metadata_version]
     module_path = pathlib.Path(metadata_module.__file__).parent
-    specs = {}
-    for item in ("schema", "template", "example"):
-        with (module_path / f"{item}.json").open("r") as f:
-            specs[item] = json.loads(f.read())
-    return MetadataSpecification(**specs)
+
+    def loader(item: str) -> Callable[[], dict]:
+        def load() -> dict:
+            with (module_path / f"{item}.json").open("r") as f:
+                return json.loads(f.read())
+
+        return load
+
+    return MetadataSpecification(**{item: loader(item) for item in ("schema", "template", "example")})
 
 
 METADATA_SPECIFICATIONS = {"OEP": __get_metadata_specs_for_oep}
@@ -0,0 +1,190 @@
+"""Cache module for OMI to store validation results keyed by content hashes."""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import pathlib
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+from omi import __version__
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    import pandas as pd
+    import pyarrow as pa
+
+FILE_HASH_BLOCK_SIZE = 1 << 20
+
+
+class ValidationCache:
+    """
+    Cache of validation results using an in-memory LRU tier and an optional on-disk SQLite tier.
+
+    Results are JSON-serializable values stored under content hash keys (see `get_cache_key`). Keys include the OMI
+    version, thus results of other OMI versions are never reused. The on-disk tier can be shared by several processes
+    and builds (i.e. in CI); if it holds more than `max_disk_entries` results, least recently used ones are evicted.
+    """
+
+    def __init__(
+        self,
+        path: str | pathlib.Path | None = None,
+        *,
+        max_entries: int = 1024,
+        max_disk_entries: int = 100_000,
+    ) -> None:
+        """
+        Init cache.
+
+        Parameters
+        ----------
+        path: str | pathlib.Path | None
+            Path of SQLite database file. If not set, results are cached in memory only.
+        max_entries: int
+            Maximum number of results held in memory
+        max_disk_entries: int
+            Maximum number of results stored on disk
+        """
+        self.path = pathlib.Path(path) if path else None
+        self.max_entries = max_entries
+        self.max_disk_entries = max_disk_entries
+        self.__memory: OrderedDict[str, object] = OrderedDict()
+        self.__lock = threading.Lock()
+        if self.path:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.__connect() as connection:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, value TEXT NOT NULL, accessed REAL)",
+                )
+                connection.execute("CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed)")
+
+    def get(self, key: str) -> object | None:
+        """
+        Return cached result for given key or None if key is not cached.
+
+        Results found on disk are moved into memory tier.
+        """
+        with self.__lock:
+            if key in self.__memory:
+                self.__memory.move_to_end(key)
+                return self.__memory[key]
+        if not self.path:
+            return None
+        with self.__connect() as connection:
+            row = connection.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            connection.execute("UPDATE results SET accessed = ? WHERE key = ?", (time.time(), key))
+        value = json.loads(row[0])
+        self.__store_in_memory(key, value)
+        return value
+
+    def set(self, key: str, value: object) -> None:
+        """Store JSON-serializable result under given key in both tiers."""
+        self.__store_in_memory(key, value)
+        if not self.path:
+            return
+        with self.__connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO results (key, value, accessed) VALUES (?, ?, ?)",
+                (key, json.dumps(value), time.time()),
+            )
+            (count,) = connection.execute("SELECT COUNT(*) FROM results").fetchone()
+            if count > self.max_disk_entries:
+                connection.execute(
+                    "DELETE FROM results WHERE key IN (SELECT key FROM results ORDER BY accessed LIMIT ?)",
+                    (count - self.max_disk_entries,),
+                )
+
+    def clear(self) -> None:
+        """Remove all cached results from memory and disk."""
+        with self.__lock:
+            self.__memory.clear()
+        if self.path:
+            with self.__connect() as connection:
+                connection.execute("DELETE FROM results")
+
+    def __store_in_memory(self, key: str, value: object) -> None:
+        with self.__lock:
+            self.__memory[key] = value
+            self.__memory.move_to_end(key)
+            while len(self.__memory) > self.max_entries:
+                self.__memory.popitem(last=False)
+
+    @contextlib.contextmanager
+    def __connect(self) -> Iterator[sqlite3.Connection]:
+        """Open connection to database, committing changes on success and closing it afterwards."""
+        connection = sqlite3.connect(self.path, timeout=30)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+
+def get_cache_key(kind: str, *parts: object) -> str:
+    """
+    Return cache key for given kind of validation and parts identifying it.
+
+    Parts are hashed via canonical JSON (sorted keys, no whitespace), thus key order and formatting of metadata do
+    not change the key. The OMI version is part of every key.
+
+    Parameters
+    ----------
+    kind: str
+        Kind of validation, i.e. "metadata"
+    parts: object
+        JSON-serializable parts identifying the validation, i.e. metadata, metadata version and options
+
+    Returns
+    -------
+    str
+        SHA-256 hex digest
+    """
+    content = json.dumps(
+        [kind, __version__, *parts],
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def hash_file(path: str | pathlib.Path) -> str:
+    """Return SHA-256 hex digest of file content."""
+    digest = hashlib.sha256()
+    with pathlib.Path(path).open("rb") as f:
+        while block := f.read(FILE_HASH_BLOCK_SIZE):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def hash_dataframe(data: pd.DataFrame) -> str:
+    """Return SHA-256 hex digest of dataframe content, including column names, dtypes and index."""
+    import pandas as pd
+
+    digest = hashlib.sha256()
+    digest.update(json.dumps([[str(column), str(dtype)] for column, dtype in data.dtypes.items()]).encode("utf-8"))
+    try:
+        digest.update(pd.util.hash_pandas_object(data, index=True).to_numpy().tobytes())
+    except TypeError:
+        # Columns holding unhashable values (i.e. lists in array columns) are hashed via their JSON representation
+        digest.update(data.to_json(orient="split", date_format="iso").encode("utf-8"))
+    return digest.hexdigest()
+
+
+def hash_arrow_table(table: pa.Table) -> str:
+    """Return SHA-256 hex digest of Arrow table content, including schema, via its IPC stream serialization."""
+    import pyarrow as pa
+
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return hashlib.sha256(sink.getvalue()).hexdigest()
@@ -2,17 +2,137 @@
 
 from __future__ import annotations
 
-from copy import deepcopy
-
-from omi.base import get_metadata_version
+import itertools
+import os
+from collections import deque
+from collections.abc import MutableMapping
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from omi.base import copy_metadata, get_metadata_version
 from omi.conversions.v152_to_v160 import convert_oep_152_to_160
 from omi.conversions.v160_to_v20 import convert_oep_160_to_20
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
 
 class ConversionError(Exception):
     """Raised when a conversion fails."""
 
 
+@dataclass
+class ConversionResult:
+    """Result of a single metadata conversion within a batch, holding either converted metadata or an error."""
+
+    index: int
+    metadata: dict | None = None
+    error: Exception | None = None
+
+
+class ConversionGraph(MutableMapping):
+    """
+    Registry of conversion functions between metadata versions.
+
+    Behaves like a dictionary mapping tuples of (source version, target version) to conversion functions.
+    Shortest conversion chains between all pairs of versions are computed whenever a conversion is registered
+    or removed, thus finding a conversion chain for a document is a single lookup.
+    """
+
+    def __init__(self, conversions: dict[tuple[str, str], Callable[[dict], dict]] | None = None) -> None:
+        """Init graph with given conversions."""
+        self.__conversions = dict(conversions or {})
+        self.__chains: dict[tuple[str, str], tuple[str, ...]] = {}
+        self.__compute_chains()
+
+    def register(self, source_version: str, target_version: str, conversion: Callable[[dict], dict]) -> None:
+        """
+        Register conversion function from source version to target version.
+
+        Parameters
+        ----------
+        source_version: str
+            Version the conversion function expects
+        target_version: str
+            Version the conversion function returns
+        conversion: Callable[[dict], dict]
+            Function converting metadata from source version to target version
+        """
+        self[(source_version, target_version)] = conversion
+
+    def get_chain(self, source_version: str, target_version: str) -> tuple[str, ...]:
+        """
+        Return shortest conversion chain from source version to target version.
+
+        Parameters
+        ----------
+        source_version: str
+            Starting version
+        target_version: str
+            Version goal
+
+        Raises
+        ------
+        ConversionError
+            if no conversion chain is found
+
+        Returns
+        -------
+        tuple[str, ...]
+            Versions of conversion chain from source version to target version (both included)
+        """
+        try:
+            return self.__chains[(source_version, target_version)]
+        except KeyError:
+            raise ConversionError(f"No conversion chain found from {source_version} to {target_version}.") from None
+
+    def __compute_chains(self) -> None:
+        """Compute shortest conversion chains between all versions via breadth-first search from every version."""
+        successors: dict[str, list[str]] = {}
+        for source, target in self.__conversions:
+            successors.setdefault(source, []).append(target)
+
+        chains = {}
+        for start in successors:
+            visited = {start: (start,)}
+            queue = deque([start])
+            while queue:
+                current = queue.popleft()
+                for target in successors.get(current, []):
+                    chain = (*visited[current], target)
+                    if target == start:
+                        chains.setdefault((start, start), chain)
+                    if target in visited:
+                        continue
+                    visited[target] = chain
+                    chains[(start, target)] = chain
+                    queue.append(target)
+        self.__chains = chains
+
+    def __getitem__(self, key: tuple[str, str]) -> Callable[[dict], dict]:
+        """Return conversion function for (source version, target version)."""
+        return self.__conversions[key]
+
+    def __setitem__(self, key: tuple[str, str], conversion: Callable[[dict], dict]) -> None:
+        """Register conversion function for (source version, target version) and update conversion chains."""
+        self.__conversions[key] = conversion
+        self.__compute_chains()
+
+    def __delitem__(self, key: tuple[str, str]) -> None:
+        """Remove conversion function for (source version, target version) and update conversion chains."""
+        del self.__conversions[key]
+        self.__compute_chains()
+
+    def __iter__(self) -> Iterator[tuple[str, str]]:
+        """Iterate over registered (source version, target version) tuples."""
+        return iter(self.__conversions)
+
+    def __len__(self) -> int:
+        """Return number of registered conversions."""
+        return len(self.__conversions)
+
+
 def convert_metadata(metadata: dict, target_version: str) -> dict:
     """
     Convert metadata to target version.
@@ -30,56 +150,103 @@ def convert_metadata(metadata: dict, target_version: str) -> dict:
         Updated metadata
     """
     metadata_version = get_metadata_version(metadata)
-    conversion_chain = __get_conversion_chain(metadata_version, target_version)
-    converted_metadata = deepcopy(metadata)
-    for next_version in conversion_chain[1:]:
-        current_version = get_metadata_version(converted_metadata)
+    conversion_chain = METADATA_CONVERSIONS.get_chain(metadata_version, target_version)
+    converted_metadata = copy_metadata(metadata)
+    for current_version, next_version in zip(conversion_chain, conversion_chain[1:]):  # noqa: RUF007
         converted_metadata = METADATA_CONVERSIONS[(current_version, next_version)](converted_metadata)
     return converted_metadata
 
 
-def __get_conversion_chain(source_version: str, target_version: str) -> list[str]:
+def convert_metadata_batch(  # noqa: C901
+    metadatas: Iterable[dict],
+    target_version: str,
+    *,
+    workers: int | None = None,
+    chunksize: int = 100,
+    ordered: bool = True,
+) -> Iterator[ConversionResult]:
     """
-    Try to find conversion chain from source version to target version.
+    Convert many metadata documents to target version using a process pool.
+
+    Documents are consumed lazily from given iterable and sent to worker processes in chunks.
+    Only a limited number of chunks is in flight at once, thus memory usage does not depend on the number of
+    documents. A failing document does not abort the batch; instead, its error is stored in related result.
+
+    Note: Conversions registered at runtime in `METADATA_CONVERSIONS` are only available in worker processes
+    if processes are forked (default on Linux).
 
     Parameters
     ----------
-    source_version: str
-        Starting version
+    metadatas: Iterable[dict]
+        Metadata dictionaries to convert
     target_version: str
-        Version goal
-
-    Raises
+        Target version to convert
+    workers: int | None
+        Number of worker processes. Defaults to number of CPUs. If set to 1, documents are converted
+        in current process.
+    chunksize: int
+        Number of documents sent to a worker process at once
+    ordered: bool
+        If set to True, results are yielded in input order, otherwise as soon as they are ready
+
+    Yields
     ------
-    ConversionError
-        if no conversion chain is found
-
-    Returns
-    -------
-    list[str]
-        List of conversion chain from source version to target version
+    ConversionResult
+        Conversion result per document, holding index of document in input, converted metadata or error
     """
-
-    def get_chain(current_version: str) -> list[str] | None:
-        for source, target in METADATA_CONVERSIONS:
-            if source != current_version:
-                continue
-            if target == target_version:
-                # Solution found! Return last conversion tuple
-                return [current_version, target_version]
-            child_chain = get_chain(target)
-            if child_chain is None:
-                continue
-            return [current_version, *child_chain]
-        return None
-
-    conversion_chain = get_chain(source_version)
-    if conversion_chain:
-        return conversion_chain
-    raise ConversionError(f"No conversion chain found from {source_version} to {target_version}.")
-
-
-METADATA_CONVERSIONS = {
-    ("OEP-1.5.2", "OEP-1.6.0"): convert_oep_152_to_160,
-    ("OEP-1.6.0", "OEMetadata-2.0"): convert_oep_160_to_20,
-}
+    if chunksize < 1:
+        msg = "Chunksize must be at least 1."
+        raise ValueError(msg)
+    workers = workers or os.cpu_count() or 1
+    indexed_metadatas = enumerate(metadatas)
+    chunks = iter(lambda: list(itertools.islice(indexed_metadatas, chunksize)), [])
+    if workers == 1:
+        for chunk in chunks:
+            yield from __convert_chunk(chunk, target_version)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        max_pending = 2 * workers
+        pending: deque[Future] | set[Future] = deque() if ordered else set()
+
+        def submit_next() -> bool:
+            chunk = next(chunks, None)
+            if chunk is None:
+                return False
+            future = executor.submit(__convert_chunk, chunk, target_version)
+            if ordered:
+                pending.append(future)
+            else:
+                pending.add(future)
+            return True
+
+        while len(pending) < max_pending and submit_next():
+            pass
+        while pending:
+            if ordered:
+                done = [pending.popleft()]
+            else:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                pending.difference_update(done)
+            for future in done:
+                submit_next()
+                yield from future.result()
+
+
+def __convert_chunk(chunk: list[tuple[int, dict]], target_version: str) -> list[ConversionResult]:
+    """Convert chunk of indexed metadata documents and collect errors instead of raising them."""
+    results = []
+    for index, metadata in chunk:
+        try:
+            results.append(ConversionResult(index, metadata=convert_metadata(metadata, target_version)))
+        except Exception as error:  # noqa: BLE001
+            results.append(ConversionResult(index, error=error))
+    return results
+
+
+METADATA_CONVERSIONS = ConversionGraph(
+    {
+        ("OEP-1.5.2", "OEP-1.6.0"): convert_oep_152_to_160,
+        ("OEP-1.6.0", "OEMetadata-2.0"): convert_oep_160_to_20,
+    },
+)
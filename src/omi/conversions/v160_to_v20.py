@@ -1,17 +1,30 @@
 """Conversion functions for metadata version "OEP-1.6.0" to "OEMetadata-2.0"."""
 
+from __future__ import annotations
+
 from copy import deepcopy
+from typing import TYPE_CHECKING
 
 from omi.base import get_metadata_specification
 
 # use utils.find_spatial_resolution_value_and_unit
 from omi.conversions.utils import find_temporal_resolution_value_and_unit
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+JSON_SCALAR_TYPES = (str, int, float, bool, type(None))
+"""Immutable JSON types, which are shared between copies of list entries."""
+
 
 def convert_oep_160_to_20(metadata: dict) -> dict:
     """
     Convert metadata with version "OEP-1.6.0" to "OEMetadata-2.0" using the v2.0 template.
 
+    Given metadata is modified in place and parts of it are reused in the returned metadata.
+    Additional list entries (fields, sources, licenses, ...) are copies of the first (already populated) entry. Its
+    snapshot is taken once per list (see `___v2_entry_factory`), so that entries never share nested containers.
+
     Parameters
     ----------
     metadata: dict
@@ -22,7 +35,7 @@ def convert_oep_160_to_20(metadata: dict) -> dict:
     dict
         Updated metadata dictionary in v2.0 format
     """
-    metadata_v2 = deepcopy(get_metadata_specification("OEMetadata-2.0").template)
+    metadata_v2 = get_metadata_specification("OEMetadata-2.0").template
 
     # Update to v2 context URL
     metadata_v2[
@@ -33,9 +46,12 @@ def convert_oep_160_to_20(metadata: dict) -> dict:
     metadata_v2["@id"] = None
 
     # Populate metadata v2 resources
+    new_resource = None
     for i, resource in enumerate(metadata.get("resources", [])):
-        resource_v2 = ___v2_ensure_resource_entry(metadata_v2, i)
-        ___v2_populate_resource_v2(resource_v2, metadata, resource)
+        if i >= len(metadata_v2["resources"]):
+            new_resource = new_resource or ___v2_entry_factory(metadata_v2["resources"][0])
+            metadata_v2["resources"].append(new_resource())
+        ___v2_populate_resource_v2(metadata_v2["resources"][i], metadata, resource)
 
     # Update metaMetadata section
     metadata_v2["metaMetadata"]["metadataVersion"] = "OEMetadata-2.0.4"
@@ -44,11 +60,42 @@ def convert_oep_160_to_20(metadata: dict) -> dict:
     return metadata_v2
 
 
-def ___v2_ensure_resource_entry(metadata_v2: dict, index: int) -> dict:
-    """Ensure a resource entry exists in metadata_v2 resources for the given index."""
-    if index >= len(metadata_v2["resources"]):
-        metadata_v2["resources"].append(deepcopy(metadata_v2["resources"][0]))
-    return metadata_v2["resources"][index]
+def ___v2_entry_factory(entry: dict | str) -> Callable[[], dict | str]:
+    """
+    Return factory of independent copies of given list entry.
+
+    Entry is snapshotted once into (shallow) templates of its dicts and lists, holding its immutable values.
+    Copies are constructed from these templates, only nested dicts and lists are constructed anew, thus copies never
+    share containers with each other or with given entry. Values other than JSON types are copied via `deepcopy`.
+    """
+    if isinstance(entry, JSON_SCALAR_TYPES):
+        return lambda: entry
+    if isinstance(entry, list):
+        if all(isinstance(item, JSON_SCALAR_TYPES) for item in entry):
+            return list(entry).copy
+        factories = [___v2_entry_factory(item) for item in entry]
+        return lambda: [factory() for factory in factories]
+    if not isinstance(entry, dict):
+        snapshot = deepcopy(entry)
+        return lambda: deepcopy(snapshot)
+
+    template = dict.fromkeys(entry)  # Keeps order of keys, nested values are set on each copy
+    nested = []
+    for key, value in entry.items():
+        if isinstance(value, JSON_SCALAR_TYPES):
+            template[key] = value
+        else:
+            nested.append((key, ___v2_entry_factory(value)))
+    if not nested:
+        return template.copy
+
+    def copy_entry() -> dict:
+        copied = template.copy()
+        for key, factory in nested:
+            copied[key] = factory()
+        return copied
+
+    return copy_entry
 
 
 def ___v2_populate_resource_v2(resource_v2: dict, metadata: dict, resource: dict) -> None:  # noqa: C901
@@ -132,9 +179,11 @@ def ___v2_populate_subjects(resource_v2: list, subjects: list) -> None:
     if not subjects:
         resource_v2["subject"][0]["@id"] = None
 
+    new_subject = None
     for i_subject, subject_entry in enumerate(subjects):
         if i_subject >= len(resource_v2["subject"]):
-            resource_v2["subject"].append(deepcopy(resource_v2["subject"][0]))
+            new_subject = new_subject or ___v2_entry_factory(resource_v2["subject"][0])
+            resource_v2["subject"].append(new_subject())
 
         resource_v2["subject"][i_subject].update(rename_path_to_id(subject_entry))
 
@@ -153,9 +202,11 @@ def ___v2_populate_temporal(resource_v2: list, temporal: dict) -> None:
     if not isinstance(temporal["timeseries"], list):
         temporal["timeseries"] = [temporal["timeseries"]]
 
+    new_timeseries = None
     for i_timeseries, timeseries in enumerate(temporal.get("timeseries", []) or []):
         if i_timeseries >= len(resource_v2["temporal"]["timeseries"]):
-            resource_v2["temporal"]["timeseries"].append(deepcopy(resource_v2["temporal"]["timeseries"][0]))
+            new_timeseries = new_timeseries or ___v2_entry_factory(resource_v2["temporal"]["timeseries"][0])
+            resource_v2["temporal"]["timeseries"].append(new_timeseries())
 
         if isinstance(timeseries, dict):
             resource_v2["temporal"]["timeseries"][i_timeseries].update(
@@ -186,9 +237,11 @@ def ___v2_populate_temporal(resource_v2: list, temporal: dict) -> None:
 
 def ___v2_populate_sources(resource_v2: dict, sources: list) -> None:
     """Populate sources in resource_v2 from sources in v1.6."""
+    new_source = None
     for i_source, source in enumerate(sources):
         if i_source >= len(resource_v2["sources"]):
-            resource_v2["sources"].append(deepcopy(resource_v2["sources"][0]))
+            new_source = new_source or ___v2_entry_factory(resource_v2["sources"][0])
+            resource_v2["sources"].append(new_source())
         source_v2 = resource_v2["sources"][i_source]
         source_v2.update(
             {
@@ -204,18 +257,22 @@ def ___v2_populate_sources(resource_v2: dict, sources: list) -> None:
 
 def ___v2_populate_source_licenses(source_v2: dict, licenses: list) -> None:
     """Populate licenses in source_v2 from licenses in v1.6."""
+    new_license = None
     for i_license, license_entry in enumerate(licenses):
         if i_license >= len(source_v2["sourceLicenses"]):
-            source_v2["sourceLicenses"].append(deepcopy(source_v2["sourceLicenses"][0]))
+            new_license = new_license or ___v2_entry_factory(source_v2["sourceLicenses"][0])
+            source_v2["sourceLicenses"].append(new_license())
         source_v2["sourceLicenses"][i_license].update(license_entry)
         source_v2["sourceLicenses"][i_license]["copyrightStatement"] = None
 
 
 def ___v2_populate_contributors(resource_v2: dict, contributors: list) -> None:
     """Populate contributors in resource_v2 from contributors in v1.6."""
+    new_contributor = None
     for i_contribution, contributor in enumerate(contributors):
         if i_contribution >= len(resource_v2["contributors"]):
-            resource_v2["contributors"].append(deepcopy(resource_v2["contributors"][0]))
+            new_contributor = new_contributor or ___v2_entry_factory(resource_v2["contributors"][0])
+            resource_v2["contributors"].append(new_contributor())
         contributor_v2 = resource_v2["contributors"][i_contribution]
         contributor_v2.update(
             {
@@ -252,9 +309,11 @@ def ___v2_populate_contributors(resource_v2: dict, contributors: list) -> None:
 
 def ___v2_populate_licenses(resource_v2: dict, licenses: list) -> None:
     """Populate licenses in resource_v2 from licenses in v1.6."""
+    new_license = None
     for i_license, license_entry in enumerate(licenses):
         if i_license >= len(resource_v2["licenses"]):
-            resource_v2["licenses"].append(deepcopy(resource_v2["licenses"][0]))
+            new_license = new_license or ___v2_entry_factory(resource_v2["licenses"][0])
+            resource_v2["licenses"].append(new_license())
 
         resource_v2["licenses"][i_license].update(license_entry)
         resource_v2["licenses"][i_license]["copyrightStatement"] = None
@@ -262,9 +321,11 @@ def ___v2_populate_licenses(resource_v2: dict, licenses: list) -> None:
 
 def ___v2_populate_schema_fields(resource_v2: dict, resource: dict) -> None:
     """Populate schema fields in resource_v2 from resource in v1.6."""
+    new_field = None
     for i_field, field in enumerate(resource.get("schema", {}).get("fields", [])):
         if i_field >= len(resource_v2["schema"]["fields"]):
-            resource_v2["schema"]["fields"].append(deepcopy(resource_v2["schema"]["fields"][0]))
+            new_field = new_field or ___v2_entry_factory(resource_v2["schema"]["fields"][0])
+            resource_v2["schema"]["fields"].append(new_field())
         schema_field_v2 = resource_v2["schema"]["fields"][i_field]
         schema_field_v2.update(field)
         if "id" in (schema_field_v2.get("name") or ""):
@@ -305,9 +366,11 @@ def rename_path_to_id(annotation_object: dict) -> dict:
 
 def ___v2_populate_schema_primary_keys(resource_v2: dict, resource: dict) -> None:
     """Populate schema fields in resource_v2 from resource in v1.6."""
+    new_primary_key = None
     for i_pk, pk in enumerate(resource.get("schema", {}).get("primaryKey", []) or []):
         if i_pk >= len(resource_v2["schema"]["primaryKey"]):
-            resource_v2["schema"]["primaryKey"].append(deepcopy(resource_v2["schema"]["primaryKey"][0]))
+            new_primary_key = new_primary_key or ___v2_entry_factory(resource_v2["schema"]["primaryKey"][0])
+            resource_v2["schema"]["primaryKey"].append(new_primary_key())
 
         if isinstance(pk, str):
             resource_v2["schema"]["primaryKey"].pop()
@@ -316,9 +379,11 @@ def ___v2_populate_schema_primary_keys(resource_v2: dict, resource: dict) -> Non
 
 def ___v2_populate_schema_foreign_keys(resource_v2: dict, resource: dict) -> None:
     """Populate schema fields in resource_v2 from resource in v1.6."""
+    new_foreign_key = None
     for i_fk, fk in enumerate(resource.get("schema", {}).get("foreignKeys", [])):
         if i_fk >= len(resource_v2["schema"]["foreignKeys"]):
-            resource_v2["schema"]["foreignKeys"].append(deepcopy(resource_v2["schema"]["foreignKeys"][0]))
+            new_foreign_key = new_foreign_key or ___v2_entry_factory(resource_v2["schema"]["foreignKeys"][0])
+            resource_v2["schema"]["foreignKeys"].append(new_foreign_key())
 
         if isinstance(fk, object):
             resource_v2["schema"]["foreignKeys"][i_fk].update(
@@ -1,30 +1,219 @@
 """Module to inspect data and create metadata from it."""
 
-from collections.abc import Callable
-from typing import Any
+from __future__ import annotations
+
+import bisect
+import codecs
+import csv
+import io
+import itertools
+import json
+import math
+import os
+import pathlib
+import random
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
 
 from frictionless import Detector, Dialect, Resource
 from frictionless.formats import CsvControl
 
 from omi import base
+from omi.reader import iter_blocks, read_header, split_file
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+    import pandas as pd
+
+
+DEFAULT_SAMPLE_SIZE = 1000
+"""Default number of rows used to infer field types."""
+
+STRATA = 10
+"""Number of evenly spaced file sections rows are taken from in stratified sampling."""
+
+SNIFF_SIZE = 64 * 1024
+"""Number of bytes at the start of data the CSV dialect is detected from."""
+
+SNIFF_DELIMITERS = ",;\t|"
+"""Candidate delimiters in order of preference."""
+
+SNIFF_QUOTE_CHARS = "\"'"
+"""Candidate quote chars in order of preference."""
+
+ARROW_FIELD_TYPES = {
+    "is_boolean": "boolean",
+    "is_integer": "integer",
+    "is_floating": "float",
+    "is_decimal": "numeric",
+    "is_string": "string",
+    "is_large_string": "string",
+    "is_date": "date",
+    "is_timestamp": "datetime",
+    "is_time": "time",
+    "is_struct": "object",
+    "is_map": "object",
+}
+"""Field types of Arrow types, mapped by related predicate in `pyarrow.types`; other types are mapped to string."""
+
+FIELD_CONFIDENCE = 0.9
+"""Share of non-null sampled cells which must be valid for a type to be detected (as in frictionless)."""
+
+FIELD_TYPE_PATTERNS = {
+    "datetime": r"\d{4}-\d\d-\d\d[T ]\d\d:\d\d(?::\d\d(?:\.\d+)?)?(?:Z|[+-]\d\d(?::?\d\d)?)?",
+    "time": r"\d\d:\d\d(?::\d\d(?:\.\d+)?)?(?:Z|[+-]\d\d(?::?\d\d)?)?",
+    "date": r"\d{4}-\d\d-\d\d",
+    "integer": r"[+-]?\d+",
+}
+"""Patterns of ISO 8601 temporal values and integers, checked in order (see `__detect_type`)."""
+
+BOOLEAN_VALUES = ("true", "True", "TRUE", "false", "False", "FALSE")
+"""Boolean values (as in frictionless, which considers "1" and "0" as well, but detects them as integers first)."""
+
+INTEGER_RANGE = (-(2**31), 2**31 - 1)
+"""Range of OEP type "integer" (4 bytes); integer columns holding values beyond it are inferred as "bigint"."""
+
+BIGINT_RANGE = (-(2**63), 2**63 - 1)
+"""Range of OEP type "bigint" (8 bytes); integer columns holding values beyond it are inferred as "numeric"."""
+
+SINGLE_BIT_WIDTH = 32
+"""Bit width of OEP types "integer" and "float"; wider Arrow types are inferred as "bigint" or "double precision"."""
+
+DOUBLE_BIT_WIDTH = 64
+"""Bit width of OEP type "bigint"; wider Arrow integer types (unsigned 64 bit integers) are inferred as "numeric"."""
+
+FLOAT_DIGITS = 6
+"""Significant digits single precision floats hold; number columns holding more are inferred as "double precision"."""
+
+ARRAY_ITEM_TYPES = {"string": "string", "integer": "integer", "floating": "float", "mixed-integer-float": "float"}
+"""Subtypes of array fields, mapped by pandas type of all items (see `pandas.api.types.infer_dtype`)."""
+
+TEMPORAL_TYPES = ("date", "datetime")
+"""Field types spanning the temporal extent of a resource."""
+
+PRIMARY_KEY_TYPES = ("integer", "bigint", "string")
+"""Field types of columns which may become primary key if they hold unique values only."""
+
+READERS = ("file", "mmap")
+"""Readers of CSV files used for reservoir sampling (see `infer_metadata`)."""
+
+ENCODING_NAMES = {"utf-8": "UTF-8", "utf-8-sig": "UTF-8", "iso8859-1": "ISO-8859-1", "cp1252": "windows-1252"}
+"""Preferred MIME names of Python codec names, as used in metadata."""
 
 
 class InspectionError(Exception):
     """Raised when an error occurs during inspection."""
 
 
-def infer_metadata(data: Any, metadata_format: str) -> dict:  # noqa: ANN401
+@dataclass
+class CsvDialect:
+    """CSV dialect detected from a byte sample; defaults are used if data cannot be sniffed."""
+
+    delimiter: str = ";"
+    quote_char: str = '"'
+    encoding: str = "utf-8"
+    header: bool = True
+
+
+@dataclass
+class ColumnProfile:
+    """
+    Type and statistics of a column.
+
+    Statistics of CSV data are collected from sampled rows, those of Arrow data from its statistics or values.
+    Minimum and maximum are known for numeric and temporal columns only (the latter as ISO 8601 strings), statistics
+    which are not known are None.
+    """
+
+    name: str
+    type: str
+    rows: int | None = None
+    null_count: int | None = None
+    minimum: Any = None
+    maximum: Any = None
+    cardinality: int | None = None
+
+    @property
+    def nullable(self) -> bool:
+        """Return False only if column is known to hold no null values."""
+        return self.null_count != 0
+
+    @property
+    def unique(self) -> bool:
+        """Return True if column is known to hold distinct values and no null values."""
+        return self.null_count == 0 and self.cardinality is not None and self.cardinality == self.rows
+
+
+@dataclass
+class InspectionResult:
+    """Result of inferring metadata of a single file within a batch, holding either metadata or an error."""
+
+    path: pathlib.Path
+    metadata: dict | None = None
+    error: Exception | None = None
+
+
+def infer_metadata(  # noqa: PLR0913
+    data: Any,  # noqa: ANN401
+    metadata_format: str,
+    *,
+    name: str | None = None,
+    sample_size: int = DEFAULT_SAMPLE_SIZE,
+    sampling: str = "head",
+    reader: str = "file",
+    workers: int = 1,
+) -> dict:
     """
     Guess metadata from data in given metadata format.
 
-    Note: It expects semicolon-delimited data.
+    Field types (and subtypes of array fields) are inferred from a sample of rows, thus only the sample is read. Each
+    column of the sample is profiled once (see `profile_data`): besides its type, null count, minimum, maximum and
+    number of distinct values are collected, which set `nullable` of fields, the temporal extent (from date and
+    datetime columns) and the primary key (column "id" or the first integer or string column holding distinct values
+    only). As statistics describe the sample, fields are only set to be not nullable and a primary key is only chosen
+    if the sampling method read every row of the file (and these are fewer than `sample_size`) or data is Arrow data,
+    whose statistics cover all rows; otherwise, unsampled rows may hold nulls or duplicates.
+    Rows are sampled via:
+
+    - "head" uses the first rows,
+    - "stratified" uses rows from evenly spaced sections of the file, which is read via seeking only and thus takes
+      about as long as "head", regardless of file size,
+    - "reservoir" uses uniformly drawn rows, thus the whole file is read once (holding only the sample in memory).
+
+    Sampling methods other than "head" require data to be given as path to a CSV file; multiline cells are not
+    supported by them. Using reader "mmap", the file is memory-mapped and split into byte ranges of whole rows for
+    reservoir sampling; each of `workers` processes samples one range and the samples are merged into a uniform
+    sample of the whole file. Other sampling methods read a few rows only and thus ignore reader and workers.
+
+    Field types of parquet files (suffix ".parquet") and Arrow tables or schemas are taken from their Arrow schema
+    instead, thus no rows are read at all (only the footer of parquet files, holding statistics of all rows). This
+    requires `pyarrow` to be installed.
+
+    Delimiter, quote char, encoding and header of CSV data are detected from the first bytes of the sample (see
+    `sniff_dialect`) and reused to infer field types. As the sample is read into memory once, each byte of a file is
+    read at most once. Data that cannot be sniffed (i.e. URLs) is expected to be semicolon-delimited.
 
     Parameters
     ----------
     data: Any
-        Data read from CSV file or other source frictionless may understand
+        Data read from CSV file, path to CSV or parquet file, Arrow table or schema or other source frictionless may
+        understand
     metadata_format: str
         Metadata format the inferred metadata should follow
+    name: str | None
+        Name of resource in inferred metadata
+    sample_size: int
+        Number of rows used to infer field types
+    sampling: str
+        Sampling method, one of "head" (default), "stratified" or "reservoir"
+    reader: str
+        Reader of CSV file used for reservoir sampling, one of "file" (default) or "mmap"
+    workers: int
+        Number of processes sampling byte ranges of CSV file in parallel if reader is "mmap"
 
     Returns
     -------
@@ -35,99 +224,839 @@ def infer_metadata(data: Any, metadata_format: str) -> dict:  # noqa: ANN401
     template_metadata = base.get_metadata_specification(latest_metadata_version).template
     if template_metadata is None:
         raise InspectionError(f"No metadata template for metadata format {metadata_format} found.")
-
-    fields, resource = __guess_fields_from_data(data)
-    inferred_metadata = METADATA_TEMPLATE_ENGINE[metadata_format](template_metadata, fields, resource)
+    profiles, resource, covers_all_rows = __profile_data(
+        data,
+        sample_size,
+        sampling=sampling,
+        reader=reader,
+        workers=workers,
+    )
+    inferred_metadata = METADATA_TEMPLATE_ENGINE[metadata_format](
+        template_metadata,
+        profiles,
+        resource,
+        covers_all_rows=covers_all_rows,
+    )
+    if name is not None:
+        inferred_metadata["resources"][0]["name"] = name
     return inferred_metadata
 
 
-def __guess_fields_from_data(data: Any) -> tuple[list[dict[str, str]], Resource]:  # noqa: ANN401
+def profile_data(
+    data: Any,  # noqa: ANN401
+    *,
+    sample_size: int = DEFAULT_SAMPLE_SIZE,
+    sampling: str = "head",
+    reader: str = "file",
+    workers: int = 1,
+) -> list[ColumnProfile]:
     """
-    Field names and types of data columns are detected by Frictionless.
+    Profile columns of data, collecting OEP type, null count, minimum, maximum and cardinality of each column.
+
+    CSV data is sampled and its dialect detected as in `infer_metadata`. Frictionless only parses sampled rows; types
+    are detected by checking all sampled cells of a column at once (in the order and with the confidence frictionless
+    uses) and statistics are collected in the same pass. Integers beyond 4 bytes become "bigint", numbers with more
+    significant digits than single precision holds become "double precision", subtypes of arrays are derived from
+    all items and columns mixing JSON objects and arrays become "json". Profiles of parquet files are read from their
+    footer, profiles of Arrow tables are computed via Arrow compute kernels and Arrow schemas are profiled by type.
+
+    Parameters
+    ----------
+    data: Any
+        Data read from CSV file, path to CSV or parquet file, Arrow table or schema or other source frictionless may
+        understand
+    sample_size: int
+        Number of rows profiled
+    sampling: str
+        Sampling method, one of "head" (default), "stratified" or "reservoir"
+    reader: str
+        Reader of CSV file used for reservoir sampling, one of "file" (default) or "mmap"
+    workers: int
+        Number of processes sampling byte ranges of CSV file in parallel if reader is "mmap"
+
+    Returns
+    -------
+    list[ColumnProfile]
+        Profile of each column in order of columns
+    """
+    return __profile_data(data, sample_size, sampling=sampling, reader=reader, workers=workers)[0]
+
+
+def infer_metadata_batch(  # noqa: PLR0913
+    sources: Iterable[str | os.PathLike],
+    metadata_format: str,
+    *,
+    workers: int | None = None,
+    names: Iterable[str] | None = None,
+    sample_size: int = DEFAULT_SAMPLE_SIZE,
+    sampling: str = "head",
+) -> Iterator[InspectionResult]:
+    """
+    Infer metadata of many CSV or parquet files using a process pool, one metadata document per file.
+
+    Each resource is named after its file (without suffix), unless names are given. A failing file does not abort
+    the batch; instead, its error is stored in related result. Results are yielded in input order.
+
+    Parameters
+    ----------
+    sources: Iterable[str | os.PathLike]
+        Paths to CSV or parquet files
+    metadata_format: str
+        Metadata format the inferred metadata should follow
+    workers: int | None
+        Number of worker processes. Defaults to number of CPUs. If set to 1, files are inspected in current process.
+    names: Iterable[str] | None
+        Resource names per file. Defaults to file names without suffix.
+    sample_size: int
+        Number of rows used to infer field types
+    sampling: str
+        Sampling method, one of "head" (default), "stratified" or "reservoir"
+
+    Raises
+    ------
+    InspectionError
+        if number of names differs from number of sources
+
+    Yields
+    ------
+    InspectionResult
+        Result per file, holding path and inferred metadata or error
+    """
+    paths = [pathlib.Path(source) for source in sources]
+    names = list(names) if names is not None else [path.stem for path in paths]
+    if len(names) != len(paths):
+        msg = f"Got {len(names)} names for {len(paths)} sources."
+        raise InspectionError(msg)
+    tasks = [(path, name, metadata_format, sample_size, sampling) for path, name in zip(paths, names)]
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        yield from itertools.starmap(__infer_file, tasks)
+        return
+    with ProcessPoolExecutor(max_workers=min(workers, len(tasks) or 1)) as executor:
+        yield from executor.map(__infer_file, *zip(*tasks))
+
+
+def infer_metadata_from_directory(  # noqa: PLR0913
+    directory: str | os.PathLike,
+    metadata_format: str,
+    *,
+    pattern: str = "*.csv",
+    workers: int | None = None,
+    sample_size: int = DEFAULT_SAMPLE_SIZE,
+    sampling: str = "head",
+) -> dict:
+    """
+    Infer a single metadata document holding one resource per CSV file found in directory.
+
+    Files are inspected in parallel (see `infer_metadata_batch`) and their resources are merged, in order of their
+    paths, into `resources` of a single metadata document. Resources are named after the path of their file
+    relative to the directory (without suffix, subdirectories separated by "_").
+
+    Parameters
+    ----------
+    directory: str | os.PathLike
+        Directory to search for files
+    metadata_format: str
+        Metadata format the inferred metadata should follow
+    pattern: str
+        Glob pattern of files relative to directory, i.e. "**/*.csv" to search subdirectories as well or "*.parquet"
+    workers: int | None
+        Number of worker processes. Defaults to number of CPUs.
+    sample_size: int
+        Number of rows used to infer field types
+    sampling: str
+        Sampling method, one of "head" (default), "stratified" or "reservoir"
+
+    Raises
+    ------
+    InspectionError
+        if no file matches the pattern or if metadata of any file could not be inferred
+
+    Returns
+    -------
+    dict
+        Metadata holding a resource per file
+    """
+    directory = pathlib.Path(directory)
+    paths = sorted(path for path in directory.glob(pattern) if path.is_file())
+    if not paths:
+        raise InspectionError(f"No files matching '{pattern}' found in '{directory}'.")
+    names = [path.relative_to(directory).with_suffix("").as_posix().replace("/", "_") for path in paths]
+    results = list(
+        infer_metadata_batch(
+            paths,
+            metadata_format,
+            workers=workers,
+            names=names,
+            sample_size=sample_size,
+            sampling=sampling,
+        ),
+    )
+    errors = [f"{result.path}: {result.error}" for result in results if result.error is not None]
+    if errors:
+        raise InspectionError("Could not infer metadata from files:\n" + "\n".join(errors))
+    metadata = results[0].metadata
+    metadata["resources"] = [result.metadata["resources"][0] for result in results]
+    return metadata
+
+
+def __profile_data(
+    data: Any,  # noqa: ANN401
+    sample_size: int,
+    *,
+    sampling: str,
+    reader: str,
+    workers: int,
+) -> tuple[list[ColumnProfile], Resource | None, bool]:
+    """
+    Return profiles of columns, resource of sampled rows and whether profiles cover all rows.
+
+    The frictionless resource is None for Arrow data, whose profiles always cover all rows.
+    """
+    if sampling not in SAMPLING_METHODS:
+        raise InspectionError(
+            f"Unknown sampling method '{sampling}'. Use one of: {', '.join(SAMPLING_METHODS)}.",
+        )
+    if reader not in READERS:
+        raise InspectionError(f"Unknown reader '{reader}'. Use one of: {', '.join(READERS)}.")
+    if sample_size < 1:
+        msg = "Sample size must be at least 1."
+        raise InspectionError(msg)
+
+    profiles = __profile_arrow_data(data)
+    if profiles is not None:
+        return profiles, None, True
+
+    if sampling == "reservoir" and reader == "mmap":
+        sample, complete = __sample_reservoir_in_ranges(data, sample_size, workers=workers)
+    else:
+        sample, complete = SAMPLING_METHODS[sampling](data, sample_size)
+    dialect = sniff_dialect(sample[:SNIFF_SIZE]) if isinstance(sample, bytes) else CsvDialect()
+    resource = __read_sampled_rows(sample, sample_size, dialect)
+    # Frictionless parses up to `sample_size` rows of the sample, thus a complete sample may still be cut off
+    covers_all_rows = complete and len(resource.fragment) < sample_size
+    return __profile_columns(resource), resource, covers_all_rows
+
+
+def __profile_arrow_data(data: Any) -> list[ColumnProfile] | None:  # noqa: ANN401
+    """
+    Return profiles of parquet file, Arrow table or schema, otherwise None.
+
+    Parquet files are profiled from statistics in their footer only (thus cardinality is unknown), Arrow tables via
+    compute kernels and Arrow schemas by type only.
+    """
+    if isinstance(data, (str, os.PathLike)) and pathlib.Path(data).suffix == ".parquet":
+        try:
+            from pyarrow import parquet
+        except ImportError as ie:
+            msg = "Inspecting parquet files requires 'pyarrow' to be installed."
+            raise InspectionError(msg) from ie
+        return __profile_parquet_columns(parquet.read_metadata(data))
+    # Arrow objects can only be given if pyarrow has been imported already
+    pyarrow = sys.modules.get("pyarrow")
+    if pyarrow is None:
+        return None
+    if isinstance(data, pyarrow.Schema):
+        # Null values are known to be missing only in fields declared as not nullable
+        return [
+            ColumnProfile(
+                field.name,
+                __get_oep_type_of_arrow_type(field.type),
+                null_count=None if field.nullable else 0,
+            )
+            for field in data
+        ]
+    if isinstance(data, (pyarrow.Table, pyarrow.RecordBatch)):
+        return [__profile_arrow_column(field, data.column(index)) for index, field in enumerate(data.schema)]
+    return None
+
+
+def __profile_parquet_columns(metadata: Any) -> list[ColumnProfile]:  # noqa: ANN401
+    """Return profiles of columns from statistics of all row groups; nested columns are profiled by type only."""
+    schema = metadata.schema.to_arrow_schema()
+    statistics: dict[str, list] = {}
+    for row_group in range(metadata.num_row_groups):
+        for index in range(metadata.num_columns):
+            column = metadata.row_group(row_group).column(index)
+            statistics.setdefault(column.path_in_schema, []).append(column.statistics)
+
+    profiles = []
+    for field in schema:
+        column_statistics = statistics.get(field.name, [None])
+        profile = ColumnProfile(field.name, __get_field_type_of_arrow_type(field.type), rows=metadata.num_rows)
+        if all(item is not None and item.has_null_count for item in column_statistics):
+            profile.null_count = sum(item.null_count for item in column_statistics)
+        if __is_ordered_type(profile.type) and all(item is not None and item.has_min_max for item in column_statistics):
+            profile.minimum = __to_profile_value(min(item.min for item in column_statistics), profile.type)
+            profile.maximum = __to_profile_value(max(item.max for item in column_statistics), profile.type)
+        profile.type = __get_oep_type_of_arrow_type(field.type, profile.minimum, profile.maximum)
+        profiles.append(profile)
+    return profiles
+
+
+def __profile_arrow_column(field: Any, column: Any) -> ColumnProfile:  # noqa: ANN401
+    """Return profile of column of Arrow table, computing statistics via Arrow compute kernels."""
+    import pyarrow.compute as pc
+    from pyarrow import types
+
+    if types.is_dictionary(column.type):
+        column = pc.cast(column, column.type.value_type)
+    profile = ColumnProfile(field.name, __get_field_type_of_arrow_type(field.type), rows=len(column))
+    profile.null_count = column.null_count
+    if __is_ordered_type(profile.type):
+        minimum, maximum = pc.min_max(column).as_py().values()
+        profile.minimum = __to_profile_value(minimum, profile.type)
+        profile.maximum = __to_profile_value(maximum, profile.type)
+    if not types.is_nested(column.type):
+        profile.cardinality = pc.count_distinct(column).as_py()
+    profile.type = __get_oep_type_of_arrow_type(field.type, profile.minimum, profile.maximum)
+    return profile
+
+
+def __get_oep_type_of_arrow_type(arrow_type: Any, minimum: Any = None, maximum: Any = None) -> str:  # noqa: ANN401
+    """
+    Return OEP field type of Arrow type, distinguishing integer from bigint and float from double precision.
+
+    Integer columns are typed by their range if known, by their bit width otherwise. Decimals and integers exceeding
+    "bigint" are typed as "numeric", as floats cannot hold them exactly.
+    """
+    from pyarrow import types
+
+    field_type = __get_field_type_of_arrow_type(arrow_type)
+    if types.is_dictionary(arrow_type):
+        arrow_type = arrow_type.value_type
+    if field_type == "integer":
+        if minimum is not None and maximum is not None:
+            return __get_integer_type(minimum, maximum)
+        # Unsigned integers need one more bit as signed integers
+        bit_width = arrow_type.bit_width + types.is_unsigned_integer(arrow_type)
+        if bit_width > DOUBLE_BIT_WIDTH:
+            return "numeric"
+        return "bigint" if bit_width > SINGLE_BIT_WIDTH else "integer"
+    if types.is_floating(arrow_type) and arrow_type.bit_width > SINGLE_BIT_WIDTH:
+        return "double precision"
+    return field_type
+
+
+def __get_field_type_of_arrow_type(arrow_type: Any) -> str:  # noqa: ANN401
+    """Return OEP field type of Arrow type; subtypes of arrays are detected for string, integer and float only."""
+    from pyarrow import types
+
+    if types.is_dictionary(arrow_type):
+        arrow_type = arrow_type.value_type
+    if types.is_list(arrow_type) or types.is_large_list(arrow_type) or types.is_fixed_size_list(arrow_type):
+        item_type = __get_field_type_of_arrow_type(arrow_type.value_type)
+        return f"array {item_type}" if item_type in ("string", "integer", "float") else "array"
+    for predicate, field_type in ARROW_FIELD_TYPES.items():
+        if getattr(types, predicate)(arrow_type):
+            return field_type
+    return "string"
+
+
+def sniff_dialect(sample: bytes) -> CsvDialect:
+    """
+    Detect CSV dialect from first bytes of data.
+
+    Encoding is UTF-8 if sample decodes as such, otherwise it is detected by frictionless. Delimiter and quote char
+    are chosen such that most rows have the same number of (more than one) fields; unlike `csv.Sniffer`, this is not
+    misled by delimiters within unquoted JSON cells. A header is assumed, unless the first row holds numbers in
+    columns holding numbers.
+
+    Parameters
+    ----------
+    sample: bytes
+        First bytes of data, i.e. `SNIFF_SIZE` bytes
+
+    Returns
+    -------
+    CsvDialect
+        Detected dialect
+    """
+    encoding = __detect_encoding(sample)
+    text = sample.decode(encoding, errors="ignore")
+    lines = text.splitlines()
+    if len(sample) >= SNIFF_SIZE and len(lines) > 1:
+        lines = lines[:-1]  # Last row might be cut off
+    lines = [line for line in lines if line.strip()]
+    best_score = (0.0, 1)
+    dialect = CsvDialect(encoding=encoding)
+    for quote_char in SNIFF_QUOTE_CHARS:
+        for delimiter in SNIFF_DELIMITERS:
+            field_counts = Counter(len(row) for row in csv.reader(lines, delimiter=delimiter, quotechar=quote_char))
+            if not field_counts:
+                continue
+            field_count, rows = field_counts.most_common(1)[0]
+            score = (rows / len(lines), field_count)
+            if field_count > 1 and score > best_score:
+                best_score = score
+                dialect = CsvDialect(delimiter, quote_char, encoding)
+    dialect.header = __has_header(lines, dialect)
+    return dialect
+
+
+def __detect_encoding(sample: bytes) -> str:
+    if sample.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    try:
+        # Incremental decoder accepts a multibyte character cut off at the end of sample
+        codecs.getincrementaldecoder("utf-8")().decode(sample, final=False)
+    except UnicodeDecodeError:
+        return Detector().detect_encoding(sample)
+    return "utf-8"
+
+
+def __has_header(lines: list[str], dialect: CsvDialect) -> bool:
+    """Return False if first row holds a number in any column in which all other rows hold numbers."""
+    rows = list(csv.reader(lines, delimiter=dialect.delimiter, quotechar=dialect.quote_char))
+    if len(rows) < 2:  # noqa: PLR2004
+        return True
+    for column, value in enumerate(rows[0]):
+        values = [row[column] for row in rows[1:] if len(row) > column and row[column]]
+        if values and __is_number(value) and all(__is_number(cell) for cell in values):
+            return False
+    return True
+
+
+def __is_number(value: str) -> bool:
+    try:
+        float(value)
+    except ValueError:
+        return False
+    return True
+
+
+def __read_sampled_rows(data: Any, sample_size: int, dialect: CsvDialect) -> Resource:  # noqa: ANN401
+    """
+    Parse sampled rows via frictionless, without detecting field types (see `__profile_columns`).
 
     Parameters
     ----------
     data: Any
         Data read from CSV file or other source frictionless may understand
+    sample_size: int
+        Number of rows to parse
+    dialect: CsvDialect
+        Dialect used to parse data
 
     Returns
     -------
-    list[dict[str, str]]
-        List of fields holding name and type as strings
     Resource
-        Extracted resource
+        Extracted resource holding labels and sampled rows (in `resource.fragment`)
     """
-    csv_control = CsvControl(delimiter=";")
-    dialect = Dialect(controls=[csv_control])
-    detector = Detector(field_float_numbers=True)
+    csv_control = CsvControl(delimiter=dialect.delimiter, quote_char=dialect.quote_char)
+    # Field type "any" skips type detection of frictionless, which checks each cell against each candidate type;
+    # the sample size of frictionless includes the header row
+    detector = Detector(field_type="any", sample_size=sample_size + dialect.header)
     resource = Resource(
         source=data,
         name="test",
         profile="tabular-data-resource",
         format="csv",
-        dialect=dialect,
+        encoding=dialect.encoding,
+        dialect=Dialect(header=dialect.header, controls=[csv_control]),
         detector=detector,
     )
-    # Must be run, before schema can be inspected
+    # Must be run, before labels can be inspected; sampled rows are kept in `resource.fragment`
     resource.infer()
-    fields = resource.schema.to_dict()["fields"]
-    return fields, resource
+    return resource
 
 
-def __apply_fields_to_oep_metadata_template(metadata: dict, fields: list[dict[str, str]], resource: Resource) -> dict:
+def __profile_columns(resource: Resource) -> list[ColumnProfile]:
     """
-    Apply fields to metadata template for OEP metadata.
+    Profile sampled cells of all columns, detecting their types and collecting their statistics.
+
+    Sampled cells are kept by frictionless in `resource.fragment`, thus data is not read again. Null cells, null
+    counts and cardinalities of all columns are found at once. Types are detected per column via vectorized checks
+    (see `__detect_type`) and refined along with minimum and maximum by `COLUMN_PROFILERS`.
+
+    Parameters
+    ----------
+    resource: Resource
+        Extracted frictionless resource holding sampled rows
+
+    Returns
+    -------
+    list[ColumnProfile]
+        Profile of each column
+    """
+    import pandas as pd
+
+    labels = resource.schema.field_names
+    cells = pd.DataFrame([row[: len(labels)] for row in resource.fragment], columns=labels, dtype=object)
+    null_cells = cells.isna() | cells.isin(resource.schema.missing_values)
+    null_counts = null_cells.sum()
+    cardinalities = cells.mask(null_cells).nunique()
+
+    profiles = []
+    for label in labels:
+        values = cells[label][~null_cells[label]].astype(str)
+        field_type = __detect_type(values)
+        profiler = COLUMN_PROFILERS.get(field_type)
+        field_type, minimum, maximum = profiler(values) if profiler else (field_type, None, None)
+        profiles.append(
+            ColumnProfile(
+                label,
+                field_type,
+                rows=len(cells),
+                null_count=int(null_counts[label]),
+                minimum=minimum,
+                maximum=maximum,
+                cardinality=int(cardinalities[label]),
+            ),
+        )
+    return profiles
+
+
+def __detect_type(values: pd.Series) -> str:
+    """
+    Return type of column, checking candidate types in the order frictionless does.
+
+    A type is detected if at least `FIELD_CONFIDENCE` of non-null values are valid for it, as in frictionless. Each
+    candidate is checked for all values at once. Columns holding JSON objects and arrays (but neither of them only)
+    are detected as "json"; frictionless types without OEP counterpart (i.e. "geopoint") are not checked.
+    """
+    import pandas as pd
+
+    if values.empty:
+        return "any"
+    if values.str.match(r"\s*[\[{]").mean() >= FIELD_CONFIDENCE:
+        kinds = values.map(lambda cell: type(__load_json(cell)).__name__)
+        for field_type, json_kinds in (("object", ["dict"]), ("array", ["list"]), ("json", ["dict", "list"])):
+            if kinds.isin(json_kinds).mean() >= FIELD_CONFIDENCE:
+                return field_type
+    for field_type, pattern in FIELD_TYPE_PATTERNS.items():
+        if values.str.fullmatch(pattern).mean() >= FIELD_CONFIDENCE:
+            return field_type
+    if pd.to_numeric(values, errors="coerce").notna().mean() >= FIELD_CONFIDENCE:
+        return "number"
+    if values.isin(BOOLEAN_VALUES).mean() >= FIELD_CONFIDENCE:
+        return "boolean"
+    return "string"
+
+
+def __profile_integers(values: pd.Series) -> tuple[str, int | None, int | None]:
+    import pandas as pd
+
+    numbers = pd.to_numeric(values, errors="coerce").dropna()
+    if numbers.empty:
+        return "integer", None, None
+    minimum, maximum = int(numbers.min()), int(numbers.max())
+    return __get_integer_type(minimum, maximum), minimum, maximum
+
+
+def __profile_numbers(values: pd.Series) -> tuple[str, float | None, float | None]:
+    import pandas as pd
+
+    numbers = pd.to_numeric(values, errors="coerce").dropna()
+    if numbers.empty:
+        return "float", None, None
+    # Significant digits are counted in text, as binary floats do not tell the precision data was written with
+    digits = values.str.replace(r"[eE].*|\D", "", regex=True).str.strip("0").str.len()
+    field_type = "double precision" if digits.max() > FLOAT_DIGITS else "float"
+    return field_type, float(numbers.min()), float(numbers.max())
+
+
+def __profile_dates(values: pd.Series) -> tuple[str, str | None, str | None]:
+    return ("date", *__get_temporal_range(values, "date"))
+
+
+def __profile_datetimes(values: pd.Series) -> tuple[str, str | None, str | None]:
+    return ("datetime", *__get_temporal_range(values, "datetime"))
+
+
+def __get_temporal_range(values: pd.Series, field_type: str) -> tuple[str | None, str | None]:
+    import pandas as pd
+
+    # Timestamps with (different) UTC offsets can only be compared in UTC, naive ones are taken as UTC then. These are
+    # parsed one by one, as parsing them at once ("ISO8601") applies the offset of one timestamp to following ones.
+    has_offset = field_type == "datetime" and values.str.contains(r"(?:Z|[+-]\d\d:?\d\d)$").any()
+    timestamp_format = "mixed" if has_offset else "ISO8601"
+    timestamps = pd.to_datetime(values, format=timestamp_format, errors="coerce", utc=has_offset).dropna()
+    if timestamps.empty:
+        return None, None
+    return __to_profile_value(timestamps.min(), field_type), __to_profile_value(timestamps.max(), field_type)
+
+
+def __profile_arrays(values: pd.Series) -> tuple[str, None, None]:
+    import pandas as pd
+
+    items = values.map(__load_json).explode().dropna()
+    item_type = ARRAY_ITEM_TYPES.get(pd.api.types.infer_dtype(items, skipna=True))
+    # Subtype cannot be detected if all arrays are empty or items are of other or mixed types
+    return (f"array {item_type}" if item_type else "array"), None, None
+
+
+def __load_json(cell: str) -> Any:  # noqa: ANN401
+    try:
+        return json.loads(cell)
+    except (TypeError, ValueError):
+        return None
+
+
+def __get_integer_type(minimum: int, maximum: int) -> str:
+    if INTEGER_RANGE[0] <= minimum and maximum <= INTEGER_RANGE[1]:
+        return "integer"
+    return "bigint" if BIGINT_RANGE[0] <= minimum and maximum <= BIGINT_RANGE[1] else "numeric"
+
+
+def __is_ordered_type(field_type: str) -> bool:
+    return field_type in ("integer", "float", "numeric", *TEMPORAL_TYPES)
+
+
+def __to_profile_value(value: Any, field_type: str) -> Any:  # noqa: ANN401
+    """Return minimum or maximum as stored in profile, i.e. temporal values as ISO 8601 strings."""
+    if value is None or field_type not in TEMPORAL_TYPES:
+        return value
+    if field_type == "date" and hasattr(value, "date"):
+        value = value.date()
+    return value.isoformat()
+
+
+def __apply_fields_to_oep_metadata_template(
+    metadata: dict,
+    profiles: list[ColumnProfile],
+    resource: Resource | None,
+    *,
+    covers_all_rows: bool,
+) -> dict:
+    """
+    Apply profiled columns to metadata template for OEP metadata.
+
+    Besides fields (holding name, type and nullable), primary key and temporal extent of the timeseries are set. The
+    primary key is column "id" or the first integer or string column holding distinct values only. The temporal
+    extent spans minima and maxima of all date and datetime columns. Unless profiles cover all rows, a column without
+    nulls or duplicates may still hold them in other rows, thus `nullable` is only set for columns holding nulls and
+    the primary key is not set.
 
     Parameters
     ----------
     metadata: dict
         Metadata template
-    fields: list[dict[str, str]]
-        List of fields holding name and type as strings
-    resource: Resource
-        Extracted frictionless resource holding data
+    profiles: list[ColumnProfile]
+        Profiles of columns
+    resource: Resource | None
+        Extracted frictionless resource holding sampled rows (None for Arrow data)
+    covers_all_rows: bool
+        If set to True, profiles describe all rows of data, not just a sample
 
     Returns
     -------
     dict
         OEP metadata template holding guessed fields
     """
-    type_mapping = {str(str): "string", str(int): "integer", str(float): "float"}
-
-    def convert_field(field: dict[str, str]) -> dict[str, str]:
-        """
-        Convert frictionless field types to OEP types.
-
-        This only includes conversion of number to float and detection of subtypes in arrays
-        (currently, only string, integer and float are detected as subtypes).
-
-        Parameters
-        ----------
-        field: dict[str, str]
-            Frictionless field description
-
-        Returns
-        -------
-        dict[str, str]
-            Field description with OEP supported types
-        """
-        if field["type"] == "number":
-            return {"name": field["name"], "type": "float"}
-        if field["type"] == "array":
-            for row in rows:
-                if len(row[field["name"]]) == 0:
-                    continue
-                item_type = str(type(row[field["name"]][0]))
-                return {"name": field["name"], "type": f"array {type_mapping[item_type]}"}
-            # All arrays are empty - so no further subtype can be detected
-            return {"name": field["name"], "type": "array"}
-        return field
-
-    rows = resource.read_rows()
-    fields = [convert_field(field) for field in fields]
-
-    metadata["resources"][0]["schema"]["fields"] = fields
+    resource_metadata = metadata["resources"][0]
+    resource_metadata["schema"]["fields"] = [
+        {"name": profile.name, "type": profile.type, "nullable": profile.nullable}
+        if covers_all_rows or profile.nullable
+        else {"name": profile.name, "type": profile.type}
+        for profile in profiles
+    ]
+    primary_keys = [profile.name for profile in profiles if profile.type in PRIMARY_KEY_TYPES and profile.unique]
+    if primary_keys and covers_all_rows:
+        resource_metadata["schema"]["primaryKey"] = ["id" if "id" in primary_keys else primary_keys[0]]
+    temporal_profiles = [
+        profile for profile in profiles if profile.type in TEMPORAL_TYPES and profile.minimum is not None
+    ]
+    if temporal_profiles:
+        timeseries = resource_metadata["temporal"]["timeseries"][0]
+        timeseries["start"] = min(profile.minimum for profile in temporal_profiles)
+        timeseries["end"] = max(profile.maximum for profile in temporal_profiles)
+
+    if resource is not None:
+        resource_metadata["dialect"]["delimiter"] = resource.dialect.get_control("csv").delimiter
+        resource_metadata["encoding"] = ENCODING_NAMES.get(resource.encoding, resource.encoding)
     return metadata
 
 
+def __infer_file(
+    path: pathlib.Path,
+    name: str,
+    metadata_format: str,
+    sample_size: int,
+    sampling: str,
+) -> InspectionResult:
+    """Infer metadata of single file and return errors instead of raising them, as these may not be picklable."""
+    try:
+        metadata = infer_metadata(str(path), metadata_format, name=name, sample_size=sample_size, sampling=sampling)
+    except Exception as error:  # noqa: BLE001
+        return InspectionResult(path, error=InspectionError(f"Could not infer metadata from '{path}': {error}"))
+    return InspectionResult(path, metadata=metadata)
+
+
+def __sample_head(data: Any, sample_size: int) -> tuple[Any, bool]:  # noqa: ANN401
+    """
+    Return header and first rows of CSV file or binary file object and whether the end of the file was reached.
+
+    File is read block-wise until the block holding the last sampled row, thus rows are read once. Other data is
+    returned as is (thus holding all rows), as frictionless only reads the first rows for inference.
+    """
+    if isinstance(data, (str, os.PathLike)) and os.path.isfile(data):  # noqa: PTH113
+        with open(data, "rb") as f:  # noqa: PTH123
+            return __read_head(f, sample_size)
+    if isinstance(getattr(data, "buffer", None), io.BufferedIOBase):
+        # Text file is read in binary mode, as its encoding is sniffed
+        return __read_head(data.buffer, sample_size)
+    if isinstance(data, (io.BufferedIOBase, io.RawIOBase)):
+        return __read_head(data, sample_size)
+    return data, True
+
+
+def __read_head(f: io.IOBase, sample_size: int) -> tuple[bytes, bool]:
+    blocks = []
+    lines = 0
+    while lines <= sample_size and (block := f.read(SNIFF_SIZE)):
+        blocks.append(block)
+        lines += block.count(b"\n")
+    head = b"".join(blocks)
+    if lines > sample_size:
+        head = head[: head.rindex(b"\n") + 1]  # Drop row cut off by last block
+        return head, False
+    return head, True
+
+
+def __sample_stratified(data: str | os.PathLike, sample_size: int) -> tuple[bytes, bool]:
+    """
+    Return header and rows from evenly spaced sections of CSV file and whether every row of the file was read.
+
+    Sections are reached by seeking, thus only header and sampled rows are read. Rows are only all read, if no
+    section starts behind the rows read from the previous one and the last section reaches the end of the file.
+    """
+    rows_per_stratum = -(-sample_size // STRATA)
+    with __open_csv_file(data) as f:
+        header = f.readline()
+        start = f.tell()
+        size = f.seek(0, os.SEEK_END)
+        rows = []
+        position = start
+        skipped = False
+        for stratum in range(STRATA):
+            offset = start + (size - start) * stratum // STRATA
+            if offset > position:
+                f.seek(offset - 1)
+                f.readline()  # Skip rest of row the section starts in
+                skipped = True
+            else:
+                f.seek(position)
+            rows.extend(itertools.islice(iter(f.readline, b""), rows_per_stratum))
+            position = f.tell()
+    return __join_rows(header, rows), not skipped and position == size
+
+
+def __sample_reservoir(data: str | os.PathLike, sample_size: int) -> tuple[bytes, bool]:
+    """
+    Return header and uniformly drawn rows of CSV file (reservoir sampling) and whether the sample holds every row.
+
+    The whole file is read once, but only sampled rows are held in memory. Rows between replacements are skipped
+    without inspecting them (algorithm L by Li, 1994). Sampling is reproducible.
+    """
+    generator = random.Random(0)  # noqa: S311
+    with __open_csv_file(data) as f:
+        header = f.readline()
+        rows = list(itertools.islice(f, sample_size))
+        weight = math.exp(math.log(1 - generator.random()) / sample_size)
+        replaced = False
+        while len(rows) == sample_size and weight < 1:
+            skip = math.floor(math.log(1 - generator.random()) / math.log(1 - weight))
+            line = next(itertools.islice(f, skip, skip + 1), None)
+            if line is None:
+                break
+            rows[generator.randrange(sample_size)] = line
+            replaced = True
+            weight *= math.exp(math.log(1 - generator.random()) / sample_size)
+        complete = not replaced and not f.read(1)
+    return __join_rows(header, rows), complete
+
+
+def __sample_reservoir_in_ranges(data: str | os.PathLike, sample_size: int, *, workers: int) -> tuple[bytes, bool]:
+    """
+    Return header and uniformly drawn rows of memory-mapped CSV file and whether the sample holds every row.
+
+    Byte ranges of the file are sampled in parallel, each worker draws a reservoir sample of its range. As these are
+    uniform samples of their ranges, drawing rows from them in proportion to a uniform draw of row positions of the
+    whole file results in a uniform sample of the whole file. Sampling is reproducible for a given number of workers.
+    """
+    if not isinstance(data, (str, os.PathLike)):
+        msg = "Reader 'mmap' requires data to be given as path to a CSV file."
+        raise InspectionError(msg)
+    header = read_header(data)
+    size = pathlib.Path(data).stat().st_size
+    ranges = split_file(data, chunk_bytes=max(-(-(size - len(header)) // workers), 1))
+    arguments = ([data] * len(ranges), *zip(*ranges), [sample_size] * len(ranges), range(len(ranges)))
+    if workers == 1:
+        samples = list(map(__sample_range_reservoir, *arguments))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            samples = list(executor.map(__sample_range_reservoir, *arguments))
+
+    row_offsets = list(itertools.accumulate(rows for rows, _ in samples))
+    total_rows = row_offsets[-1] if row_offsets else 0
+    generator = random.Random(0)  # noqa: S311
+    draws = Counter(
+        bisect.bisect_right(row_offsets, position)
+        for position in generator.sample(range(total_rows), min(sample_size, total_rows))
+    )
+    rows = [row for index, (_, sample) in enumerate(samples) for row in generator.sample(sample, draws[index])]
+    return __join_rows(header, rows), total_rows <= sample_size
+
+
+def __sample_range_reservoir(
+    path: str | os.PathLike,
+    start: int,
+    end: int,
+    sample_size: int,
+    seed: int,
+) -> tuple[int, list[bytes]]:
+    """Return number of rows and reservoir sample of byte range of CSV file (algorithm L, as `__sample_reservoir`)."""
+    generator = random.Random(seed)  # noqa: S311
+    rows: list[bytes] = []
+    count = 0
+    weight = skip = None
+    for block in iter_blocks(path, start, end):
+        lines = block.splitlines(keepends=True)
+        position = min(sample_size - len(rows), len(lines))
+        rows.extend(lines[:position])
+        if weight is None and len(rows) == sample_size:
+            weight = math.exp(math.log(1 - generator.random()) / sample_size)
+        while weight is not None and weight < 1:
+            if skip is None:
+                skip = math.floor(math.log(1 - generator.random()) / math.log(1 - weight))
+            position += skip
+            if position >= len(lines):
+                skip = position - len(lines)
+                break
+            rows[generator.randrange(sample_size)] = lines[position]
+            position += 1
+            weight *= math.exp(math.log(1 - generator.random()) / sample_size)
+            skip = None
+        count += len(lines)
+    return count, rows
+
+
+def __open_csv_file(data: Any):  # noqa: ANN202, ANN401
+    if not isinstance(data, (str, os.PathLike)):
+        msg = "Sampling methods other than 'head' require data to be given as path to a CSV file."
+        raise InspectionError(msg)
+    return open(data, "rb")  # noqa: PTH123
+
+
+def __join_rows(header: bytes, rows: list[bytes]) -> bytes:
+    return b"".join(row if row.endswith(b"\n") else row + b"\n" for row in [header, *rows])
+
+
 METADATA_TEMPLATE_ENGINE: dict[str, Callable] = {"OEP": __apply_fields_to_oep_metadata_template}
+
+COLUMN_PROFILERS: dict[str, Callable[[pd.Series], tuple[str, Any, Any]]] = {
+    "integer": __profile_integers,
+    "number": __profile_numbers,
+    "date": __profile_dates,
+    "datetime": __profile_datetimes,
+    "array": __profile_arrays,
+}
+"""Profilers of sampled cells, mapped by detected type; returning OEP type, minimum and maximum of column."""
+
+SAMPLING_METHODS: dict[str, Callable[[Any, int], tuple[Any, bool]]] = {
+    "head": __sample_head,
+    "stratified": __sample_stratified,
+    "reservoir": __sample_reservoir,
+}
+"""Sampling methods, returning data source frictionless infers field types from and whether it holds every row."""
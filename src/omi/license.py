@@ -1,12 +1,23 @@
 """Module to check licenses."""
 
+from __future__ import annotations
+
 import json
 import re
+import warnings
+from collections import Counter
+from functools import cache, lru_cache
 from pathlib import Path
 
 from omi.base import get_metadata_version
 
 LICENCES_FILE = Path(__file__).parent / "data" / "licenses.json"
+LICENSE_INDEX_FILE = Path(__file__).parent / "data" / "license_index.json"
+
+# SPDX properties kept per license in license index
+LICENSE_RECORD_KEYS = ("licenseId", "name", "reference", "isOsiApproved", "isDeprecatedLicenseId")
+# Weight of version numbers compared to single trigram when suggesting licenses
+VERSION_WEIGHT = 3
 
 
 class LicenseError(Exception):
@@ -30,13 +41,10 @@ def normalize_license_name(name: str) -> str:
     str
         Normalized license name
     """
-    # Remove '<' and '>' symbols.
-    name = re.sub(r"[<>]", "", name)
-    # Remove the specific pattern "(ODbL)".
-    name = re.sub(r"\(ODbL\)", "", name)
-    # Normalize extra spaces and then replace all whitespace with hyphens.
-    name = re.sub(r"\s+", " ", name).strip()
-    return re.sub(r"\s", "-", name).upper()
+    # Remove '<' and '>' symbols and the specific pattern "(ODbL)".
+    name = name.replace("<", "").replace(">", "").replace("(ODbL)", "")
+    # Normalize extra spaces and replace all whitespace with hyphens.
+    return "-".join(name.split()).upper()
 
 
 def read_licenses() -> set[str, str]:
@@ -57,6 +65,227 @@ def read_licenses() -> set[str, str]:
     }
 
 
+def build_license_index(licenses_file: Path = LICENCES_FILE) -> dict:
+    """
+    Build license index from SPDX licenses.
+
+    The index maps normalized license IDs, normalized license names and aliases to SPDX license IDs.
+    Aliases are license names without "v" in front of version numbers (i.e. "Open Data Commons Open Database
+    License 1.0" for "Open Data Commons Open Database License v1.0"). License IDs take precedence over names and
+    names take precedence over aliases.
+
+    Parameters
+    ----------
+    licenses_file: Path
+        SPDX licenses file
+
+    Returns
+    -------
+    dict
+        License index holding SPDX license list version, SPDX records per license ID and lookup keys
+    """
+    with licenses_file.open("r", encoding="utf-8") as file:
+        licenses = json.load(file)
+    records = {
+        license_info["licenseId"]: {key: license_info[key] for key in LICENSE_RECORD_KEYS if key in license_info}
+        for license_info in licenses["licenses"]
+    }
+    keys = {}
+    for alias in (False, True):
+        for license_id, record in records.items():
+            name = re.sub(r"\bv(?=\d)", "", record["name"]) if alias else record["name"]
+            keys.setdefault(normalize_license_name(name), license_id)
+    for license_id in records:
+        keys[normalize_license_name(license_id)] = license_id
+    # Licenses added for OEP may lack an ID, which must not match empty names
+    keys.pop("", None)
+    return {"licenseListVersion": licenses["licenseListVersion"], "licenses": records, "keys": keys}
+
+
+def write_license_index(index_file: Path = LICENSE_INDEX_FILE) -> None:
+    """
+    Build license index from SPDX licenses and write it to index file shipped with OMI.
+
+    Must be called whenever SPDX licenses file is updated.
+
+    Parameters
+    ----------
+    index_file: Path
+        File to write license index to
+    """
+    with index_file.open("w", encoding="utf-8") as file:
+        json.dump(build_license_index(), file, separators=(",", ":"), sort_keys=True)
+
+
+@cache
+def get_license_index() -> dict:
+    """
+    Return precompiled license index, which is loaded once per process.
+
+    Returns
+    -------
+    dict
+        License index holding SPDX license list version, SPDX records per license ID and lookup keys
+    """
+    with LICENSE_INDEX_FILE.open("r", encoding="utf-8") as file:
+        return json.load(file)
+
+
+def __getattr__(name: str) -> set[tuple[str, str]]:
+    """
+    Provide deprecated module attribute `LICENSES`, which is loaded on first access instead of at import.
+
+    Parameters
+    ----------
+    name: str
+        Name of module attribute
+
+    Raises
+    ------
+    AttributeError
+        if module has no attribute of given name
+
+    Returns
+    -------
+    set[tuple[str, str]]
+        License IDs and normalized license names, as returned by `read_licenses`
+    """
+    if name == "LICENSES":
+        warnings.warn(
+            "`omi.license.LICENSES` is deprecated, use `find_license_id` or `get_license_index` instead.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return __read_licenses_once()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@cache
+def __read_licenses_once() -> set[tuple[str, str]]:
+    return read_licenses()
+
+
+@lru_cache(maxsize=4096)
+def find_license_id(name: str) -> str | None:
+    """
+    Find SPDX license ID for given license ID, name or alias.
+
+    Parameters
+    ----------
+    name: str
+        License ID, name or alias
+
+    Returns
+    -------
+    str | None
+        SPDX license ID or None if license is not found
+    """
+    return get_license_index()["keys"].get(normalize_license_name(name))
+
+
+def find_license(name: str) -> dict | None:
+    """
+    Find SPDX license record for given license ID, name or alias.
+
+    Parameters
+    ----------
+    name: str
+        License ID, name or alias
+
+    Returns
+    -------
+    dict | None
+        Copy of SPDX license record (ID, name, reference, OSI approval and deprecation) or None if not found
+    """
+    license_id = find_license_id(name)
+    if license_id is None:
+        return None
+    return dict(get_license_index()["licenses"][license_id])
+
+
+def suggest_licenses(name: str, *, limit: int = 5, min_score: float = 0.3) -> list[tuple[str, float]]:
+    """
+    Suggest SPDX licenses for given (possibly misspelled) license ID, name or alias.
+
+    Licenses are ranked by the similarity of character trigrams (Dice coefficient) between given name and
+    license IDs, names and aliases, ignoring case, whitespace and punctuation. An exact match of a license ID, name or
+    alias always gets score 1. Suggestions are cached, thus repeated variants are resolved at no cost.
+
+    Parameters
+    ----------
+    name: str
+        License ID, name or alias
+    limit: int
+        Maximum number of suggestions
+    min_score: float
+        Minimum similarity score (between 0 and 1) of suggestions
+
+    Returns
+    -------
+    list[tuple[str, float]]
+        SPDX license IDs and related scores, best suggestion first
+    """
+    return list(__suggest_licenses(name, limit, min_score))
+
+
+@lru_cache(maxsize=4096)
+def __suggest_licenses(name: str, limit: int, min_score: float) -> tuple[tuple[str, float], ...]:
+    exact_match = find_license_id(name)
+    entries, postings = __get_license_trigram_index()
+    trigrams = __get_trigrams(name)
+    counts = Counter()
+    for trigram in trigrams:
+        counts.update(postings.get(trigram, ()))
+
+    scores = {exact_match: 1.0} if exact_match is not None else {}
+    for entry, count in counts.items():
+        license_id, entry_trigrams = entries[entry]
+        score = round(2 * count / (len(trigrams) + entry_trigrams), 3)
+        if score >= min_score and score > scores.get(license_id, 0):
+            scores[license_id] = score
+    return tuple(sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit])
+
+
+@cache
+def __get_license_trigram_index() -> tuple[list[tuple[str, int]], dict[str, list[int]]]:
+    """
+    Build trigram index of license IDs, names and aliases.
+
+    Returns
+    -------
+    tuple[list[tuple[str, int]], dict[str, list[int]]]
+        Entries holding SPDX license ID and number of trigrams of indexed key, and positions of entries per trigram
+    """
+    entries = []
+    postings: dict[str, list[int]] = {}
+    for key, license_id in sorted(get_license_index()["keys"].items()):
+        trigrams = __get_trigrams(key)
+        for trigram in trigrams:
+            postings.setdefault(trigram, []).append(len(entries))
+        entries.append((license_id, len(trigrams)))
+    return entries, postings
+
+
+def __get_trigrams(name: str) -> set[str]:
+    """
+    Return character trigrams of name, ignoring case, whitespace and punctuation.
+
+    Version numbers (consecutive numeric words, i.e. "4.0" or "2-0") are added as extra features with
+    weight of `VERSION_WEIGHT` trigrams, as licenses often differ by version only.
+    """
+    words = "".join(char if char.isalnum() else " " for char in name.upper()).split()
+    padded = f" {' '.join(words)} "
+    trigrams = {padded[i : i + 3] for i in range(len(padded) - 2)}
+    version_words: list[str] = []
+    for word in [*words, ""]:
+        if word.isdigit():
+            version_words.append(word)
+        elif version_words:
+            trigrams.update(f"#{weight}:{'.'.join(version_words)}" for weight in range(VERSION_WEIGHT))
+            version_words = []
+    return trigrams
+
+
 def validate_license(license_id: str) -> bool:
     """
     Validate single license ID.
@@ -64,27 +293,32 @@ def validate_license(license_id: str) -> bool:
     Parameters
     ----------
     license_id: str
-        License ID
+        License ID, name or alias
 
     Returns
     -------
     bool
         True if valid, False otherwise
     """
-    normalized_license = normalize_license_name(license_id)
-    if normalized_license not in LICENSES:
-        return False
-    return True
+    return find_license_id(license_id) is not None
 
 
-def validate_oemetadata_licenses(metadata: dict) -> None:
+def validate_oemetadata_licenses(metadata: dict, *, fix: bool = False, min_score: float = 0.6) -> list[dict]:
     """
     Validate licenses in OEMetadata.
 
+    If a license is not found, error message lists suggested SPDX licenses. In fix mode, unknown licenses
+    are replaced by the best suggestion instead (license name is set to SPDX license ID and title to SPDX license
+    name), if its score reaches `min_score`.
+
     Parameters
     ----------
     metadata: dict
         OEMetadata dictionary
+    fix: bool
+        If set to True, unknown licenses are replaced in given metadata by best suggestion
+    min_score: float
+        Minimum score of suggestion to replace unknown license in fix mode
 
     Raises
     ------
@@ -93,8 +327,8 @@ def validate_oemetadata_licenses(metadata: dict) -> None:
 
     Returns
     -------
-    None
-        if licenses are valid, otherwise LicenseError is raised
+    list[dict]
+        Fixed licenses, each holding resource and license number, original license and replacement
     """
     if metadata is None:
         msg = "Metadata is empty."
@@ -103,26 +337,130 @@ def validate_oemetadata_licenses(metadata: dict) -> None:
     version = get_metadata_version(metadata)
     licenses_info = _find_license_field(metadata, version)
 
+    fixes = []
     for resource_index, licenses in licenses_info:
-        if not licenses:
-            raise LicenseError(f"No license information available in the metadata for resource: {resource_index + 1}.")
-        for i, license_ in enumerate(licenses or []):
-            if not license_.get("name") and not license_.get("title"):
-                raise LicenseError(
-                    "The license name and title are missing in resource"
-                    f"{resource_index + 1}, license {i + 1} ({license_}).",
-                )
-            name_not_found = False
-            if not validate_license(license_["name"]):
-                name_not_found = True
-
-            if not name_not_found and not validate_license(license_["title"]):
-                raise LicenseError(
-                    f"The (normalized) license name '{license_['name']}' in resource"
-                    f"{resource_index + 1}, license {i + 1} "
-                    "was not found in the SPDX licenses list. "
-                    "(See https://github.com/spdx/license-list-data/blob/main/json/licenses.json).",
-                )
+        fixes.extend(validate_resource_licenses(licenses, resource_index, fix=fix, min_score=min_score))
+    return fixes
+
+
+def validate_resource_licenses(
+    licenses: list[dict] | None,
+    resource_index: int,
+    *,
+    fix: bool = False,
+    min_score: float = 0.6,
+) -> list[dict]:
+    """
+    Validate licenses of a single resource (or top-level licenses for OEP-1.x metadata).
+
+    Parameters
+    ----------
+    licenses: list[dict] | None
+        Licenses of resource
+    resource_index: int
+        Index of resource, shown in error messages
+    fix: bool
+        If set to True, unknown licenses are replaced by best suggestion
+    min_score: float
+        Minimum score of suggestion to replace unknown license in fix mode
+
+    Raises
+    ------
+    LicenseError
+        Raised if license is invalid or no license is found
+
+    Returns
+    -------
+    list[dict]
+        Fixed licenses, each holding resource and license number, original license and replacement
+    """
+    __check_licenses_available(licenses, resource_index)
+    fixes = []
+    for i, license_ in enumerate(licenses):
+        fix_ = __validate_license(license_, resource_index, i, fix=fix, min_score=min_score)
+        if fix_ is not None:
+            fixes.append(fix_)
+    return fixes
+
+
+def find_resource_license_errors(
+    licenses: list[dict] | None,
+    resource_index: int,
+) -> list[tuple[int | None, LicenseError]]:
+    """
+    Find all license errors of a single resource (or top-level licenses for OEP-1.x metadata) without raising.
+
+    Parameters
+    ----------
+    licenses: list[dict] | None
+        Licenses of resource
+    resource_index: int
+        Index of resource, shown in error messages
+
+    Returns
+    -------
+    list[tuple[int | None, LicenseError]]
+        Index of invalid license (None if licenses are missing) and related error
+    """
+    try:
+        __check_licenses_available(licenses, resource_index)
+    except LicenseError as error:
+        return [(None, error)]
+    errors = []
+    for i, license_ in enumerate(licenses):
+        try:
+            __validate_license(license_, resource_index, i)
+        except LicenseError as error:
+            errors.append((i, error))
+    return errors
+
+
+def __check_licenses_available(licenses: list[dict] | None, resource_index: int) -> None:
+    if not licenses:
+        raise LicenseError(f"No license information available in the metadata for resource: {resource_index + 1}.")
+
+
+def __validate_license(
+    license_: dict,
+    resource_index: int,
+    i: int,
+    *,
+    fix: bool = False,
+    min_score: float = 0.6,
+) -> dict | None:
+    """Validate single license and return applied fix in fix mode (if any)."""
+    if not license_.get("name") and not license_.get("title"):
+        raise LicenseError(
+            "The license name and title are missing in resource"
+            f"{resource_index + 1}, license {i + 1} ({license_}).",
+        )
+    name = license_.get("name") or ""
+    title = license_.get("title") or ""
+    if validate_license(name) or validate_license(title):
+        return None
+    suggestions = suggest_licenses(name) or suggest_licenses(title)
+    if fix and suggestions and suggestions[0][1] >= min_score:
+        record = find_license(suggestions[0][0])
+        fix_ = {
+            "resource": resource_index + 1,
+            "license": i + 1,
+            "original": dict(license_),
+            "replacement": {"name": record["licenseId"], "title": record["name"]},
+        }
+        license_.update(name=record["licenseId"], title=record["name"])
+        return fix_
+    suggestion_hint = (
+        f" Did you mean one of: {', '.join(f'{license_id} ({score})' for license_id, score in suggestions)}?"
+        if suggestions
+        else ""
+    )
+    raise LicenseError(
+        f"The (normalized) license name '{name}' in resource"
+        f"{resource_index + 1}, license {i + 1} "
+        "was not found in the SPDX licenses list. "
+        "(See https://github.com/spdx/license-list-data/blob/main/json/licenses.json)."
+        f"{suggestion_hint}",
+    )
 
 
 def _find_license_field(metadata: dict, version: str) -> list:
@@ -138,5 +476,3 @@ def _find_license_field(metadata: dict, version: str) -> list:
 
     return licenses_per_resource
 
-
-LICENSES = read_licenses()
@@ -0,0 +1,285 @@
+"""Client module for OMI to fetch metadata and table definitions from the OEP API."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import pathlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from http import HTTPStatus
+from typing import TYPE_CHECKING
+
+from omi import settings
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable, Iterable
+
+    import requests
+
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+# Subdirectory of cache directory holding cached responses, which is owned by OMI and thus may be cleared
+CACHE_SUBDIRECTORY = "omi-oep"
+
+
+class OEPError(Exception):
+    """Raised when a request to the OEP API fails."""
+
+    def __init__(self, message: str, status_code: int) -> None:
+        """Init error with message and HTTP status code of failed response."""
+        super().__init__(message)
+        self.status_code = status_code
+
+
+@dataclass
+class CachedResponse:
+    """JSON content of a successful response together with its ETag and expiry time (epoch seconds)."""
+
+    data: object
+    etag: str | None
+    expires: float
+
+
+@dataclass
+class OEPTableResult:
+    """Result of processing a single OEP table within a bulk operation, holding either a result or an error."""
+
+    oep_schema: str
+    oep_table: str
+    result: object = None
+    error: Exception | None = None
+
+
+class OEPClient:
+    """
+    Client for the OEP API using a pooled HTTP session, retries and a response cache.
+
+    Successful responses are cached in memory (and on disk, if a cache directory is given) for `cache_ttl` seconds.
+    Once a cached response is expired, it is revalidated using its ETag (if the server sent one), thus unchanged
+    resources are not transferred again.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        base_url: str | None = None,
+        *,
+        timeout: float = 90,
+        retries: int = 3,
+        backoff_factor: float = 0.5,
+        pool_size: int = 10,
+        cache_ttl: float = 300,
+        cache_dir: str | pathlib.Path | None = None,
+    ) -> None:
+        """
+        Init client.
+
+        Parameters
+        ----------
+        base_url: str | None
+            URL of OEP instance. Defaults to `omi.settings.OEP_URL`.
+        timeout: float
+            Timeout of a single request in seconds
+        retries: int
+            Number of retries for failed connections and responses with status codes 429 and 5xx
+        backoff_factor: float
+            Factor of exponential backoff between retries
+        pool_size: int
+            Maximum number of pooled connections
+        cache_ttl: float
+            Number of seconds a cached response is used without asking the server again
+        cache_dir: str | pathlib.Path | None
+            If set, responses are cached in subdirectory "omi-oep" of this directory as well and are reused across
+            processes
+        """
+        self.base_url = (base_url or settings.OEP_URL).rstrip("/")
+        self.timeout = timeout
+        self.cache_ttl = cache_ttl
+        self.cache_dir = pathlib.Path(cache_dir) if cache_dir else None
+        self.__cache_path = self.cache_dir / CACHE_SUBDIRECTORY if self.cache_dir else None
+        if self.__cache_path:
+            self.__cache_path.mkdir(parents=True, exist_ok=True)
+        # requests is imported on first use only, thus importing OMI does not pay its import cost
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        self.session: requests.Session = requests.Session()
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=["GET"],
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.__cache: dict[str, CachedResponse] = {}
+
+    def get_json(self, path: str) -> object:
+        """
+        Get JSON content of given API path, using cached response if available.
+
+        Parameters
+        ----------
+        path: str
+            Path relative to base URL, i.e. "/api/v0/schema/model_draft/tables/my_table/meta/"
+
+        Raises
+        ------
+        OEPError
+            if server responds with a status code other than 200 (or 304 for revalidated responses)
+
+        Returns
+        -------
+        object
+            Parsed JSON content of response
+        """
+        url = f"{self.base_url}/{path.lstrip('/')}"
+        cached = self.__cache.get(url) or self.__read_from_disk(url)
+        if cached and cached.expires > time.time():
+            return cached.data
+
+        headers = {"If-None-Match": cached.etag} if cached and cached.etag else {}
+        response = self.session.get(url, headers=headers, timeout=self.timeout)
+        if cached and response.status_code == HTTPStatus.NOT_MODIFIED:
+            cached = CachedResponse(cached.data, cached.etag, time.time() + self.cache_ttl)
+        elif response.status_code == HTTPStatus.OK:
+            cached = CachedResponse(response.json(), response.headers.get("ETag"), time.time() + self.cache_ttl)
+        else:
+            raise OEPError(f"Request to '{url}' failed with status code {response.status_code}.", response.status_code)
+        self.__cache[url] = cached
+        self.__write_to_disk(url, cached)
+        return cached.data
+
+    def get_table_metadata(self, oep_table: str, oep_schema: str) -> object:
+        """Get metadata of OEP table."""
+        return self.get_json(f"/api/v0/schema/{oep_schema}/tables/{oep_table}/meta/")
+
+    def get_table_columns(self, oep_table: str, oep_schema: str) -> object:
+        """Get column definitions of OEP table."""
+        return self.get_json(f"/api/v0/schema/{oep_schema}/tables/{oep_table}/columns")
+
+    def clear_cache(self) -> None:
+        """Remove all cached responses from memory and disk; other files in cache directory are kept."""
+        self.__cache.clear()
+        if self.__cache_path:
+            for cache_file in self.__cache_path.glob("*.json"):
+                cache_file.unlink()
+
+    def __cache_file(self, url: str) -> pathlib.Path:
+        return self.__cache_path / f"{hashlib.sha256(url.encode()).hexdigest()}.json"
+
+    def __read_from_disk(self, url: str) -> CachedResponse | None:
+        if not self.__cache_path:
+            return None
+        try:
+            with self.__cache_file(url).open("r", encoding="utf-8") as f:
+                return CachedResponse(**json.load(f))
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def __write_to_disk(self, url: str, cached: CachedResponse) -> None:
+        if not self.__cache_path:
+            return
+        cache_file = self.__cache_file(url)
+        # Temporary file is unique per thread, as tables may be fetched concurrently (see `process_oep_tables`)
+        tmp_file = cache_file.with_suffix(f".{threading.get_ident()}.tmp")
+        with tmp_file.open("w", encoding="utf-8") as f:
+            json.dump({"data": cached.data, "etag": cached.etag, "expires": cached.expires}, f)
+        tmp_file.replace(cache_file)
+
+
+OEP_CLIENTS: dict[str, OEPClient] = {}
+
+
+def get_oep_client() -> OEPClient:
+    """
+    Return client shared by all OMI functions accessing the OEP API.
+
+    Client is created with default settings on first call, unless it has been set via `set_oep_client`.
+
+    Returns
+    -------
+    OEPClient
+        Shared OEP client
+    """
+    if "default" not in OEP_CLIENTS:
+        OEP_CLIENTS["default"] = OEPClient()
+    return OEP_CLIENTS["default"]
+
+
+def set_oep_client(client: OEPClient | None) -> None:
+    """
+    Set client shared by all OMI functions accessing the OEP API, i.e. to change base URL, retries or caching.
+
+    Parameters
+    ----------
+    client: OEPClient | None
+        Client to use. If None, a client with default settings is created on next access.
+    """
+    if client is None:
+        OEP_CLIENTS.pop("default", None)
+    else:
+        OEP_CLIENTS["default"] = client
+
+
+async def process_oep_tables(
+    function: Callable[[str, str], object],
+    tables: Iterable[tuple[str, str]],
+    *,
+    concurrency: int = 10,
+) -> AsyncIterator[OEPTableResult]:
+    """
+    Apply function to many OEP tables concurrently and yield results as soon as they arrive.
+
+    Function is called with table name and schema name (in that order, like other OMI functions) in a thread pool,
+    thus blocking requests via the shared OEP client run concurrently. At most `concurrency` tables are processed
+    at once and further tables are only taken from `tables` when a slot becomes free, thus `tables` may be a lazy
+    iterable of any size. As long as the consumer does not ask for the next result, no further tables are started.
+    A failing table does not abort the iteration; instead, its error is stored in related result.
+
+    Parameters
+    ----------
+    function: Callable[[str, str], object]
+        Function called with OEP table name and schema name, i.e. `omi.base.get_metadata_from_oep_table`
+    tables: Iterable[tuple[str, str]]
+        Pairs of OEP schema name and table name
+    concurrency: int
+        Maximum number of tables processed at once. Shared OEP client holds 10 pooled connections by default;
+        use a client with larger `pool_size` for higher concurrency.
+
+    Yields
+    ------
+    OEPTableResult
+        Result per table, holding schema and table name and result of function or error
+    """
+    import asyncio
+
+    if concurrency < 1:
+        msg = "Concurrency must be at least 1."
+        raise ValueError(msg)
+    loop = asyncio.get_running_loop()
+    table_iterator = iter(tables)
+    pending: dict[asyncio.Future, tuple[str, str]] = {}
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+
+        def submit_next() -> None:
+            table = next(table_iterator, None)
+            if table is not None:
+                oep_schema, oep_table = table
+                pending[loop.run_in_executor(executor, function, oep_table, oep_schema)] = table
+
+        for _ in range(concurrency):
+            submit_next()
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                oep_schema, oep_table = pending.pop(future)
+                submit_next()
+                try:
+                    yield OEPTableResult(oep_schema, oep_table, result=future.result())
+                except Exception as error:  # noqa: BLE001
+                    yield OEPTableResult(oep_schema, oep_table, error=error)
@@ -0,0 +1,101 @@
+"""Reader module for OMI to split large CSV files into byte ranges of whole rows via memory mapping."""
+
+from __future__ import annotations
+
+import contextlib
+import mmap
+import pathlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+BLOCK_SIZE = 16 << 20
+"""Number of bytes read from a memory-mapped file at once, i.e. when counting rows of a byte range."""
+
+
+@contextlib.contextmanager
+def open_mmap(path: str | pathlib.Path) -> Iterator[mmap.mmap | bytes]:
+    """
+    Map file into memory read-only.
+
+    Pages are loaded by the operating system on access, thus several processes mapping the same file share its
+    pages and nothing is copied between them. Empty files (which cannot be mapped) yield empty bytes.
+    """
+    with pathlib.Path(path).open("rb") as f:
+        if f.seek(0, 2) == 0:
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
+
+
+def read_header(path: str | pathlib.Path) -> bytes:
+    """Return first row of CSV file including its line break."""
+    with open_mmap(path) as mapped:
+        return mapped[: __next_row_start(mapped, 0)]
+
+
+def split_file(
+    path: str | pathlib.Path,
+    *,
+    chunk_bytes: int,
+    start: int | None = None,
+    end: int | None = None,
+) -> list[tuple[int, int]]:
+    """
+    Split CSV file (or a byte range of it) into byte ranges of whole rows.
+
+    Ranges are roughly `chunk_bytes` long and end with a line break (except for the last row of a file without a
+    trailing line break), thus worker processes can parse them independently. Only the bytes at range boundaries are
+    read. Cells holding line breaks are not supported, as a range could start within such a cell.
+
+    Parameters
+    ----------
+    path: str | pathlib.Path
+        Path to CSV file
+    chunk_bytes: int
+        Approximate number of bytes per range
+    start: int | None
+        Byte offset to start at. Defaults to start of second row, thus header is skipped.
+    end: int | None
+        Byte offset to end at. Defaults to end of file.
+
+    Returns
+    -------
+    list[tuple[int, int]]
+        Start and end offset of each range
+    """
+    if chunk_bytes < 1:
+        msg = "Chunk size must be at least 1 byte."
+        raise ValueError(msg)
+    with open_mmap(path) as mapped:
+        start = __next_row_start(mapped, 0) if start is None else start
+        end = len(mapped) if end is None else end
+        ranges = []
+        while start < end:
+            range_end = min(__next_row_start(mapped, start + chunk_bytes - 1), end)
+            ranges.append((start, range_end))
+            start = range_end
+    return ranges
+
+
+def read_range(path: str | pathlib.Path, start: int, end: int) -> bytes:
+    """Return bytes of given range of file, read via memory mapping in the calling process."""
+    with open_mmap(path) as mapped:
+        return mapped[start:end]
+
+
+def iter_blocks(path: str | pathlib.Path, start: int, end: int) -> Iterator[bytes]:
+    """Yield given byte range of file in blocks of whole rows, each about `BLOCK_SIZE` bytes long."""
+    with open_mmap(path) as mapped:
+        while start < end:
+            block_end = min(__next_row_start(mapped, start + BLOCK_SIZE - 1), end)
+            yield mapped[start:block_end]
+            start = block_end
+
+
+def __next_row_start(mapped: mmap.mmap | bytes, offset: int) -> int:
+    """Return offset of first row starting after given offset or end of file, if there is none."""
+    line_break = mapped.find(b"\n", offset)
+    return len(mapped) if line_break == -1 else line_break + 1
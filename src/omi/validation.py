@@ -2,23 +2,21 @@
 
 from __future__ import annotations
 
+import bisect
+import io
+import itertools
 import json
+import pathlib
+import re
+import sys
+import time
 import warnings
+from collections import deque
+from dataclasses import asdict, dataclass
+from functools import cache, reduce
+from typing import TYPE_CHECKING
 
 import jsonschema
-import pandas as pd
-import requests
-from frictionless import Field, Report, Resource, Schema
-from frictionless.fields import (
-    ArrayField,
-    BooleanField,
-    DateField,
-    DatetimeField,
-    IntegerField,
-    NumberField,
-    ObjectField,
-    StringField,
-)
 
 from omi import license
 from omi.base import (
@@ -27,73 +25,467 @@ from omi.base import (
     get_metadata_specification,
     get_metadata_version,
 )
-from omi.settings import OEP_URL
+from omi.cache import ValidationCache, get_cache_key, hash_arrow_table, hash_dataframe, hash_file
+from omi.oep import OEPError, get_oep_client, process_oep_tables
+from omi.reader import read_header, read_range, split_file
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+    from concurrent.futures import Future
+    from types import ModuleType
+
+    import numpy as np
+    import pandas as pd
+    import pyarrow as pa
+    from frictionless import Error, Field, Report
+    from frictionless.errors import PrimaryKeyError
+    from pyarrow import parquet
+
+    from omi.oep import OEPTableResult
+
+# Heavy dependencies (pandas, numpy, frictionless) are imported within functions using them,
+# thus importing this module (i.e. for validating metadata only) stays fast.
 
 FRICTIONLESS_FIELD_MAPPING = {
-    "string": StringField,
-    "text": StringField,
-    "integer": IntegerField,
-    "bigint": IntegerField,
-    "float": NumberField,
-    "float array": ArrayField,
-    "double precision": NumberField,
-    "boolean": BooleanField,
-    "date": DateField,
-    "datetime": DatetimeField,
-    "array": ArrayField,
-    "object": ObjectField,
-    "json": ObjectField,
+    "string": "string",
+    "text": "string",
+    "integer": "integer",
+    "bigint": "integer",
+    "float": "number",
+    "float array": "array",
+    "double precision": "number",
+    "numeric": "number",
+    "decimal": "number",
+    "boolean": "boolean",
+    "date": "date",
+    "datetime": "datetime",
+    "array": "array",
+    "object": "object",
+    "json": "object",
+}
+"""Mapping of OEP field types to frictionless field types."""
+
+
+METADATA_VALIDATORS: dict[tuple[str, bool], jsonschema.protocols.Validator] = {}
+"""Registry of compiled JSON schema validators, keyed by metadata version and format checking flag."""
+
+
+OPTIONAL_FIELD_PATHS: dict[str, dict[tuple[str, ...], tuple[str, ...]]] = {}
+"""Registry of compiled optional field tables, keyed by metadata version (see `get_optional_field_paths`)."""
+
+
+METADATA_UNIT_OPTIONAL_FIELD_PATHS: dict[str, dict[int, dict[tuple[str, ...], tuple[str, ...]]]] = {}
+"""Registry of optional field tables relative to metadata units, mapped by length of unit path."""
+
+
+METADATA_UNIT_PATTERNS = {0: (), 2: ("resources", "*"), 5: ("resources", "*", "schema", "fields", "*")}
+"""Path patterns of metadata units (see `revalidate_metadata`), mapped by length of unit path."""
+
+
+METADATA_UNIT_VALIDATORS: dict[tuple[str, bool], dict[int, jsonschema.protocols.Validator]] = {}
+"""Registry of JSON schema validators for metadata units (see `revalidate_metadata`), mapped by length of unit path."""
+
+
+JSON_KEY_WHITESPACE_PATTERN = re.compile(r'"[ \t\n\r]+:')
+"""Whitespace between a closing quote and a colon, which prevents counting keys of JSON text via `str.count`."""
+
+
+JSON_ESCAPED_KEY_CHARACTERS_PATTERN = re.compile(r"\\u00(?:22|20|3[aA])")
+"""Unicode escapes of quote, space and colon, which prevent counting keys of JSON text via `str.count`."""
+
+
+RANGE_ESTIMATION_BYTES = 1 << 20
+"""Number of bytes after the header used to estimate bytes per row, when splitting CSV files into byte ranges."""
+
+
+DATA_FILE_READERS = ("pandas", "mmap")
+"""Readers of CSV files in streaming data validation (see `validate_data_file_against_metadata`)."""
+
+
+VECTORIZED_DTYPE_KINDS = {"integer": "iu", "number": "iuf", "boolean": "b", "date": "M", "string": ""}
+"""Frictionless types checked by vectorized engine, mapped to numpy dtype kinds holding valid values."""
+
+
+ARROW_TYPE_PREDICATES = {
+    "integer": ("is_integer",),
+    "number": ("is_integer", "is_floating", "is_decimal"),
+    "boolean": ("is_boolean",),
+    "date": ("is_date",),
+    "datetime": ("is_timestamp",),
+    "string": ("is_string", "is_large_string"),
+    "array": ("is_list", "is_large_list", "is_fixed_size_list"),
+    "object": ("is_struct", "is_map"),
 }
+"""Frictionless types checked by arrow engine, mapped to `pyarrow.types` predicates of types holding valid values."""
+
+
+ARROW_PRIMITIVE_PREDICATES = ("is_integer", "is_floating", "is_decimal", "is_boolean", "is_date", "is_timestamp")
+"""Predicates of Arrow types whose values are invalid for frictionless types not holding them (like dtype kinds)."""
 
 
 class ValidationError(Exception):
     """Exception raised when a validation fails."""
 
 
-def validate_metadata(metadata: dict | str, check_license: bool = True) -> None:  # noqa: FBT001, FBT002
+@dataclass
+class ArrowData:
+    """
+    Columns of an Arrow table or parquet file, read lazily by the arrow engine.
+
+    Types and null counts are known without reading any values (from the parquet footer); columns are read only if
+    their values have to be checked.
+    """
+
+    labels: list[str]
+    num_rows: int
+    types: dict[str, pa.DataType]
+    null_counts: dict[str, int | None]
+    read_columns: Callable[[list[str]], pa.Table]
+    row_cells: Callable[[int], list[str]]
+
+
+def get_metadata_validator(metadata_version: str, *, check_formats: bool = False) -> jsonschema.protocols.Validator:
+    """
+    Return compiled JSON schema validator for given metadata version.
+
+    Validators are built once per metadata version and reused for every subsequent call.
+    The JSON schema draft is detected from the `$schema` keyword of the metadata schema
+    and the schema itself is checked against its metaschema only once, when the validator is built.
+
+    Parameters
+    ----------
+    metadata_version: str
+        Metadata version
+    check_formats: bool
+        If set to True, the validator checks string formats (like "date" or "email") as well
+
+    Returns
+    -------
+    jsonschema.protocols.Validator
+        Validator for the JSON schema of given metadata version
+    """
+    key = (metadata_version, check_formats)
+    if key not in METADATA_VALIDATORS:
+        schema = get_metadata_specification(metadata_version).schema
+        validator_class = jsonschema.validators.validator_for(schema)
+        validator_class.check_schema(schema)
+        format_checker = validator_class.FORMAT_CHECKER if check_formats else None
+        METADATA_VALIDATORS[key] = validator_class(schema, format_checker=format_checker)
+    return METADATA_VALIDATORS[key]
+
+
+def get_optional_field_paths(metadata_version: str) -> dict[tuple[str, ...], tuple[str, ...]]:
+    """
+    Return table of optional fields for given metadata version.
+
+    The table is compiled once per metadata version from the metadata schema. It maps paths of objects within
+    metadata (whereby "*" matches all items of an array) to names of their optional (not required) fields.
+
+    Parameters
+    ----------
+    metadata_version: str
+        Metadata version
+
+    Returns
+    -------
+    dict[tuple[str, ...], tuple[str, ...]]
+        Paths of objects mapped to names of their optional fields
+    """
+    if metadata_version not in OPTIONAL_FIELD_PATHS:
+        optional_fields = {}
+        stack = [((), get_metadata_validator(metadata_version).schema)]
+        while stack:
+            path, schema = stack.pop()
+            children = []
+            if "properties" in schema:
+                required = set(schema.get("required", ()))
+                fields = tuple(field for field in schema["properties"] if field not in required)
+                if fields:
+                    optional_fields[path] = fields
+                children = [((*path, field), subschema) for field, subschema in schema["properties"].items()]
+            if isinstance(schema.get("items"), dict):
+                children.append(((*path, "*"), schema["items"]))
+            stack.extend(reversed(children))
+        OPTIONAL_FIELD_PATHS[metadata_version] = optional_fields
+    return OPTIONAL_FIELD_PATHS[metadata_version]
+
+
+def find_missing_optional_fields(metadata: dict | str) -> list[dict]:
+    """
+    Find all optional fields missing in metadata, including fields of array items (i.e. of resources).
+
+    Parameters
+    ----------
+    metadata: dict | str
+        Metadata as dict or as JSON string
+
+    Returns
+    -------
+    list[dict]
+        JSON path of object (i.e. "$.resources[0].schema"), name and message for each missing optional field
+    """
+    if isinstance(metadata, str):
+        metadata = parse_metadata(metadata)
+    return __find_missing_optional_fields(metadata, get_optional_field_paths(get_metadata_version(metadata)))
+
+
+def validate_metadata(
+    metadata: dict | str,
+    check_license: bool = True,  # noqa: FBT001, FBT002
+    *,
+    check_formats: bool = False,
+    cache: ValidationCache | None = None,
+    return_report: bool = False,
+) -> None | MetadataReport:
     """
     Validate metadata against related metadata schema.
 
+    By default, first error found is raised. If `return_report` is set, metadata is checked completely in a single
+    pass instead and a report holding all schema violations, license errors and warnings is returned.
+
     Parameters
     ----------
     metadata: dict | str
         Metadata as dict or as JSON string
     check_license: bool
         If set to True, licenses are validated
+    check_formats: bool
+        If set to True, string formats (like "date", "date-time" or "email") are validated as well
+    cache: ValidationCache | None
+        If given, result is looked up in cache first and stored in cache otherwise.
+        Cached errors are raised (and cached warnings emitted) again without validating metadata.
+    return_report: bool
+        If set to True, report holding all errors and warnings is returned instead of raising the first error.
 
     Returns
     -------
-    None
-        if metadata schema is valid. Otherwise it raises an exception.
+    None | MetadataReport
+        Report if `return_report` is set to True. Otherwise None if metadata is valid, else it raises an exception.
     """
     if isinstance(metadata, str):
         metadata = parse_metadata(metadata)
     metadata_version = get_metadata_version(metadata)
-    metadata_schema = get_metadata_specification(metadata_version)
-    try:
-        jsonschema.validate(metadata, metadata_schema.schema)
-    except jsonschema.exceptions.ValidationError as ve:
-        raise ValidationError(f"Error validating metadata against related metadata schema: {ve.message}") from ve
-    if check_license:
-        license.validate_oemetadata_licenses(metadata)
-    __validate_optional_fields_in_metadata(metadata, metadata_schema.schema)
+    if return_report:
+        return __get_metadata_report(metadata, metadata_version, check_license, check_formats, cache)
+    key = get_cache_key("metadata", metadata, metadata_version, check_license, check_formats) if cache else None
+    result = cache.get(key) if cache else None
+    if result is None:
+        try:
+            result = {"warnings": __validate_metadata(metadata, metadata_version, check_license, check_formats)}
+        except (ValidationError, license.LicenseError) as error:
+            if cache:
+                cache.set(key, {"error": {"type": type(error).__name__, "message": str(error)}})
+            raise
+        if cache:
+            cache.set(key, result)
+    if "error" in result:
+        error_class = license.LicenseError if result["error"]["type"] == "LicenseError" else ValidationError
+        raise error_class(result["error"]["message"])
+    if result["warnings"]:
+        examples = ", ".join(f"{warning['path']}.{warning['field']}" for warning in result["warnings"][:5])
+        warnings.warn(
+            f"{len(result['warnings'])} optional fields not found in metadata (i.e. {examples}). "
+            "Use `find_missing_optional_fields` to list all of them.",
+            stacklevel=2,
+        )
+    return None
 
 
-def validate_data(
-    data: pd.DataFrame,
+@dataclass
+class MetadataReport:
+    """
+    Report holding all problems found in metadata.
+
+    Errors and license errors are dictionaries holding the JSON path (i.e. "$.resources[0].schema.fields[2].type")
+    and message of each problem; errors hold the failed JSON schema keyword ("validator") as well.
+    Warnings hold missing optional fields (see `find_missing_optional_fields`).
+    """
+
+    metadata_version: str
+    errors: list[dict]
+    license_errors: list[dict]
+    warnings: list[dict]
+
+    @property
+    def valid(self) -> bool:
+        """Return True if metadata is valid against metadata schema and licenses are valid (if checked)."""
+        return not self.errors and not self.license_errors
+
+    def to_dict(self) -> dict:
+        """Return report as JSON-serializable dictionary."""
+        return asdict(self)
+
+
+@dataclass
+class MetadataUnitResult:
+    """Validation result of a single metadata unit (top level, resource or field); license errors with JSON path."""
+
+    errors: list[jsonschema.ValidationError]
+    license_errors: list[tuple[str, license.LicenseError]]
+    warnings: list[dict]
+
+
+@dataclass
+class MetadataValidationResult:
+    """
+    Result of metadata validation, holding results per metadata unit.
+
+    Units are the top level of metadata (without resources), each resource (without its fields) and each field of a
+    resource schema. They are identified by their path within metadata, i.e. `()`, `("resources", 0)` and
+    `("resources", 0, "schema", "fields", 3)`.
+    """
+
+    metadata_version: str
+    check_license: bool
+    check_formats: bool
+    units: dict[tuple, MetadataUnitResult]
+    revalidated: list[tuple]
+
+    @property
+    def errors(self) -> list[jsonschema.ValidationError]:
+        """Return JSON schema errors of all units; paths of errors are relative to metadata root."""
+        return [error for unit in self.units.values() for error in unit.errors]
+
+    @property
+    def license_errors(self) -> list[license.LicenseError]:
+        """Return license errors of all units."""
+        return [error for unit in self.units.values() for _, error in unit.license_errors]
+
+    @property
+    def warnings(self) -> list[dict]:
+        """Return missing optional fields of all units (see `find_missing_optional_fields`)."""
+        return [warning for unit in self.units.values() for warning in unit.warnings]
+
+    @property
+    def valid(self) -> bool:
+        """Return True if metadata is valid against metadata schema and licenses are valid (if checked)."""
+        return not self.errors and not self.license_errors
+
+    def raise_on_error(self) -> None:
+        """
+        Raise first error like `validate_metadata` does.
+
+        Raises
+        ------
+        ValidationError
+            if metadata is invalid against related metadata schema
+        LicenseError
+            if a license is invalid
+        """
+        error = jsonschema.exceptions.best_match(self.errors)
+        if error is not None:
+            raise ValidationError(
+                f"Error validating metadata against related metadata schema: {error.message}",
+            ) from error
+        if self.license_errors:
+            raise self.license_errors[0]
+
+    def to_report(self) -> MetadataReport:
+        """Return report holding all errors and warnings of all units."""
+        return MetadataReport(
+            self.metadata_version,
+            [
+                {"path": error.json_path, "message": error.message, "validator": error.validator}
+                for error in self.errors
+            ],
+            [
+                {"path": path, "message": str(error)}
+                for unit in self.units.values()
+                for path, error in unit.license_errors
+            ],
+            self.warnings,
+        )
+
+
+def revalidate_metadata(
+    metadata: dict | str,
+    previous: MetadataValidationResult | None = None,
+    patch: list[dict] | None = None,
+    *,
+    check_license: bool = True,
+    check_formats: bool = False,
+) -> MetadataValidationResult:
+    """
+    Validate metadata incrementally, re-validating only units affected by given JSON patch.
+
+    Metadata is split into units (top level, resources and fields, see `MetadataValidationResult`), which are
+    validated against related part of metadata schema one by one. If a previous result and a JSON patch (RFC 6902)
+    leading from previously validated metadata to given metadata are passed, only units touched by the patch are
+    validated again; results of all other units are taken from previous result. Adding or removing a resource or
+    field shifts the following units, thus these are validated again as well.
+
+    Parameters
+    ----------
+    metadata: dict | str
+        Metadata as dict or as JSON string (patch already applied)
+    previous: MetadataValidationResult | None
+        Result of previous validation. If not given, all units are validated.
+    patch: list[dict] | None
+        JSON patch operations applied to metadata since previous validation. If not given, all units are validated.
+    check_license: bool
+        If set to True, licenses are validated
+    check_formats: bool
+        If set to True, string formats (like "date", "date-time" or "email") are validated as well
+
+    Returns
+    -------
+    MetadataValidationResult
+        Result holding errors and warnings per unit. Use `raise_on_error` to raise errors like `validate_metadata`.
+    """
+    if isinstance(metadata, str):
+        metadata = parse_metadata(metadata)
+    metadata_version = get_metadata_version(metadata)
+    validators = __get_metadata_unit_validators(metadata_version, check_formats=check_formats)
+    optional_fields = __get_metadata_unit_optional_field_paths(metadata_version)
+    changes = None
+    if (
+        previous is not None
+        and patch is not None
+        and (previous.metadata_version, previous.check_license, previous.check_formats)
+        == (metadata_version, check_license, check_formats)
+    ):
+        changes = [change for operation in patch for change in __get_patch_changes(operation)]
+
+    units = {}
+    revalidated = []
+    for path, unit in __iter_metadata_units(metadata):
+        if (
+            changes is not None
+            and path in previous.units
+            and not any(__is_unit_affected(path, tokens, structural=structural) for tokens, structural in changes)
+        ):
+            units[path] = previous.units[path]
+            continue
+        units[path] = __validate_metadata_unit(
+            unit,
+            path,
+            validators[len(path)],
+            optional_fields[len(path)],
+            check_license=check_license and len(path) == (2 if metadata_version == "OEMetadata-2.0" else 0),
+        )
+        revalidated.append(path)
+    return MetadataValidationResult(metadata_version, check_license, check_formats, units, revalidated)
+
+
+def validate_data(  # noqa: PLR0913
+    data: pd.DataFrame | pa.Table,
     *,
     metadata: dict | str | None = None,
     oep_table: str | None = None,
     oep_schema: str | None = None,
     return_report: bool = False,
+    engine: str = "frictionless",
+    workers: int = 1,
+    fail_fast: bool = False,
+    max_errors: int | None = None,
 ) -> None | Report:
     """
     Validate data against given metadata or table definition on OEP including metadata on OEP (if set).
 
     Parameters
     ----------
-    data: pd.DataFrame
-        Data to validate
+    data: pd.DataFrame | pa.Table
+        Data to validate, Arrow tables are validated without converting them to pandas by engine "arrow"
     metadata: dict | str | None
         Metadata in OEMetadata format. If given, data is validated against metadata schema.
     oep_table: str | None
@@ -102,11 +494,19 @@ def validate_data(
         Schema name on OEP. If given, data is validated against OEP table.
     return_report: bool
         If set to True, instead of raising an error if data is invalid an error report is returned
+    engine: str
+        Engine used to validate data, one of "frictionless" (default), "vectorized" or "arrow"
+    workers: int
+        Number of processes validating groups of columns in parallel
+    fail_fast: bool
+        If set to True, validation stops at first error (same as `max_errors=1`)
+    max_errors: int | None
+        If set, validation stops as soon as given number of errors is found and the report holds only those errors
 
     Raises
     ------
     ValidationError
-        if data is not in pandas.DataFrame format
+        if data is neither in pandas.DataFrame nor in pyarrow.Table format
         if field is missing in table or metadata definition
         if data does not fit to OEP table definition and/or metadata schema (if `return_report` is set to True,
         instead of raising an error a report is returned)
@@ -116,8 +516,10 @@ def validate_data(
     None
         if everything is valid. Otherwise, it raises an exception.
     """
-    if not isinstance(data, pd.DataFrame):
-        msg = "Data must be given as pandas.DataFrame."
+    import pandas as pd
+
+    if not isinstance(data, pd.DataFrame) and not __is_arrow_table(data):
+        msg = "Data must be given as pandas.DataFrame or pyarrow.Table."
         raise ValidationError(msg)
     if not metadata and (not oep_table or not oep_schema):
         msg = "You must either set metadata or OEP table to validate data against."
@@ -134,23 +536,44 @@ def validate_data(
     if metadata:
         if isinstance(metadata, str):
             metadata = parse_metadata(metadata)
-        return validate_data_against_metadata(data, metadata, return_report=return_report)
-    return validate_data_against_oep_table(data, oep_table, oep_schema, return_report=return_report)
+        return validate_data_against_metadata(
+            data,
+            metadata,
+            return_report=return_report,
+            engine=engine,
+            workers=workers,
+            fail_fast=fail_fast,
+            max_errors=max_errors,
+        )
+    return validate_data_against_oep_table(
+        data,
+        oep_table,
+        oep_schema,
+        return_report=return_report,
+        engine=engine,
+        workers=workers,
+        fail_fast=fail_fast,
+        max_errors=max_errors,
+    )
 
 
-def validate_data_against_oep_table(
-    data: pd.DataFrame,
+def validate_data_against_oep_table(  # noqa: PLR0913
+    data: pd.DataFrame | pa.Table,
     oep_table: str,
     oep_schema: str,
     *,
     return_report: bool = True,
+    engine: str = "frictionless",
+    workers: int = 1,
+    fail_fast: bool = False,
+    max_errors: int | None = None,
 ) -> None | Report:
     """
     Validate data against given metadata.
 
     Parameters
     ----------
-    data: pandas.DataFrame
+    data: pandas.DataFrame | pyarrow.Table
         Data to validate
     oep_table: str
         OEP table name
@@ -158,6 +581,14 @@ def validate_data_against_oep_table(
         OEP schema name
     return_report: bool
         If set to True, report is returned instead of raising an error.
+    engine: str
+        Engine used to validate data, one of "frictionless" (default), "vectorized" or "arrow"
+    workers: int
+        Number of processes validating groups of columns in parallel
+    fail_fast: bool
+        If set to True, validation stops at first error (same as `max_errors=1`)
+    max_errors: int | None
+        If set, validation stops as soon as given number of errors is found and the report holds only those errors
 
     Returns
     -------
@@ -168,9 +599,17 @@ def validate_data_against_oep_table(
         msg = "You must set OEP table AND schema."
         raise ValidationError(msg)
 
+    limit_errors = __get_error_limit(fail_fast=fail_fast, max_errors=max_errors)
+
     # First validate data against table definition
     table_fields = __get_fields_from_oep_table(oep_table, oep_schema)
-    report = __validate_data_against_schema(data, table_fields)
+    report = __validate_data_against_schema(
+        data,
+        table_fields,
+        engine=engine,
+        workers=workers,
+        limit_errors=limit_errors,
+    )
     if not report.valid:
         if return_report:
             return report
@@ -182,7 +621,13 @@ def validate_data_against_oep_table(
     except MetadataError:
         return None
     metadata_fields = __get_fields_from_metadata(metadata)
-    report = __validate_data_against_schema(data, metadata_fields)
+    report = __validate_data_against_schema(
+        data,
+        metadata_fields,
+        engine=engine,
+        workers=workers,
+        limit_errors=limit_errors,
+    )
     if not report.valid:
         if return_report:
             return report
@@ -192,33 +637,172 @@ def validate_data_against_oep_table(
     return None
 
 
-def validate_data_against_metadata(
-    data: pd.DataFrame,
+def validate_data_against_metadata(  # noqa: PLR0913
+    data: pd.DataFrame | pa.Table,
     metadata: dict | str,
     *,
     return_report: bool = True,
+    engine: str = "frictionless",
+    workers: int = 1,
+    fail_fast: bool = False,
+    max_errors: int | None = None,
+    cache: ValidationCache | None = None,
 ) -> None | Report:
     """
     Validate data against given metadata.
 
     Parameters
     ----------
-    data: pandas.DataFrame
+    data: pandas.DataFrame | pyarrow.Table
         Data to validate
     metadata: dict | str
         Metadata in OEMetadata format.
     return_report: bool
         If set to True, report is returned instead of raising an error.
+    engine: str
+        Engine used to validate data, one of "frictionless" (default), "vectorized" or "arrow"
+    workers: int
+        Number of processes validating groups of columns in parallel
+    fail_fast: bool
+        If set to True, validation stops at first error (same as `max_errors=1`)
+    max_errors: int | None
+        If set, validation stops as soon as given number of errors is found and the report holds only those errors
+    cache: ValidationCache | None
+        If given, report is looked up in cache first (keyed by hash of data and metadata fields) and stored otherwise
+
+    Returns
+    -------
+    Report
+        Frictionless report if `return_report` is set to True, otherwise None is returned.
+    """
+    if isinstance(metadata, str):
+        metadata = parse_metadata(metadata)
+    limit_errors = __get_error_limit(fail_fast=fail_fast, max_errors=max_errors)
+    metadata_fields = __get_fields_from_metadata(metadata)
+    if cache:
+        data_hash = hash_arrow_table(data) if __is_arrow_table(data) else hash_dataframe(data)
+        key = get_cache_key("data", data_hash, metadata_fields, engine, limit_errors)
+    else:
+        key = None
+    report = __get_cached_report(cache, key)
+    if report is None:
+        report = __validate_data_against_schema(
+            data,
+            metadata_fields,
+            engine=engine,
+            workers=workers,
+            limit_errors=limit_errors,
+        )
+        if cache:
+            cache.set(key, report.to_descriptor())
+    if not report.valid:
+        if return_report:
+            return report
+        raise ValidationError(f"Data validation failed. Reason: {report.tasks[0].errors}")
+    return None
+
+
+def validate_data_file_against_metadata(  # noqa: PLR0913
+    source: str | pathlib.Path,
+    metadata: dict | str,
+    *,
+    chunksize: int = 100_000,
+    delimiter: str = ";",
+    return_report: bool = True,
+    engine: str = "frictionless",
+    workers: int = 1,
+    fail_fast: bool = False,
+    max_errors: int | None = None,
+    cache: ValidationCache | None = None,
+    reader: str = "pandas",
+) -> None | Report:
+    """
+    Validate data file against given metadata by streaming it in chunks.
+
+    The file is never loaded into memory as a whole; only one chunk of rows is held at once.
+    Errors of all chunks are aggregated into a single report and row numbers refer to the whole file.
+    If `fail_fast` or `max_errors` is set, no further chunks are read once the error limit is reached.
+    Uniqueness of the primary key is checked across chunks, thus memory needed for primary key values grows
+    with the number of rows.
+    CSV files are read via pandas, parquet files (suffix ".parquet") require `pyarrow` to be installed.
+    Using engine "arrow", parquet files are not read in chunks, but column-wise: columns which are valid by their
+    Arrow type are not read at all and blank rows are ruled out via null counts of column statistics.
+    Using reader "mmap", CSV files are memory-mapped and split into byte ranges of whole rows, which are parsed and
+    validated by `workers` processes in parallel without copying data through the parent process. Cells holding line
+    breaks are not supported by this reader.
+
+    Parameters
+    ----------
+    source: str | pathlib.Path
+        Path to CSV or parquet file
+    metadata: dict | str
+        Metadata in OEMetadata format.
+    chunksize: int
+        Number of rows validated at once
+    delimiter: str
+        Delimiter used in CSV file
+    return_report: bool
+        If set to True, report is returned instead of raising an error.
+    engine: str
+        Engine used to validate data, one of "frictionless" (default), "vectorized" or "arrow"
+    workers: int
+        Number of processes validating groups of columns (or byte ranges of CSV file if reader is "mmap") in parallel
+    fail_fast: bool
+        If set to True, validation stops at first error (same as `max_errors=1`)
+    max_errors: int | None
+        If set, validation stops as soon as given number of errors is found and the report holds only those errors
+    cache: ValidationCache | None
+        If given, report is looked up in cache first (keyed by hash of data and metadata fields) and stored otherwise
+    reader: str
+        Reader of CSV files, one of "pandas" (default) or "mmap"
 
     Returns
     -------
     Report
         Frictionless report if `return_report` is set to True, otherwise None is returned.
+
+    Raises
+    ------
+    ValidationError
+        if reader is unknown or reader "mmap" is used for a parquet file
     """
+    if reader not in DATA_FILE_READERS:
+        raise ValidationError(f"Unknown reader '{reader}'. Possible readers are: {', '.join(DATA_FILE_READERS)}.")
+    is_parquet_file = pathlib.Path(source).suffix == ".parquet"
+    if reader == "mmap" and is_parquet_file:
+        msg = "Reader 'mmap' supports CSV files only."
+        raise ValidationError(msg)
     if isinstance(metadata, str):
         metadata = parse_metadata(metadata)
+    limit_errors = __get_error_limit(fail_fast=fail_fast, max_errors=max_errors)
     metadata_fields = __get_fields_from_metadata(metadata)
-    report = __validate_data_against_schema(data, metadata_fields)
+    key = get_cache_key("data", hash_file(source), delimiter, metadata_fields, engine, limit_errors) if cache else None
+    report = __get_cached_report(cache, key)
+    if report is None:
+        if engine == "arrow" and is_parquet_file:
+            report = __validate_parquet_file(source, metadata_fields, limit_errors=limit_errors)
+        elif reader == "mmap":
+            report = __validate_csv_file_in_ranges(
+                source,
+                metadata_fields,
+                chunksize=chunksize,
+                delimiter=delimiter,
+                engine=engine,
+                workers=workers,
+                limit_errors=limit_errors,
+            )
+        else:
+            chunks = __read_data_chunks(source, chunksize=chunksize, delimiter=delimiter)
+            report = __validate_data_chunks_against_schema(
+                chunks,
+                metadata_fields,
+                place=str(source),
+                engine=engine,
+                workers=workers,
+                limit_errors=limit_errors,
+            )
+        if cache:
+            cache.set(key, report.to_descriptor())
     if not report.valid:
         if return_report:
             return report
@@ -312,10 +896,41 @@ def validate_oep_table_against_metadata(  # noqa: C901
     raise ValidationError(errors)
 
 
+async def validate_oep_tables_against_metadata(
+    tables: Iterable[tuple[str, str]],
+    *,
+    concurrency: int = 10,
+) -> AsyncIterator[OEPTableResult]:
+    """
+    Validate many OEP tables against metadata defined for each table on OEP concurrently.
+
+    Metadata and column definitions of tables are fetched concurrently and results are yielded as soon as they
+    arrive, thus not necessarily in order of given tables.
+
+    Parameters
+    ----------
+    tables: Iterable[tuple[str, str]]
+        Pairs of OEP schema name and table name
+    concurrency: int
+        Maximum number of tables validated at once
+
+    Yields
+    ------
+    OEPTableResult
+        Result per table, holding error (i.e. ValidationError or MetadataError) if table is invalid
+    """
+    async for result in process_oep_tables(validate_oep_table_against_metadata, tables, concurrency=concurrency):
+        yield result
+
+
 def parse_metadata(metadata_string: str) -> dict:
     """
     Parse metadata string into a dictionary.
 
+    If `orjson` is installed, it is used to parse the string and duplicate keys are detected by comparing the number
+    of keys in the string with the number of keys in the parsed metadata. If this check is not conclusive or parsing
+    fails, the string is parsed again by the standard JSON parser, which raises errors with context.
+
     Parameters
     ----------
     metadata_string: str
@@ -326,18 +941,29 @@ def parse_metadata(metadata_string: str) -> dict:
     dict
         Metadata as dictionary
     """
-
-    def dict_raise_on_duplicates(ordered_pairs: dict) -> dict:
+    orjson = __import_orjson()
+    if orjson is not None:
+        try:
+            parsed_metadata = orjson.loads(metadata_string)
+        except orjson.JSONDecodeError:
+            pass
+        else:
+            if not __may_have_duplicate_keys(metadata_string, orjson.dumps(parsed_metadata)):
+                return parsed_metadata
+
+    def dict_raise_on_duplicates(ordered_pairs: list) -> dict:
         """
         Reject duplicate keys.
 
-        From https://stackoverflow.com/a/14902564/5804947
+        Dictionary is built at once and only searched for duplicate keys if it holds less keys than pairs given.
         """
-        d = {}
-        for k, v in ordered_pairs:
-            if k in d:
-                raise ValidationError(f"Duplicate keys in metadata: '{k}'")
-            d[k] = v
+        d = dict(ordered_pairs)
+        if len(d) < len(ordered_pairs):
+            keys = set()
+            for k, _ in ordered_pairs:
+                if k in keys:
+                    raise ValidationError(f"Duplicate keys in metadata: '{k}'")
+                keys.add(k)
         return d
 
     try:
@@ -355,78 +981,1558 @@ def parse_metadata(metadata_string: str) -> dict:
         raise ValidationError(error_message) from jde
 
 
-def __validate_data_against_schema(data: pd.DataFrame, fields: dict[str, str]) -> Report:
+@cache
+def __import_orjson() -> ModuleType | None:
+    """Return `orjson` module if installed, otherwise None."""
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+
+def __may_have_duplicate_keys(metadata_string: str, serialized_metadata: bytes) -> bool:
+    """
+    Check if JSON string may hold duplicate keys, given compact serialization of the parsed string.
+
+    Each key is followed by `":` in compact serialization; within strings, the same sequence only occurs as escaped
+    quote followed by a colon, which is written the same way in both JSON texts unless it is unicode-escaped. Thus, if
+    keys are directly followed by colons in given string as well, both texts hold equally many of these sequences,
+    unless parsing has dropped duplicate keys. Otherwise, the check is not conclusive and True is returned.
+    """
+    if JSON_KEY_WHITESPACE_PATTERN.search(metadata_string):
+        return True
+    if JSON_ESCAPED_KEY_CHARACTERS_PATTERN.search(metadata_string):
+        return True
+    return metadata_string.count('":') != serialized_metadata.count(b'":')
+
+
+def __get_error_limit(*, fail_fast: bool, max_errors: int | None) -> int | None:
+    """
+    Return maximum number of errors after which data validation stops.
+
+    Parameters
+    ----------
+    fail_fast: bool
+        If set to True, validation stops at first error
+    max_errors: int | None
+        Maximum number of errors
+
+    Raises
+    ------
+    ValidationError
+        if maximum number of errors is less than 1
+
+    Returns
+    -------
+    int | None
+        Maximum number of errors or None if validation shall not stop early
+    """
+    if max_errors is not None and max_errors < 1:
+        msg = "Maximum number of errors must be at least 1."
+        raise ValidationError(msg)
+    return 1 if fail_fast else max_errors
+
+
+def __get_cached_report(cache: ValidationCache | None, key: str | None) -> Report | None:
+    """Return report cached under given key or None if no cache is given or key is not cached."""
+    descriptor = cache.get(key) if cache else None
+    if descriptor is None:
+        return None
+    from frictionless import Report
+
+    return Report.from_descriptor(descriptor)
+
+
+def __validate_data_against_schema(  # noqa: PLR0913
+    data: pd.DataFrame | pa.Table,
+    fields: dict[str, str],
+    *,
+    check_primary_key: bool = True,
+    engine: str = "frictionless",
+    workers: int = 1,
+    limit_errors: int | None = None,
+) -> Report:
     """
     Validate data against related schema definition and return frictionless report.
 
     Parameters
     ----------
-    data: pandas.DataFrame
+    data: pandas.DataFrame | pyarrow.Table
         Date to validate
     fields: dict[str, str]
         Dictionary of fields and their types to validate data with
+    check_primary_key: bool
+        If set to True, uniqueness of primary key "id" is checked
+    engine: str
+        Engine used to validate data, one of "frictionless" (default), "vectorized" or "arrow"
+    workers: int
+        Number of processes validating groups of columns in parallel
+    limit_errors: int | None
+        If set, validation stops as soon as given number of errors is found
 
     Returns
     -------
     Report
         Frictionless report of validated data
     """
+    is_arrow_table = __is_arrow_table(data)
+    ordered_fields = __order_fields(data.column_names if is_arrow_table else list(data.columns), fields)
+    if engine not in DATA_VALIDATION_ENGINES:
+        raise ValidationError(
+            f"Unknown data validation engine '{engine}'. Possible engines are: {', '.join(DATA_VALIDATION_ENGINES)}.",
+        )
+    validate = DATA_VALIDATION_ENGINES[engine]
+    if is_arrow_table and engine != "arrow":
+        data = data.to_pandas()
+    elif is_arrow_table:
+        # Arrow compute kernels use a thread pool on their own, thus tables are not split into shards
+        return validate(data, ordered_fields, check_primary_key=check_primary_key, limit_errors=limit_errors)
+    if workers > 1 and len(ordered_fields) > 1:
+        return __validate_data_in_shards(
+            data,
+            ordered_fields,
+            validate,
+            workers=workers,
+            check_primary_key=check_primary_key,
+            limit_errors=limit_errors,
+        )
+    return validate(data, ordered_fields, check_primary_key=check_primary_key, limit_errors=limit_errors)
+
+
+def __order_fields(labels: list[str], fields: dict[str, str]) -> dict[str, str]:
+    """
+    Return fields ordered like columns of data.
+
+    Raises
+    ------
+    ValidationError
+        if a field is missing in data or a column is missing in fields
+    """
     # Check if all fields oin metadata are represented in data
     for field in fields:
-        if field not in data.columns:
+        if field not in labels:
             raise ValidationError(f"Could not find column '{field}' in data.")
 
     ordered_fields = {}
-    for field in data.columns:
+    for field in labels:
         if field not in fields:
             raise ValidationError(f"Could not find field '{field}' in schema.")
         ordered_fields[field] = fields[field]
-    frictionless_fields = __map_fields_to_frictionless_fields(ordered_fields)
-    schema = Schema(fields=frictionless_fields, primary_key=["id"])
-    resource = Resource(
-        data=data,
-        profile="tabular-data-resource",
-        schema=schema,
-    )
-    report = resource.validate()
-    return report
+    return ordered_fields
 
 
-def __validate_optional_fields_in_metadata(metadata: dict, schema: dict) -> None:
+def __validate_data_with_frictionless(
+    data: pd.DataFrame,
+    fields: dict[str, str],
+    *,
+    check_primary_key: bool = True,
+    skip_errors: list[str] | None = None,
+    limit_errors: int | None = None,
+) -> Report:
     """
-    Validate optional fields in metadata dictionary based on schema. Raise warnings if optional fields are missing.
+    Validate data row by row using frictionless.
 
     Parameters
     ----------
-    metadata: dict
-        Metadata as dictionary to check optional fields
-    schema: dict
-        JSONSchema for checking optional fields
+    data: pandas.DataFrame
+        Data to validate
+    fields: dict[str, str]
+        Dictionary of fields and their types, ordered like columns in data
+    check_primary_key: bool
+        If set to True, uniqueness of primary key "id" is checked
+    skip_errors: list[str] | None
+        Frictionless error types which shall not be checked
+    limit_errors: int | None
+        If set, validation stops as soon as given number of errors is found. Otherwise, frictionless default
+        limit of errors is used.
 
     Returns
     -------
-    None
+    Report
+        Frictionless report of validated data
     """
+    from frictionless import Checklist, Resource, Schema, settings
 
-    def check_properties(sub_meta: dict, sub_schema: dict, current_path: str) -> None:
-        """Check optional fields in metadata dictionary iteratively."""
-        if "properties" not in sub_schema:
-            return
-        for field in sub_schema["properties"]:
-            if ("required" not in sub_schema or field not in sub_schema["required"]) and field not in sub_meta:
-                if current_path == "":
-                    current_path = "top level"
-                warnings.warn(f"Optional field '{field}' not found in metadata at {current_path}.", stacklevel=2)
-            if field in sub_meta:
-                new_path = field if current_path == "" else f"{current_path}.{field}"
-                check_properties(sub_meta[field], sub_schema["properties"][field], new_path)
-
-    check_properties(metadata, schema, "")
+    frictionless_fields = __map_fields_to_frictionless_fields(fields)
+    schema = Schema(fields=frictionless_fields, primary_key=["id"] if check_primary_key else [])
+    resource = Resource(
+        data=data,
+        profile="tabular-data-resource",
+        schema=schema,
+    )
+    report = resource.validate(
+        checklist=Checklist(skip_errors=skip_errors or []),
+        limit_errors=limit_errors or settings.DEFAULT_LIMIT_ERRORS,
+    )
+    return report
 
 
-def __map_fields_to_frictionless_fields(fields: dict[str, str]) -> list[Field]:
+def __validate_data_vectorized(
+    data: pd.DataFrame,
+    fields: dict[str, str],
+    *,
+    check_primary_key: bool = True,
+    skip_errors: list[str] | None = None,
+    limit_errors: int | None = None,
+) -> Report:
     """
-    Map fields to Frictionless fields.
+    Validate data column-wise using pandas/NumPy and return frictionless-compatible report.
+
+    Types of columns with numeric, boolean or datetime dtype (including nullable dtypes, i.e. "Int64") are checked at
+    once per column.
+    Columns of other dtypes (i.e. object columns holding strings) are handed over to frictionless.
+    Blank rows and uniqueness of primary key "id" are checked vectorized as well.
+    In contrast to frictionless, missing values (None, NaN, NaT) are always treated as null values.
+
+    Parameters
+    ----------
+    data: pandas.DataFrame
+        Data to validate
+    fields: dict[str, str]
+        Dictionary of fields and their types, ordered like columns in data
+    check_primary_key: bool
+        If set to True, uniqueness of primary key "id" is checked
+    skip_errors: list[str] | None
+        Frictionless error types which shall not be checked (only "blank-row" is supported)
+    limit_errors: int | None
+        If set, no further columns are checked as soon as given number of errors is found. As columns are checked
+        one after another, reported errors are not necessarily the first ones in row order.
+
+    Returns
+    -------
+    Report
+        Frictionless report of validated data
+    """
+    import numpy as np
+    from frictionless.errors import TypeError as FrictionlessTypeError
+
+    start = time.perf_counter()
+    labels = list(data.columns)
+    null_cells = data.isna()
+    # Errors are collected with row position and order within row to sort them like frictionless does
+    errors: list[tuple[int, int, Error]] = []
+
+    def cells(position: int) -> list[str]:
+        return __row_cells(data, null_cells, position)
+
+    def limit_reached() -> bool:
+        return limit_errors is not None and len(errors) >= limit_errors
+
+    remaining_fields = {}
+    for field_number, (field_name, field_type) in enumerate(fields.items(), start=1):
+        if limit_reached():
+            break
+        frictionless_field = __map_fields_to_frictionless_fields({field_name: field_type})[0]
+        invalid_cells = __find_invalid_cells(data[field_name], frictionless_field.type)
+        if invalid_cells is None:
+            remaining_fields[field_name] = field_type
+            continue
+        note = f'type is "{frictionless_field.type}/{frictionless_field.format}"'
+        for position in np.flatnonzero(invalid_cells & ~null_cells[field_name].to_numpy()).tolist():
+            row_cells = cells(position)
+            error = FrictionlessTypeError(
+                note=note,
+                cells=row_cells,
+                row_number=position + 2,
+                cell=row_cells[field_number - 1],
+                field_name=field_name,
+                field_number=field_number,
+            )
+            errors.append((position, field_number, error))
+
+    if remaining_fields and not limit_reached():
+        report = __validate_data_with_frictionless(
+            __replace_extension_nulls(data[list(remaining_fields)], null_cells),
+            remaining_fields,
+            check_primary_key=False,
+            skip_errors=["blank-row"],
+            limit_errors=limit_errors and limit_errors - len(errors),
+        )
+        errors.extend(__relocate_errors(report.tasks[0].errors, labels, cells))
+
+    if not limit_reached():
+        errors.extend(
+            __find_row_errors(
+                data,
+                null_cells,
+                check_blank_rows="blank-row" not in (skip_errors or []),
+                check_primary_key=check_primary_key,
+            ),
+        )
+    return __create_report(
+        [error for _, _, error in sorted(errors, key=lambda error: error[:2])],
+        name="memory",
+        place="<memory>",
+        labels=labels,
+        rows=len(data),
+        seconds=time.perf_counter() - start,
+        limit_errors=limit_errors,
+    )
+
+
+def __validate_data_in_shards(  # noqa: PLR0913
+    data: pd.DataFrame,
+    fields: dict[str, str],
+    validate: Callable[..., Report],
+    *,
+    workers: int,
+    check_primary_key: bool = True,
+    limit_errors: int | None = None,
+) -> Report:
+    """
+    Validate groups of columns in parallel processes and merge reports.
+
+    Fields are split into contiguous groups, one per worker, and each group is validated independently by given
+    engine. Checks spanning all columns (blank rows and primary key "id") are done once afterwards.
+
+    Parameters
+    ----------
+    data: pandas.DataFrame
+        Data to validate
+    fields: dict[str, str]
+        Dictionary of fields and their types, ordered like columns in data
+    validate: Callable[..., Report]
+        Validation engine used for each group of columns
+    workers: int
+        Number of worker processes
+    check_primary_key: bool
+        If set to True, uniqueness of primary key "id" is checked
+    limit_errors: int | None
+        If set, each group of columns is validated until given number of errors is found and only the first errors
+        (in row order) are reported
+
+    Returns
+    -------
+    Report
+        Frictionless report of validated data
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    start = time.perf_counter()
+    field_names = list(fields)
+    shard_size = -(-len(field_names) // workers)
+    shards = [field_names[i : i + shard_size] for i in range(0, len(field_names), shard_size)]
+    with ProcessPoolExecutor(max_workers=len(shards)) as executor:
+        futures = [
+            executor.submit(
+                __validate_shard,
+                validate,
+                data[shard],
+                {name: fields[name] for name in shard},
+                limit_errors,
+            )
+            for shard in shards
+        ]
+        shard_errors = [future.result() for future in futures]
+
+    null_cells = data.isna()
+    labels = list(data.columns)
+    errors = []
+    for descriptors in shard_errors:
+        errors.extend(
+            __relocate_errors(descriptors, labels, lambda position: __row_cells(data, null_cells, position)),
+        )
+    errors.extend(__find_row_errors(data, null_cells, check_blank_rows=True, check_primary_key=check_primary_key))
+    return __create_report(
+        [error for _, _, error in sorted(errors, key=lambda error: error[:2])],
+        name="memory",
+        place="<memory>",
+        labels=list(data.columns),
+        rows=len(data),
+        seconds=time.perf_counter() - start,
+        limit_errors=limit_errors,
+    )
+
+
+def __validate_shard(
+    validate: Callable[..., Report],
+    data: pd.DataFrame,
+    fields: dict[str, str],
+    limit_errors: int | None,
+) -> list[dict]:
+    """
+    Validate group of columns in worker process.
+
+    Errors are returned as descriptors, as frictionless errors do not survive pickling between processes.
+    """
+    report = validate(data, fields, check_primary_key=False, skip_errors=["blank-row"], limit_errors=limit_errors)
+    return [error.to_descriptor() for error in report.tasks[0].errors]
+
+
+def __relocate_errors(
+    errors: list[Error | dict],
+    labels: list[str],
+    row_cells: Callable[[int], list[str]],
+) -> list[tuple[int, int, Error]]:
+    """
+    Relocate cell errors found in a subset of columns to position of related column in whole data.
+
+    Parameters
+    ----------
+    errors: list[Error | dict]
+        Errors (or their descriptors) from validating a subset of columns of data
+    labels: list[str]
+        Labels (column names) of whole data
+    row_cells: Callable[[int], list[str]]
+        Function returning cells of whole data in row at given position
+
+    Returns
+    -------
+    list[tuple[int, int, Error]]
+        Errors together with their row position and field number in whole data
+    """
+    from frictionless import system
+
+    relocated_errors = []
+    for error in errors:
+        descriptor = error if isinstance(error, dict) else error.to_descriptor()
+        position = descriptor["rowNumber"] - 2
+        field_number = labels.index(descriptor["fieldName"]) + 1 if "fieldName" in descriptor else len(labels) + 1
+        descriptor["cells"] = row_cells(position)
+        if "fieldNumber" in descriptor:
+            descriptor["fieldNumber"] = field_number
+        error_class = system.select_error_class(descriptor["type"])
+        relocated_errors.append((position, field_number, error_class.from_descriptor(descriptor)))
+    return relocated_errors
+
+
+def __find_row_errors(
+    data: pd.DataFrame,
+    null_cells: pd.DataFrame,
+    *,
+    check_blank_rows: bool,
+    check_primary_key: bool,
+) -> list[tuple[int, int, Error]]:
+    """
+    Find blank rows and primary key violations at once.
+
+    Parameters
+    ----------
+    data: pandas.DataFrame
+        Data to check
+    null_cells: pandas.DataFrame
+        Mask of null cells in data
+    check_blank_rows: bool
+        If set to True, blank rows are reported
+    check_primary_key: bool
+        If set to True, missing and duplicate values in primary key "id" are reported
+
+    Returns
+    -------
+    list[tuple[int, int, Error]]
+        Errors together with their row position and order within row (blank row first, primary key last)
+    """
+    import numpy as np
+    from frictionless.errors import BlankRowError, PrimaryKeyError
+
+    errors = []
+    if check_blank_rows:
+        errors.extend(
+            (
+                position,
+                0,
+                BlankRowError(note="", cells=__row_cells(data, null_cells, position), row_number=position + 2),
+            )
+            for position in np.flatnonzero(null_cells.all(axis=1).to_numpy()).tolist()
+        )
+    if check_primary_key and "id" in data.columns:
+        errors.extend(
+            (
+                position,
+                len(data.columns) + 1,
+                PrimaryKeyError(note=note, cells=__row_cells(data, null_cells, position), row_number=position + 2),
+            )
+            for position, note in __find_primary_key_violations(data["id"])
+        )
+    return errors
+
+
+def __row_cells(data: pd.DataFrame, null_cells: pd.DataFrame, position: int) -> list[str]:
+    """Return cells of row at given position as strings, as frictionless does in its row errors."""
+    return [
+        "" if is_null else str(value)
+        for value, is_null in zip(data.iloc[position].tolist(), null_cells.iloc[position].tolist())
+    ]
+
+
+def __find_primary_key_violations(ids: pd.Series) -> list[tuple[int, str]]:
+    """
+    Find missing and duplicate primary keys at once.
+
+    Parameters
+    ----------
+    ids: pandas.Series
+        Primary key column
+
+    Returns
+    -------
+    list[tuple[int, str]]
+        Row positions violating the primary key together with a note (in frictionless wording)
+    """
+    import numpy as np
+    import pandas as pd
+
+    violations = [
+        (position, 'cells composing the primary keys are all "None"')
+        for position in np.flatnonzero(ids.isna().to_numpy()).tolist()
+    ]
+    positions = pd.Series(np.arange(len(ids)), index=ids.index)
+    previous_positions = positions.groupby(ids.to_numpy(), dropna=True).shift(1)
+    violations.extend(
+        (position, f"the same as in the row at position {previous_position + 2}")
+        for position, previous_position in zip(
+            np.flatnonzero(previous_positions.notna().to_numpy()).tolist(),
+            previous_positions.dropna().astype(int).tolist(),
+        )
+    )
+    return violations
+
+
+def __find_invalid_cells(column: pd.Series, frictionless_type: str) -> np.ndarray | None:
+    """
+    Find cells in column not matching given frictionless type by checking column dtype and values at once.
+
+    Parameters
+    ----------
+    column: pandas.Series
+        Column to check
+    frictionless_type: str
+        Frictionless type of column
+
+    Returns
+    -------
+    numpy.ndarray | None
+        Boolean mask of invalid cells (null cells have to be excluded by caller) or None if column cannot be
+        checked vectorized and has to be checked by frictionless.
+    """
+    import numpy as np
+
+    dtype = column.dtype
+    if not isinstance(dtype, np.dtype):
+        # Nullable extension dtypes (i.e. "Int64" or "boolean") are checked by their NumPy dtype
+        dtype = getattr(dtype, "numpy_dtype", None)
+    if (
+        frictionless_type not in VECTORIZED_DTYPE_KINDS
+        or not isinstance(dtype, np.dtype)
+        or dtype.kind not in "biufM"
+    ):
+        return None
+    if frictionless_type == "integer" and dtype.kind == "f":
+        # Floats are valid integers, if they have no decimal places
+        values = __to_numpy(column, dtype, np.nan)
+        with np.errstate(invalid="ignore"):
+            return ~(np.isfinite(values) & (np.floor(values) == values))
+    if frictionless_type == "date" and dtype.kind == "M":
+        # Like frictionless, datetimes are valid dates only at midnight (fractions of seconds are ignored)
+        values = __to_numpy(column, dtype, np.datetime64("NaT"))
+        return values.astype("datetime64[s]") != values.astype("datetime64[D]")
+    is_valid = dtype.kind in VECTORIZED_DTYPE_KINDS[frictionless_type]
+    return np.full(len(column), fill_value=not is_valid)
+
+
+def __to_numpy(column: pd.Series, dtype: np.dtype, na_value: object) -> np.ndarray:
+    """Return values of column as NumPy array of given dtype, null cells of extension dtypes are set to `na_value`."""
+    if column.dtype == dtype:
+        return column.to_numpy()
+    return column.to_numpy(dtype=dtype, na_value=na_value)
+
+
+def __replace_extension_nulls(data: pd.DataFrame, null_cells: pd.DataFrame) -> pd.DataFrame:
+    """Return data with null cells of extension dtype columns set to None, as frictionless may not read pd.NA."""
+    import numpy as np
+
+    labels = [
+        label for label in data.columns if not isinstance(data[label].dtype, np.dtype) and null_cells[label].any()
+    ]
+    if not labels:
+        return data
+    data = data.copy()
+    for label in labels:
+        data[label] = data[label].astype(object).where(~null_cells[label], None)
+    return data
+
+
+def __validate_data_with_arrow(
+    data: pd.DataFrame | pa.Table,
+    fields: dict[str, str],
+    *,
+    check_primary_key: bool = True,
+    skip_errors: list[str] | None = None,
+    limit_errors: int | None = None,
+) -> Report:
+    """
+    Validate Arrow table column-wise using Arrow types, null counts and compute kernels.
+
+    Columns whose Arrow type holds valid values only (i.e. integers for an integer field) are valid without reading
+    their values. Float columns of integer fields and timestamp columns of date fields are checked via compute kernels
+    on column buffers. Columns of other types (i.e. strings) are handed over to frictionless. Blank rows are only
+    searched, if every column holds nulls. As pandas data is already decoded, DataFrames are validated by the
+    vectorized engine instead.
+
+    Parameters
+    ----------
+    data: pandas.DataFrame | pyarrow.Table
+        Data to validate
+    fields: dict[str, str]
+        Dictionary of fields and their types, ordered like columns in data
+    check_primary_key: bool
+        If set to True, uniqueness of primary key "id" is checked
+    skip_errors: list[str] | None
+        Frictionless error types which shall not be checked (only "blank-row" is supported)
+    limit_errors: int | None
+        If set, no further columns are checked as soon as given number of errors is found. As columns are checked
+        one after another, reported errors are not necessarily the first ones in row order.
+
+    Returns
+    -------
+    Report
+        Frictionless report of validated data
+    """
+    if not __is_arrow_table(data):
+        return __validate_data_vectorized(
+            data,
+            fields,
+            check_primary_key=check_primary_key,
+            skip_errors=skip_errors,
+            limit_errors=limit_errors,
+        )
+    start = time.perf_counter()
+    arrow_data = ArrowData(
+        labels=data.column_names,
+        num_rows=data.num_rows,
+        types=dict(zip(data.column_names, data.schema.types)),
+        null_counts={name: column.null_count for name, column in zip(data.column_names, data.columns)},
+        read_columns=data.select,
+        row_cells=lambda position: __arrow_row_cells(data, position),
+    )
+    errors = __find_arrow_errors(
+        arrow_data,
+        fields,
+        check_blank_rows="blank-row" not in (skip_errors or []),
+        check_primary_key=check_primary_key,
+        limit_errors=limit_errors,
+    )
+    return __create_report(
+        errors,
+        name="memory",
+        place="<memory>",
+        labels=arrow_data.labels,
+        rows=arrow_data.num_rows,
+        seconds=time.perf_counter() - start,
+        limit_errors=limit_errors,
+    )
+
+
+def __validate_parquet_file(
+    source: str | pathlib.Path,
+    fields: dict[str, str],
+    *,
+    limit_errors: int | None = None,
+) -> Report:
+    """
+    Validate parquet file column-wise using its Arrow schema and column statistics.
+
+    Types and null counts are taken from the file footer, thus only columns whose values have to be checked are read
+    (see `__validate_data_with_arrow`). Null counts of row group statistics tell whether any column is free of nulls,
+    in which case there cannot be any blank rows. Values of primary key "id" are always read to find duplicates.
+    Rows are only read to report cells of errors.
+
+    Parameters
+    ----------
+    source: str | pathlib.Path
+        Path to parquet file
+    fields: dict[str, str]
+        Dictionary of fields and their types to validate data with
+    limit_errors: int | None
+        If set, no further columns are checked as soon as given number of errors is found
+
+    Raises
+    ------
+    ValidationError
+        if pyarrow is not installed
+
+    Returns
+    -------
+    Report
+        Frictionless report of validated data
+    """
+    try:
+        import pyarrow as pa
+        from pyarrow import parquet
+    except ImportError as ie:
+        msg = "Reading parquet files requires 'pyarrow' to be installed."
+        raise ValidationError(msg) from ie
+
+    start = time.perf_counter()
+    parquet_file = parquet.ParquetFile(source)
+    schema = parquet_file.schema_arrow
+    columns: dict[str, pa.ChunkedArray] = {}
+
+    def read_columns(names: list[str]) -> pa.Table:
+        missing = [name for name in names if name not in columns]
+        if missing:
+            columns.update(zip(missing, parquet_file.read(columns=missing).columns))
+        return pa.table({name: columns[name] for name in names})
+
+    row_group_sizes = [parquet_file.metadata.row_group(i).num_rows for i in range(parquet_file.num_row_groups)]
+    row_group_starts = list(itertools.accumulate(row_group_sizes, initial=0))
+
+    @cache
+    def read_row_group(index: int) -> pa.Table:
+        return parquet_file.read_row_group(index)
+
+    def row_cells(position: int) -> list[str]:
+        index = bisect.bisect_right(row_group_starts, position) - 1
+        return __arrow_row_cells(read_row_group(index), position - row_group_starts[index])
+
+    arrow_data = ArrowData(
+        labels=schema.names,
+        num_rows=parquet_file.metadata.num_rows,
+        types=dict(zip(schema.names, schema.types)),
+        null_counts=__get_parquet_null_counts(parquet_file),
+        read_columns=read_columns,
+        row_cells=row_cells,
+    )
+    errors = __find_arrow_errors(
+        arrow_data,
+        __order_fields(arrow_data.labels, fields),
+        check_blank_rows=True,
+        check_primary_key=True,
+        limit_errors=limit_errors,
+    )
+    return __create_report(
+        errors,
+        name=pathlib.Path(source).stem,
+        place=str(source),
+        labels=arrow_data.labels,
+        rows=arrow_data.num_rows,
+        seconds=time.perf_counter() - start,
+        limit_errors=limit_errors,
+    )
+
+
+def __get_parquet_null_counts(parquet_file: parquet.ParquetFile) -> dict[str, int | None]:
+    """Return null counts of columns from row group statistics, or None if statistics are missing (or nested)."""
+    metadata = parquet_file.metadata
+    null_counts: dict[str, int | None] = dict.fromkeys(parquet_file.schema_arrow.names)
+    for column in range(metadata.num_columns):
+        # Null counts of nested columns refer to their leaves, which are named by their path (i.e. "a.list.element")
+        name = metadata.schema.column(column).path
+        if name not in null_counts:
+            continue
+        statistics = [metadata.row_group(i).column(column).statistics for i in range(metadata.num_row_groups)]
+        if all(statistic is not None and statistic.has_null_count for statistic in statistics):
+            null_counts[name] = sum(statistic.null_count for statistic in statistics)
+    return null_counts
+
+
+def __find_arrow_errors(
+    data: ArrowData,
+    fields: dict[str, str],
+    *,
+    check_blank_rows: bool,
+    check_primary_key: bool,
+    limit_errors: int | None,
+) -> list[Error]:
+    """
+    Find type errors, blank rows and primary key violations in Arrow data, reading only columns needed.
+
+    Parameters
+    ----------
+    data: ArrowData
+        Data to validate
+    fields: dict[str, str]
+        Dictionary of fields and their types, ordered like columns in data
+    check_blank_rows: bool
+        If set to True, blank rows are reported
+    check_primary_key: bool
+        If set to True, missing and duplicate values in primary key "id" are reported
+    limit_errors: int | None
+        If set, no further columns are checked as soon as given number of errors is found
+
+    Returns
+    -------
+    list[Error]
+        Frictionless errors, sorted like frictionless does
+    """
+    from frictionless.errors import TypeError as FrictionlessTypeError
+    from pyarrow import compute
+
+    # Errors are collected with row position and order within row to sort them like frictionless does
+    errors: list[tuple[int, int, Error]] = []
+
+    def limit_reached() -> bool:
+        return limit_errors is not None and len(errors) >= limit_errors
+
+    remaining_fields = {}
+    for field_number, (field_name, field_type) in enumerate(fields.items(), start=1):
+        if limit_reached():
+            break
+        frictionless_field = __map_fields_to_frictionless_fields({field_name: field_type})[0]
+        check = __get_arrow_check(data.types[field_name], frictionless_field.type)
+        if check == "valid":
+            continue
+        if check == "frictionless":
+            remaining_fields[field_name] = field_type
+            continue
+        invalid_cells = __find_invalid_arrow_cells(data.read_columns([field_name]).column(0), check)
+        note = f'type is "{frictionless_field.type}/{frictionless_field.format}"'
+        for position in compute.indices_nonzero(invalid_cells).to_pylist():
+            row_cells = data.row_cells(position)
+            error = FrictionlessTypeError(
+                note=note,
+                cells=row_cells,
+                row_number=position + 2,
+                cell=row_cells[field_number - 1],
+                field_name=field_name,
+                field_number=field_number,
+            )
+            errors.append((position, field_number, error))
+
+    if remaining_fields and not limit_reached():
+        report = __validate_data_with_frictionless(
+            data.read_columns(list(remaining_fields)).to_pandas(),
+            remaining_fields,
+            check_primary_key=False,
+            skip_errors=["blank-row"],
+            limit_errors=limit_errors and limit_errors - len(errors),
+        )
+        errors.extend(__relocate_errors(report.tasks[0].errors, data.labels, data.row_cells))
+
+    if not limit_reached():
+        errors.extend(
+            __find_arrow_row_errors(data, check_blank_rows=check_blank_rows, check_primary_key=check_primary_key),
+        )
+    return [error for _, _, error in sorted(errors, key=lambda error: error[:2])]
+
+
+def __find_invalid_arrow_cells(column: pa.ChunkedArray, check: str) -> pa.ChunkedArray:
+    """Return boolean mask of invalid cells in Arrow column for given check (see `__get_arrow_check`)."""
+    from pyarrow import compute
+
+    if check == "integral":
+        is_integral = compute.and_(compute.is_finite(column), compute.equal(compute.floor(column), column))
+        return compute.invert(is_integral)
+    if check == "midnight":
+        # Like frictionless, timestamps are valid dates only at midnight (fractions of seconds are ignored)
+        return compute.not_equal(
+            compute.floor_temporal(column, unit="second"),
+            compute.floor_temporal(column, unit="day"),
+        )
+    return compute.is_valid(column)
+
+
+def __find_arrow_row_errors(
+    data: ArrowData,
+    *,
+    check_blank_rows: bool,
+    check_primary_key: bool,
+) -> list[tuple[int, int, Error]]:
+    """
+    Find blank rows and primary key violations in Arrow data (see `__find_row_errors`).
+
+    A column without nulls rules out blank rows, thus columns are only read if every column may hold nulls.
+    """
+    from frictionless.errors import BlankRowError, PrimaryKeyError
+    from pyarrow import compute
+
+    errors = []
+    if check_blank_rows and 0 not in data.null_counts.values():
+        table = data.read_columns(data.labels)
+        blank_rows = reduce(compute.and_, (compute.is_null(column) for column in table.columns))
+        errors.extend(
+            (position, 0, BlankRowError(note="", cells=data.row_cells(position), row_number=position + 2))
+            for position in compute.indices_nonzero(blank_rows).to_pylist()
+        )
+    if check_primary_key and "id" in data.labels:
+        ids = data.read_columns(["id"]).column(0).to_pandas()
+        errors.extend(
+            (
+                position,
+                len(data.labels) + 1,
+                PrimaryKeyError(note=note, cells=data.row_cells(position), row_number=position + 2),
+            )
+            for position, note in __find_primary_key_violations(ids)
+        )
+    return errors
+
+
+def __get_arrow_check(arrow_type: pa.DataType, frictionless_type: str) -> str:  # noqa: PLR0911
+    """
+    Return how values of Arrow type have to be checked for given frictionless type.
+
+    Returns
+    -------
+    str
+        "valid" if all values are valid, "invalid" if all (non-null) values are invalid, "integral" if values have to
+        be checked for decimal places, "midnight" if values have to be checked for a time of day and "frictionless" if
+        values have to be checked by frictionless
+    """
+    from pyarrow import types
+
+    if frictionless_type not in ARROW_TYPE_PREDICATES:
+        return "frictionless"
+    is_dictionary = types.is_dictionary(arrow_type)
+    if is_dictionary:
+        arrow_type = arrow_type.value_type
+    if any(getattr(types, predicate)(arrow_type) for predicate in ARROW_TYPE_PREDICATES[frictionless_type]):
+        return "valid"
+    if is_dictionary:
+        return "frictionless"
+    if frictionless_type == "integer" and types.is_floating(arrow_type):
+        return "integral"
+    if frictionless_type == "date" and types.is_timestamp(arrow_type):
+        return "midnight"
+    if any(getattr(types, predicate)(arrow_type) for predicate in ARROW_PRIMITIVE_PREDICATES):
+        return "invalid"
+    return "frictionless"
+
+
+def __arrow_row_cells(table: pa.Table, position: int) -> list[str]:
+    """Return cells of row at given position as strings, as frictionless does in its row errors."""
+    return ["" if column[position].as_py() is None else str(column[position].as_py()) for column in table.columns]
+
+
+def __is_arrow_table(data: object) -> bool:
+    """Return True if data is an Arrow table; pyarrow is not imported, as there cannot be a table without it."""
+    pyarrow = sys.modules.get("pyarrow")
+    return pyarrow is not None and isinstance(data, pyarrow.Table)
+
+
+def __read_data_chunks(source: str | pathlib.Path, *, chunksize: int, delimiter: str) -> Iterator[pd.DataFrame]:
+    """
+    Read data file in chunks of rows.
+
+    Parameters
+    ----------
+    source: str | pathlib.Path
+        Path to CSV or parquet file
+    chunksize: int
+        Number of rows per chunk
+    delimiter: str
+        Delimiter used in CSV file
+
+    Raises
+    ------
+    ValidationError
+        if parquet file shall be read but pyarrow is not installed
+
+    Yields
+    ------
+    pandas.DataFrame
+        Chunk of data
+    """
+    import pandas as pd
+
+    path = pathlib.Path(source)
+    if path.suffix == ".parquet":
+        try:
+            from pyarrow import parquet
+        except ImportError as ie:
+            msg = "Reading parquet files requires 'pyarrow' to be installed."
+            raise ValidationError(msg) from ie
+        for batch in parquet.ParquetFile(path).iter_batches(batch_size=chunksize):
+            yield batch.to_pandas()
+        return
+    with pd.read_csv(path, delimiter=delimiter, chunksize=chunksize) as reader:
+        yield from reader
+
+
+def __validate_csv_file_in_ranges(  # noqa: PLR0913
+    source: str | pathlib.Path,
+    fields: dict[str, str],
+    *,
+    chunksize: int,
+    delimiter: str,
+    engine: str = "frictionless",
+    workers: int = 1,
+    limit_errors: int | None = None,
+) -> Report:
+    """
+    Validate CSV file in byte ranges of whole rows, which are parsed and validated by worker processes.
+
+    File is memory-mapped and split on line breaks into ranges of about `chunksize` rows (estimated from the first
+    rows). Workers get path and offsets of a range only and map the file on their own, thus data is not copied
+    through the parent process. Only values of primary key "id" are sent back to check uniqueness across ranges.
+    At most two ranges per worker are in flight at once and no further ranges are validated once the error limit is
+    reached. Cells holding line breaks are not supported.
+
+    Parameters
+    ----------
+    source: str | pathlib.Path
+        Path to CSV file
+    fields: dict[str, str]
+        Dictionary of fields and their types to validate data with
+    chunksize: int
+        Approximate number of rows per range
+    delimiter: str
+        Delimiter used in CSV file
+    engine: str
+        Engine used to validate data, one of "frictionless" (default), "vectorized" or "arrow"
+    workers: int
+        Number of worker processes. If set to 1, ranges are validated in current process.
+    limit_errors: int | None
+        If set, no further ranges are validated as soon as given number of errors is found
+
+    Returns
+    -------
+    Report
+        Frictionless report of validated data
+    """
+    import pandas as pd
+    from frictionless import system
+    from frictionless.errors import PrimaryKeyError
+
+    start = time.perf_counter()
+    header = read_header(source)
+    labels = pd.read_csv(io.BytesIO(header), delimiter=delimiter, nrows=0).columns.tolist()
+    __order_fields(labels, fields)
+    first_rows = read_range(source, len(header), len(header) + RANGE_ESTIMATION_BYTES)
+    row_bytes = len(first_rows) / max(first_rows.count(b"\n"), 1)
+    ranges = split_file(source, chunk_bytes=max(int(chunksize * row_bytes), 1))
+
+    errors = []
+    primary_keys: dict = {}
+    row_offset = 0
+    arguments = (labels, delimiter, fields, engine, limit_errors)
+    for (range_start, range_end), (rows, descriptors, ids) in zip(
+        ranges,
+        __iter_range_results(source, ranges, arguments, workers=workers),
+    ):
+        for descriptor in descriptors:
+            if "rowNumber" not in descriptor:
+                # Errors not related to a row (i.e. header errors) would repeat for every range
+                if row_offset == 0:
+                    errors.append(system.select_error_class(descriptor["type"]).from_descriptor(descriptor))
+                continue
+            descriptor["rowNumber"] += row_offset
+            errors.append(system.select_error_class(descriptor["type"]).from_descriptor(descriptor))
+        violations = __find_primary_key_violations_of_chunk(ids or [], primary_keys, row_offset)
+        if violations:
+            # Cells are only needed for violating rows, thus range is parsed again in this rare case
+            data = __read_csv_range(source, range_start, range_end, labels=labels, delimiter=delimiter)
+            null_cells = data.isna()
+            errors.extend(
+                PrimaryKeyError(
+                    note=note,
+                    cells=__row_cells(data, null_cells, row_number - row_offset - 2),
+                    row_number=row_number,
+                )
+                for row_number, note in violations
+            )
+        row_offset += rows
+        if limit_errors is not None and len(errors) >= limit_errors:
+            break
+    return __create_report(
+        errors,
+        name=pathlib.Path(source).stem,
+        place=str(source),
+        labels=labels,
+        rows=row_offset,
+        seconds=time.perf_counter() - start,
+        limit_errors=limit_errors,
+    )
+
+
+def __iter_range_results(
+    source: str | pathlib.Path,
+    ranges: list[tuple[int, int]],
+    arguments: tuple,
+    *,
+    workers: int,
+) -> Iterator[tuple[int, list[dict], list | None]]:
+    """Yield results of validating byte ranges in order, keeping at most two ranges per worker in flight."""
+    if workers == 1:
+        for range_start, range_end in ranges:
+            yield __validate_csv_range(source, range_start, range_end, *arguments)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    range_iterator = iter(ranges)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: deque[Future] = deque()
+
+        def submit_next() -> None:
+            next_range = next(range_iterator, None)
+            if next_range is not None:
+                pending.append(executor.submit(__validate_csv_range, source, *next_range, *arguments))
+
+        for _ in range(2 * workers):
+            submit_next()
+        while pending:
+            future = pending.popleft()
+            submit_next()
+            yield future.result()
+
+
+def __validate_csv_range(  # noqa: PLR0913, PLR0917
+    source: str | pathlib.Path,
+    start: int,
+    end: int,
+    labels: list[str],
+    delimiter: str,
+    fields: dict[str, str],
+    engine: str,
+    limit_errors: int | None,
+) -> tuple[int, list[dict], list | None]:
+    """
+    Parse and validate byte range of CSV file in worker process.
+
+    Returns number of rows, errors as descriptors (with row numbers relative to range) and values of primary key.
+    """
+    data = __read_csv_range(source, start, end, labels=labels, delimiter=delimiter)
+    report = __validate_data_against_schema(
+        data,
+        fields,
+        check_primary_key=False,
+        engine=engine,
+        limit_errors=limit_errors,
+    )
+    ids = data["id"].tolist() if "id" in data.columns else None
+    return len(data), [error.to_descriptor() for error in report.tasks[0].errors], ids
+
+
+def __read_csv_range(
+    source: str | pathlib.Path,
+    start: int,
+    end: int,
+    *,
+    labels: list[str],
+    delimiter: str,
+) -> pd.DataFrame:
+    """Parse byte range of CSV file holding whole rows (without header)."""
+    import pandas as pd
+
+    return pd.read_csv(io.BytesIO(read_range(source, start, end)), delimiter=delimiter, header=None, names=labels)
+
+
+def __validate_data_chunks_against_schema(  # noqa: PLR0913
+    chunks: Iterable[pd.DataFrame],
+    fields: dict[str, str],
+    *,
+    place: str,
+    engine: str = "frictionless",
+    workers: int = 1,
+    limit_errors: int | None = None,
+) -> Report:
+    """
+    Validate chunks of data against related schema definition and aggregate errors into one frictionless report.
+
+    Primary key "id" is checked across all chunks; all other checks are done per chunk by frictionless.
+
+    Parameters
+    ----------
+    chunks: Iterable[pandas.DataFrame]
+        Chunks of data to validate
+    fields: dict[str, str]
+        Dictionary of fields and their types to validate data with
+    place: str
+        Place of data, shown in report
+    engine: str
+        Engine used to validate data, one of "frictionless" (default), "vectorized" or "arrow"
+    workers: int
+        Number of processes validating groups of columns in parallel
+    limit_errors: int | None
+        If set, no further chunks are validated as soon as given number of errors is found
+
+    Returns
+    -------
+    Report
+        Frictionless report of validated data
+    """
+    start = time.perf_counter()
+    errors = []
+    labels = []
+    primary_keys: dict = {}
+    row_offset = 0
+    for chunk in chunks:
+        report = __validate_data_against_schema(
+            chunk,
+            fields,
+            check_primary_key=False,
+            engine=engine,
+            workers=workers,
+            limit_errors=limit_errors and limit_errors - len(errors),
+        )
+        labels = report.tasks[0].labels
+        for error in report.tasks[0].errors:
+            row_number = getattr(error, "row_number", None)
+            if row_number is None:
+                # Errors not related to a row (i.e. header errors) would repeat for every chunk
+                if row_offset == 0:
+                    errors.append(error)
+                continue
+            errors.append(type(error).from_descriptor({**error.to_descriptor(), "rowNumber": row_number + row_offset}))
+        errors.extend(__check_primary_key_of_chunk(chunk, primary_keys, row_offset))
+        row_offset += len(chunk)
+        if limit_errors is not None and len(errors) >= limit_errors:
+            break
+    return __create_report(
+        errors,
+        name=pathlib.Path(place).stem,
+        place=place,
+        labels=labels,
+        rows=row_offset,
+        seconds=time.perf_counter() - start,
+        limit_errors=limit_errors,
+    )
+
+
+def __create_report(  # noqa: PLR0913
+    errors: list[Error],
+    *,
+    name: str,
+    place: str,
+    labels: list[str],
+    rows: int,
+    seconds: float,
+    limit_errors: int | None = None,
+) -> Report:
+    """
+    Create frictionless report holding a single task with given errors.
+
+    If an error limit is given and reached, errors exceeding the limit are dropped and a warning is added,
+    as frictionless does.
+
+    Parameters
+    ----------
+    errors: list[Error]
+        Frictionless errors found during validation
+    name: str
+        Name of validated resource
+    place: str
+        Place of validated resource
+    labels: list[str]
+        Labels (column names) of validated resource
+    rows: int
+        Number of validated rows
+    seconds: float
+        Validation time
+    limit_errors: int | None
+        Maximum number of errors held by report
+
+    Returns
+    -------
+    Report
+        Frictionless report
+    """
+    from frictionless import Report, ReportTask
+
+    seconds = round(seconds, 3)
+    task_warnings = []
+    if limit_errors is not None and len(errors) >= limit_errors:
+        errors = errors[:limit_errors]
+        task_warnings.append(f"reached error limit: {limit_errors}")
+    task = ReportTask(
+        valid=not errors,
+        name=name,
+        type="table",
+        place=place,
+        labels=labels,
+        stats={
+            "errors": len(errors),
+            "warnings": len(task_warnings),
+            "seconds": seconds,
+            "fields": len(labels),
+            "rows": rows,
+        },
+        warnings=task_warnings,
+        errors=errors,
+    )
+    return Report.from_validation(time=seconds, tasks=[task])
+
+
+def __check_primary_key_of_chunk(chunk: pd.DataFrame, primary_keys: dict, row_offset: int) -> list[PrimaryKeyError]:
+    """
+    Check uniqueness of primary key "id" in chunk, taking primary keys of previous chunks into account.
+
+    Parameters
+    ----------
+    chunk: pandas.DataFrame
+        Chunk of data
+    primary_keys: dict
+        Primary keys found so far, mapped to their row number. Keys of current chunk are added.
+    row_offset: int
+        Number of rows in previous chunks
+
+    Returns
+    -------
+    list[PrimaryKeyError]
+        Errors for missing or duplicate primary keys
+    """
+    from frictionless.errors import PrimaryKeyError
+
+    if "id" not in chunk.columns:
+        return []
+
+    null_cells = chunk.isna()
+    return [
+        PrimaryKeyError(
+            note=note,
+            cells=__row_cells(chunk, null_cells, row_number - row_offset - 2),
+            row_number=row_number,
+        )
+        for row_number, note in __find_primary_key_violations_of_chunk(chunk["id"].tolist(), primary_keys, row_offset)
+    ]
+
+
+def __find_primary_key_violations_of_chunk(ids: list, primary_keys: dict, row_offset: int) -> list[tuple[int, str]]:
+    """
+    Find missing and duplicate primary keys of chunk, taking primary keys of previous chunks into account.
+
+    Parameters
+    ----------
+    ids: list
+        Primary keys of chunk
+    primary_keys: dict
+        Primary keys found so far, mapped to their row number. Keys of current chunk are added.
+    row_offset: int
+        Number of rows in previous chunks
+
+    Returns
+    -------
+    list[tuple[int, str]]
+        Row numbers violating the primary key together with a note (in frictionless wording)
+    """
+    import pandas as pd
+
+    violations = []
+    # Row numbers start with 2, as first row holds the header
+    for row_number, key in enumerate(ids, start=row_offset + 2):
+        if pd.isna(key):
+            violations.append((row_number, 'cells composing the primary keys are all "None"'))
+        elif key in primary_keys:
+            violations.append((row_number, f"the same as in the row at position {primary_keys[key]}"))
+        else:
+            primary_keys[key] = row_number
+    return violations
+
+
+def __get_metadata_report(
+    metadata: dict,
+    metadata_version: str,
+    check_license: bool,  # noqa: FBT001
+    check_formats: bool,  # noqa: FBT001
+    cache: ValidationCache | None,
+) -> MetadataReport:
+    """Return report holding all problems of metadata, using cached report if available."""
+    key = get_cache_key("metadata-report", metadata, metadata_version, check_license, check_formats) if cache else None
+    report = cache.get(key) if cache else None
+    if report is not None:
+        return MetadataReport(**report)
+    report = revalidate_metadata(metadata, check_license=check_license, check_formats=check_formats).to_report()
+    if cache:
+        cache.set(key, report.to_dict())
+    return report
+
+
+def __validate_metadata(
+    metadata: dict,
+    metadata_version: str,
+    check_license: bool,  # noqa: FBT001
+    check_formats: bool,  # noqa: FBT001
+) -> list[str]:
+    """
+    Validate metadata against related metadata schema and return messages for missing optional fields.
+
+    Raises
+    ------
+    ValidationError
+        if metadata is invalid against related metadata schema
+    LicenseError
+        if a license is invalid
+    """
+    validator = get_metadata_validator(metadata_version, check_formats=check_formats)
+    error = jsonschema.exceptions.best_match(validator.iter_errors(metadata))
+    if error is not None:
+        raise ValidationError(f"Error validating metadata against related metadata schema: {error.message}") from error
+    if check_license:
+        license.validate_oemetadata_licenses(metadata)
+    return __find_missing_optional_fields(metadata, get_optional_field_paths(metadata_version))
+
+
+def __find_missing_optional_fields(node: object, optional_fields: dict[tuple, tuple], prefix: tuple = ()) -> list[dict]:
+    """
+    Find optional fields missing in metadata (or metadata unit) using given table of optional field paths.
+
+    Parameters
+    ----------
+    node: object
+        Metadata or metadata unit to check optional fields
+    optional_fields: dict[tuple, tuple]
+        Paths of objects (relative to node, "*" matching all items of an array) mapped to names of optional fields
+    prefix: tuple
+        Path of node within metadata, used for JSON paths of results
+
+    Returns
+    -------
+    list[dict]
+        JSON path of object, name and message for each missing optional field
+    """
+    missing = []
+    for parent, fields in optional_fields.items():
+        targets = [(prefix, node)]
+        for key in parent:
+            if key == "*":
+                targets = [
+                    ((*path, i), item)
+                    for path, value in targets
+                    if isinstance(value, list)
+                    for i, item in enumerate(value)
+                ]
+            else:
+                targets = [
+                    ((*path, key), value[key])
+                    for path, value in targets
+                    if isinstance(value, dict) and key in value
+                ]
+        for path, value in targets:
+            if not isinstance(value, dict):
+                continue
+            json_path = __to_json_path(path)
+            missing.extend(
+                {
+                    "path": json_path,
+                    "field": field,
+                    "message": f"Optional field '{field}' not found in metadata at {json_path}.",
+                }
+                for field in fields
+                if field not in value
+            )
+    return missing
+
+
+def __get_metadata_unit_validators(
+    metadata_version: str,
+    *,
+    check_formats: bool = False,
+) -> dict[int, jsonschema.protocols.Validator]:
+    """
+    Return validators for metadata units of given metadata version, mapped by length of unit path.
+
+    Validators are derived from the validator of the whole metadata schema, whereby nested units are cut out of the
+    schema of their parent unit (i.e. resources of top level schema are not validated at top level). Metadata schemas
+    only nest properties and items, thus validating units separately finds the same errors as validating at once.
+    """
+    key = (metadata_version, check_formats)
+    if key not in METADATA_UNIT_VALIDATORS:
+        validator = get_metadata_validator(metadata_version, check_formats=check_formats)
+        resource_schema = validator.schema["properties"]["resources"]["items"]
+        field_schema = resource_schema["properties"]["schema"]["properties"]["fields"]["items"]
+        METADATA_UNIT_VALIDATORS[key] = {
+            0: validator.evolve(schema=__replace_subschema(validator.schema, ("properties", "resources", "items"))),
+            2: validator.evolve(
+                schema=__replace_subschema(resource_schema, ("properties", "schema", "properties", "fields", "items")),
+            ),
+            5: validator.evolve(schema=field_schema),
+        }
+    return METADATA_UNIT_VALIDATORS[key]
+
+
+def __get_metadata_unit_optional_field_paths(metadata_version: str) -> dict[int, dict[tuple, tuple]]:
+    """Return optional field tables relative to metadata units, mapped by length of unit path."""
+    if metadata_version not in METADATA_UNIT_OPTIONAL_FIELD_PATHS:
+        tables = {length: {} for length in METADATA_UNIT_PATTERNS}
+        for parent, fields in get_optional_field_paths(metadata_version).items():
+            length = max(
+                length for length, pattern in METADATA_UNIT_PATTERNS.items() if parent[: len(pattern)] == pattern
+            )
+            tables[length][parent[length:]] = fields
+        METADATA_UNIT_OPTIONAL_FIELD_PATHS[metadata_version] = tables
+    return METADATA_UNIT_OPTIONAL_FIELD_PATHS[metadata_version]
+
+
+def __replace_subschema(schema: dict, keys: tuple[str, ...]) -> dict:
+    """Return copy of schema with subschema at given keys replaced by an empty (always valid) schema."""
+    if not keys:
+        return {}
+    return {**schema, keys[0]: __replace_subschema(schema[keys[0]], keys[1:])}
+
+
+def __iter_metadata_units(metadata: dict) -> Iterator[tuple[tuple, object]]:
+    """Yield path and content of all units (top level, resources and fields) in metadata."""
+    yield (), metadata
+    resources = metadata.get("resources")
+    if not isinstance(resources, list):
+        return
+    for i, resource in enumerate(resources):
+        yield ("resources", i), resource
+        schema = resource.get("schema") if isinstance(resource, dict) else None
+        fields = schema.get("fields") if isinstance(schema, dict) else None
+        if isinstance(fields, list):
+            for j, field in enumerate(fields):
+                yield ("resources", i, "schema", "fields", j), field
+
+
+def __get_unit_path(tokens: tuple) -> tuple:
+    """Return path of unit owning given path in metadata."""
+    if len(tokens) >= 5 and tokens[0] == "resources" and tokens[2:4] == ("schema", "fields"):  # noqa: PLR2004
+        return tokens[:5]
+    if len(tokens) >= 2 and tokens[0] == "resources":  # noqa: PLR2004
+        return tokens[:2]
+    return ()
+
+
+def __get_patch_changes(operation: dict) -> list[tuple[tuple, bool]]:
+    """
+    Return changed paths of JSON patch operation, each with flag whether array items may have been shifted.
+
+    Path tokens holding array indices are converted to integers. Operation "test" does not change anything.
+    """
+    pointers = {"add": ["path"], "remove": ["path"], "replace": ["path"], "move": ["from", "path"], "copy": ["path"]}
+    changes = []
+    for key in pointers.get(operation["op"], []):
+        tokens = tuple(
+            int(token) if token.isdigit() else token.replace("~1", "/").replace("~0", "~")
+            for token in operation[key].split("/")[1:]
+        )
+        changes.append((tokens, key == "from" or operation["op"] != "replace"))
+    return changes
+
+
+def __is_unit_affected(path: tuple, tokens: tuple, *, structural: bool) -> bool:
+    """Check if unit at path is affected by change at given path tokens."""
+    if structural and tokens and __get_unit_path(tokens) == tokens:
+        # Resource or field has been added or removed, thus parent unit and following units are affected
+        array, index = tokens[:-1], tokens[-1]
+        if path == __get_unit_path(array):
+            return True
+        return path[: len(array)] == array and isinstance(index, int) and path[len(array)] >= index
+    return path == __get_unit_path(tokens) or path[: len(tokens)] == tokens
+
+
+def __validate_metadata_unit(
+    unit: object,
+    path: tuple,
+    validator: jsonschema.protocols.Validator,
+    optional_fields: dict[tuple, tuple],
+    *,
+    check_license: bool,
+) -> MetadataUnitResult:
+    """Validate single metadata unit against its schema and check its licenses and optional fields."""
+    errors = list(validator.iter_errors(unit))
+    for error in errors:
+        error.path.extendleft(reversed(path))
+    license_errors = []
+    if check_license and not errors:
+        license_errors = [
+            (__to_json_path((*path, "licenses") if i is None else (*path, "licenses", i)), error)
+            for i, error in license.find_resource_license_errors(unit.get("licenses"), path[1] if path else 0)
+        ]
+    warnings_ = __find_missing_optional_fields(unit, optional_fields, path)
+    return MetadataUnitResult(errors, license_errors, warnings_)
+
+
+def __to_json_path(path: tuple) -> str:
+    """Return JSON path (i.e. "$.resources[0].licenses") of path within metadata."""
+    return "$" + "".join(f"[{token}]" if isinstance(token, int) else f".{token}" for token in path)
+
+
+def __map_fields_to_frictionless_fields(fields: dict[str, str]) -> list[Field]:
+    """
+    Map fields to Frictionless fields.
 
     Parameters
     ----------
@@ -443,17 +2549,19 @@ def __map_fields_to_frictionless_fields(fields: dict[str, str]) -> list[Field]:
     list[Field]
         List of frictionless Fields
     """
+    from frictionless import system
+
     frictionless_fields = []
     for field_name, field_type in fields.items():
         if field_type.endswith("[]"):
             # This indicates an array field
-            frictionless_fields.append(ArrayField(name=field_name))
+            frictionless_fields.append(system.select_field_class("array")(name=field_name))
             continue
         if field_type not in FRICTIONLESS_FIELD_MAPPING:
             raise ValidationError(
                 f"Field '{field_name} with type '{field_type}' cannot be mapped to Frictionless fields",
             )
-        f_field = FRICTIONLESS_FIELD_MAPPING[field_type]
+        f_field = system.select_field_class(FRICTIONLESS_FIELD_MAPPING[field_type])
         frictionless_fields.append(f_field(name=field_name))
     return frictionless_fields
 
@@ -474,10 +2582,10 @@ def __get_fields_from_oep_table(oep_table: str, oep_schema: str) -> dict[str, st
     dict[str, str]
         Dictionary of table fields and related types.
     """
-    response = requests.get(f"{OEP_URL}/api/v0/schema/{oep_schema}/tables/{oep_table}/columns", timeout=90)
-    if response.status_code != requests.codes.ok:
-        raise ValidationError(f"Could not find table '{oep_table}' in schema '{oep_schema}' on OEP.")
-    table_fields = response.json()
+    try:
+        table_fields = get_oep_client().get_table_columns(oep_table, oep_schema)
+    except OEPError:
+        raise ValidationError(f"Could not find table '{oep_table}' in schema '{oep_schema}' on OEP.") from None
     return {name: field["data_type"] for name, field in table_fields.items()}
 
 
@@ -513,3 +2621,10 @@ def __get_fields_from_metadata(metadata: dict) -> dict[str, str]:
         msg = "No fields found in resource schema."
         raise ValidationError(msg)
     return {field["name"]: field["type"] for field in metadata["resources"][0]["schema"]["fields"]}
+
+
+DATA_VALIDATION_ENGINES: dict[str, Callable] = {
+    "frictionless": __validate_data_with_frictionless,
+    "vectorized": __validate_data_vectorized,
+    "arrow": __validate_data_with_arrow,
+}
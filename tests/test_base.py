@@ -1,5 +1,7 @@
 """Tests for OMIs `base` package."""
 
+import json
+
 import pytest
 
 from omi import base, validation
@@ -27,3 +29,38 @@ def deactivate_test_metadata_from_oep_empty():
         match="Metadata from 'model_draft.bnetza_eeg_anlagenstammdaten_wind_classification' is empty.",
     ):
         base.get_metadata_from_oep_table("bnetza_eeg_anlagenstammdaten_wind_classification")
+
+
+def test_metadata_specification_is_cached():
+    """Test that specifications are loaded once and template/example are returned as independent copies."""
+    specification = base.get_metadata_specification("OEMetadata-2.0")
+    assert base.get_metadata_specification("OEMetadata-2.0") is specification
+    assert specification.schema is specification.schema
+    assert isinstance(specification.schema, dict)
+    assert json.loads(json.dumps(specification.schema)) == specification.schema
+    with pytest.raises(AttributeError):
+        specification.schema = {}
+
+    template = specification.template
+    template["name"] = "changed"
+    assert specification.template["name"] != "changed"
+    assert specification.example is not specification.example
+
+
+def test_metadata_specification_loads_lazily():
+    """Test that template and example are only loaded on access."""
+    calls = []
+
+    def load_template() -> dict:
+        calls.append("template")
+        return {"name": None}
+
+    specification = base.MetadataSpecification(schema={}, template=load_template)
+    assert calls == []
+    assert specification.template == {"name": None}
+    assert specification.template == {"name": None}
+    assert calls == ["template"]
+    assert specification.example is None
+    assert specification == base.MetadataSpecification(schema={}, template={"name": None})
+    assert specification != base.MetadataSpecification(schema={}, template={"name": "other"})
+    assert repr(specification) == "MetadataSpecification(schema={}, template={'name': None}, example=None)"
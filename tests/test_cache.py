@@ -0,0 +1,89 @@
+"""Tests for validation result cache of OMI."""
+
+import json
+import pathlib
+
+import pandas as pd
+import pytest
+
+from omi import base, cache, license, validation
+
+TEST_VALIDATION_DATA_PATH = pathlib.Path(__file__).parent / "test_data" / "validation"
+
+
+def test_cache_tiers_and_eviction(tmp_path: pathlib.Path):
+    """Test LRU eviction in memory and on disk and that disk tier is shared between cache instances."""
+    result_cache = cache.ValidationCache(tmp_path / "cache.sqlite", max_entries=2, max_disk_entries=3)
+    for i in range(4):
+        result_cache.set(f"key_{i}", {"result": i})
+    assert result_cache.get("key_3") == {"result": 3}
+
+    other_cache = cache.ValidationCache(tmp_path / "cache.sqlite")
+    assert other_cache.get("key_0") is None
+    assert [other_cache.get(f"key_{i}") for i in range(1, 4)] == [{"result": i} for i in range(1, 4)]
+
+    memory_cache = cache.ValidationCache(max_entries=2)
+    for i in range(3):
+        memory_cache.set(f"key_{i}", i)
+    assert memory_cache.get("key_0") is None
+    assert memory_cache.get("key_2") == 2
+
+    result_cache.clear()
+    assert cache.ValidationCache(tmp_path / "cache.sqlite").get("key_3") is None
+
+
+def test_cache_key_is_canonical():
+    """Test that key order does not change cache key, but content does."""
+    key = cache.get_cache_key("metadata", {"a": 1, "b": [1, 2]})
+    assert cache.get_cache_key("metadata", {"b": [1, 2], "a": 1}) == key
+    assert cache.get_cache_key("metadata", {"a": 1, "b": [2, 1]}) != key
+    assert cache.get_cache_key("data", {"a": 1, "b": [1, 2]}) != key
+
+    data = pd.DataFrame({"id": [1, 2], "value": [0.5, 1.5]})
+    assert cache.hash_dataframe(data) == cache.hash_dataframe(data.copy())
+    assert cache.hash_dataframe(data) != cache.hash_dataframe(data.astype({"value": "float32"}))
+    assert cache.hash_dataframe(pd.DataFrame({"array": [[1, 2], [3]]})) != cache.hash_dataframe(data)
+
+
+def test_cached_metadata_validation(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch):
+    """Test that cached metadata results are reused without validating again, including errors."""
+    metadata = base.get_metadata_specification("OEMetadata-2.0").example
+    invalid_metadata = base.get_metadata_specification("OEMetadata-2.0").example
+    invalid_metadata["resources"][0]["licenses"][0].update(name="unknown license", title="")
+    validation.validate_metadata(metadata, cache=cache.ValidationCache(tmp_path / "cache.sqlite"))
+    with pytest.raises(license.LicenseError):
+        validation.validate_metadata(invalid_metadata, cache=cache.ValidationCache(tmp_path / "cache.sqlite"))
+
+    def fail(*_args: object, **_kwargs: object) -> None:
+        raise AssertionError
+
+    monkeypatch.setattr(validation, "get_metadata_validator", fail)
+    result_cache = cache.ValidationCache(tmp_path / "cache.sqlite")
+    validation.validate_metadata(json.dumps(metadata, indent=4), cache=result_cache)
+    with pytest.raises(license.LicenseError, match="was not found in the SPDX licenses list"):
+        validation.validate_metadata(invalid_metadata, cache=result_cache)
+    with pytest.raises(AssertionError):
+        validation.validate_metadata(metadata, check_license=False, cache=result_cache)
+
+
+def test_cached_data_validation(tmp_path: pathlib.Path):
+    """Test that cached data reports equal reports of uncached validation."""
+    with (TEST_VALIDATION_DATA_PATH / "metadata_for_data_csv.json").open("r") as f:
+        metadata = json.load(f)
+    data_file = TEST_VALIDATION_DATA_PATH / "invalid_data" / "invalid_datatype.csv"
+    data = pd.read_csv(data_file, delimiter=";")
+    expected_report = validation.validate_data_against_metadata(data, metadata)
+
+    result_cache = cache.ValidationCache(tmp_path / "cache.sqlite")
+    for _ in range(2):
+        report = validation.validate_data_against_metadata(data, metadata, cache=result_cache)
+        assert report.flatten(["rowNumber", "type"]) == expected_report.flatten(["rowNumber", "type"])
+        report = validation.validate_data_file_against_metadata(data_file, metadata, cache=result_cache)
+        assert report.flatten(["rowNumber", "type"]) == expected_report.flatten(["rowNumber", "type"])
+        with pytest.raises(validation.ValidationError, match="type-error"):
+            validation.validate_data_against_metadata(data, metadata, return_report=False, cache=result_cache)
+    assert len(result_cache._ValidationCache__memory) == 2  # noqa: SLF001
+
+    valid_data = pd.read_csv(TEST_VALIDATION_DATA_PATH / "data.csv", delimiter=";")
+    assert validation.validate_data_against_metadata(valid_data, metadata, cache=result_cache) is None
+    assert validation.validate_data_against_metadata(valid_data, metadata, cache=result_cache) is None
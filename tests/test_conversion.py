@@ -62,3 +62,87 @@ def test_invalid_conversion():
     metadata = {"metaMetadata": {"metadataVersion": "OEP-1.5.2"}}
     with pytest.raises(conversion.ConversionError, match="No conversion chain found from OEP-1.5.2 to OEP-1.5.0."):
         conversion.convert_metadata(metadata, "OEP-1.5.0")
+
+
+@pytest.mark.parametrize(("workers", "ordered"), [(1, True), (2, True), (2, False)])
+def test_batch_conversion(workers: int, ordered: bool):  # noqa: FBT001
+    """Test batch conversion collects errors per document and keeps order if requested."""
+    metadata_152 = omi.base.get_metadata_specification("OEP-1.5.2").example
+    metadata_160 = omi.base.get_metadata_specification("OEP-1.6.0").example
+    invalid_metadata = {"metaMetadata": {}}
+    metadatas = [metadata_152, invalid_metadata, metadata_160] * 3
+
+    results = list(
+        conversion.convert_metadata_batch(
+            metadatas,
+            "OEMetadata-2.0",
+            workers=workers,
+            chunksize=2,
+            ordered=ordered,
+        ),
+    )
+
+    assert len(results) == len(metadatas)
+    if ordered:
+        assert [result.index for result in results] == list(range(len(metadatas)))
+    results = sorted(results, key=lambda result: result.index)
+    for result in results:
+        if result.index % 3 == 1:
+            assert result.metadata is None
+            assert isinstance(result.error, base.MetadataError)
+        else:
+            assert result.error is None
+            assert base.get_metadata_version(result.metadata) == "OEMetadata-2.0"
+    assert results[0].metadata == conversion.convert_metadata(metadata_152, "OEMetadata-2.0")
+
+
+def test_conversion_keeps_input_and_entries_independent():
+    """Test that conversion does not modify input and that added list entries do not share state."""
+    metadata = omi.base.get_metadata_specification("OEP-1.6.0").example
+    metadata["sources"].append({"title": "second source", "licenses": [{"name": "ODbL-1.0"}]})
+    original = omi.base.copy_metadata(metadata)
+
+    converted_metadata = conversion.convert_metadata(metadata, "OEMetadata-2.0")
+    assert metadata == original
+
+    sources = converted_metadata["resources"][0]["sources"]
+    assert sources[-1]["title"] == "second source"
+    assert sources[-1]["sourceLicenses"][0]["name"] == "ODbL-1.0"
+    assert sources[0]["sourceLicenses"][0]["name"] == original["sources"][0]["licenses"][0]["name"]
+    assert sources[-1]["sourceLicenses"] is not sources[0]["sourceLicenses"]
+
+
+def test_conversion_from_oep_160_to_200_creates_independent_entries():
+    """Test that list entries created during conversion v1.6.0 -> v2.0 do not share nested containers."""
+    metadata_schema_160 = omi.base.get_metadata_specification("OEP-1.6.0").example
+    resource = conversion.convert_metadata(metadata_schema_160, "OEMetadata-2.0")["resources"][0]
+    entries = (
+        (resource["contributors"], "roles"),
+        (resource["sources"], "authors"),
+        (resource["sources"], "sourceLicenses"),
+        (resource["schema"]["fields"], "isAbout"),
+        (resource["schema"]["fields"], "valueReference"),
+    )
+    for entry_list, key in entries:
+        assert len(entry_list) > 1
+        expected = base.copy_metadata(entry_list[0][key])
+        entry_list[1][key].append("modified")
+        assert entry_list[0][key] == expected
+
+
+def test_conversion_graph_uses_shortest_chain():
+    """Test that conversion graph finds shortest conversion chains and updates them on registration."""
+    graph = conversion.ConversionGraph()
+    graph.register("a", "b", lambda md: md)
+    graph.register("b", "c", lambda md: md)
+    graph.register("c", "d", lambda md: md)
+    assert graph.get_chain("a", "d") == ("a", "b", "c", "d")
+
+    graph.register("b", "d", lambda md: md)
+    assert graph.get_chain("a", "d") == ("a", "b", "d")
+
+    del graph[("b", "d")]
+    del graph[("c", "d")]
+    assert len(graph) == 2
+    with pytest.raises(conversion.ConversionError, match="No conversion chain found from a to d."):
+        graph.get_chain("a", "d")
@@ -1,5 +1,6 @@
 """Tests for validating data via OMI."""
 
+import datetime as dt
 import json
 import pathlib
 
@@ -110,3 +111,340 @@ def test_invalid_arguments_to_validation_function():
         validation.validate_data(pd.DataFrame(), metadata={"a": "a"}, oep_table="a")
     with pytest.raises(validation.ValidationError, match="Cannot validate data against both metadata and OEP table."):
         validation.validate_data(pd.DataFrame(), metadata={"a": "a"}, oep_schema="a")
+
+
+def test_data_file_validation_in_chunks():
+    """Test streaming validation of data files, including primary key and row numbers across chunks."""
+    validation_path = pathlib.Path(__file__).parent / "test_data" / "validation"
+    with (validation_path / "metadata_for_data_csv.json").open("r") as f:
+        metadata = json.load(f)
+
+    assert validation.validate_data_file_against_metadata(validation_path / "data.csv", metadata, chunksize=1) is None
+
+    report = validation.validate_data_file_against_metadata(
+        validation_path / "invalid_data" / "duplicate_primary_keys.csv",
+        metadata,
+        chunksize=1,
+    )
+    assert not report.valid
+    assert report.tasks[0].stats["rows"] == 2
+    errors = report.tasks[0].errors
+    assert [(error.type, error.row_number) for error in errors] == [("primary-key", 3)]
+    assert errors[0].note == "the same as in the row at position 2"
+
+    invalid_datatype_file = validation_path / "invalid_data" / "invalid_datatype.csv"
+    report = validation.validate_data_file_against_metadata(invalid_datatype_file, metadata, chunksize=1)
+    invalid_data = pd.read_csv(invalid_datatype_file, delimiter=";")
+    expected_report = validation.validate_data_against_metadata(invalid_data, metadata)
+    assert [(error.type, error.row_number) for error in report.tasks[0].errors] == [
+        (error.type, error.row_number) for error in expected_report.tasks[0].errors
+    ]
+    with pytest.raises(validation.ValidationError, match="type-error"):
+        validation.validate_data_file_against_metadata(invalid_datatype_file, metadata, return_report=False)
+
+
+def test_data_file_validation_of_parquet_file(tmp_path: pathlib.Path):
+    """Test streaming validation of parquet files."""
+    pytest.importorskip("pyarrow")
+    validation_path = pathlib.Path(__file__).parent / "test_data" / "validation"
+    with (validation_path / "metadata_for_data_csv.json").open("r") as f:
+        metadata = json.load(f)
+    parquet_file = tmp_path / "data.parquet"
+    pd.read_csv(validation_path / "data.csv", delimiter=";").to_parquet(parquet_file)
+    assert validation.validate_data_file_against_metadata(parquet_file, metadata, chunksize=1) is None
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_data_file_validation_in_byte_ranges(workers: int, tmp_path: pathlib.Path):
+    """Test that validating memory-mapped byte ranges reports the same errors as validating chunks."""
+    validation_path = pathlib.Path(__file__).parent / "test_data" / "validation"
+    with (validation_path / "metadata_for_data_csv.json").open("r") as f:
+        metadata = json.load(f)
+    for data_file in [validation_path / "data.csv", *sorted((validation_path / "invalid_data").glob("*.csv"))]:
+        reports = []
+        for reader in validation.DATA_FILE_READERS:
+            try:
+                report = validation.validate_data_file_against_metadata(
+                    data_file,
+                    metadata,
+                    chunksize=1,
+                    workers=workers,
+                    reader=reader,
+                )
+            except validation.ValidationError as ve:
+                report = str(ve)
+            reports.append(report)
+        if not isinstance(reports[0], Report):
+            assert reports[1] == reports[0]
+            continue
+        assert reports[1].flatten(["rowNumber", "type", "note", "cells"]) == reports[0].flatten(
+            ["rowNumber", "type", "note", "cells"],
+        )
+        assert reports[1].tasks[0].stats["rows"] == reports[0].tasks[0].stats["rows"]
+
+    metadata = {
+        "resources": [{"schema": {"fields": [{"name": "id", "type": "bigint"}, {"name": "value", "type": "integer"}]}}],
+    }
+    data_file = tmp_path / "data.csv"
+    pd.DataFrame({"id": range(10), "value": ["a"] * 10}).to_csv(data_file, sep=";", index=False)
+    report = validation.validate_data_file_against_metadata(
+        data_file,
+        metadata,
+        chunksize=2,
+        workers=workers,
+        max_errors=3,
+        reader="mmap",
+    )
+    assert [error.row_number for error in report.tasks[0].errors] == [2, 3, 4]
+
+    with pytest.raises(validation.ValidationError, match="Unknown reader 'arrow'"):
+        validation.validate_data_file_against_metadata(data_file, metadata, reader="arrow")
+    with pytest.raises(validation.ValidationError, match="supports CSV files only"):
+        validation.validate_data_file_against_metadata(tmp_path / "data.parquet", metadata, reader="mmap")
+
+
+def test_vectorized_data_validation():
+    """Test that vectorized engine reports the same errors as frictionless for example files."""
+    validation_path = pathlib.Path(__file__).parent / "test_data" / "validation"
+    with (validation_path / "metadata_for_data_csv.json").open("r") as f:
+        metadata = json.load(f)
+
+    for data_file in ("data.csv", "invalid_data/invalid_datatype.csv", "invalid_data/duplicate_primary_keys.csv"):
+        data = pd.read_csv(validation_path / data_file, delimiter=";")
+        reports = [
+            validation.validate_data_against_metadata(data, metadata, engine=engine)
+            for engine in ("frictionless", "vectorized")
+        ]
+        if reports[0] is None:
+            assert reports[1] is None
+            continue
+        assert [error.message for error in reports[0].tasks[0].errors] == [
+            error.message for error in reports[1].tasks[0].errors
+        ]
+
+
+def test_vectorized_data_validation_of_numeric_columns():
+    """Test vectorized type and primary key checks."""
+    metadata = {
+        "resources": [
+            {
+                "schema": {
+                    "fields": [
+                        {"name": "id", "type": "bigint"},
+                        {"name": "value", "type": "integer"},
+                        {"name": "share", "type": "double precision"},
+                        {"name": "name", "type": "text"},
+                    ],
+                },
+            },
+        ],
+    }
+    data = pd.DataFrame(
+        {"id": [1, 2, 2, 4], "value": [1, 2.5, 3, None], "share": [0.1, 0.2, True, 0.4], "name": ["a", "b", "c", 4]},
+    )
+    report = validation.validate_data(data, metadata=metadata, return_report=True, engine="vectorized")
+    assert [(error.type, error.row_number, getattr(error, "field_name", None)) for error in report.tasks[0].errors] == [
+        ("type-error", 3, "value"),
+        ("type-error", 4, "share"),
+        ("primary-key", 4, None),
+        ("type-error", 5, "name"),
+    ]
+    with pytest.raises(validation.ValidationError, match="Unknown data validation engine 'unknown'."):
+        validation.validate_data(data, metadata=metadata, engine="unknown")
+
+
+def test_vectorized_data_validation_of_date_columns():
+    """Test that vectorized engine accepts datetimes for date fields only at midnight, like frictionless."""
+    fields = [{"name": "id", "type": "integer"}, {"name": "day", "type": "date"}]
+    metadata = {"resources": [{"schema": {"fields": fields}}]}
+    data = pd.DataFrame(
+        {
+            "id": [1, 2, 3, 4],
+            "day": pd.to_datetime(
+                ["2020-01-01", "2020-01-02 12:00", "2020-01-03 00:01", "2020-01-04 00:00:00.5"],
+                format="ISO8601",
+            ),
+        },
+    )
+    reports = [
+        validation.validate_data(data, metadata=metadata, return_report=True, engine=engine)
+        for engine in ("frictionless", "vectorized")
+    ]
+    errors = [
+        [(error.type, error.row_number, error.field_name) for error in report.tasks[0].errors] for report in reports
+    ]
+    assert errors[0] == errors[1] == [("type-error", 3, "day"), ("type-error", 4, "day")]
+
+
+@pytest.mark.parametrize(
+    ("field_type", "values", "expected_rows"),
+    [
+        ("integer", pd.array([1, None, 3], dtype="Int64"), []),
+        ("integer", pd.array([1.0, None, 3.5], dtype="Float64"), [4]),
+        ("float", pd.array([1.5, None, 3], dtype="Float64"), []),
+        ("boolean", pd.array([True, None, False], dtype="boolean"), []),
+        ("datetime", pd.array([None, 2, None], dtype="Int64"), [3]),
+    ],
+)
+def test_data_validation_of_nullable_dtypes(
+    field_type: str,
+    values: pd.api.extensions.ExtensionArray,
+    expected_rows: list[int],
+):
+    """Test that all engines treat missing values of nullable pandas dtypes as null values, like frictionless."""
+    fields = [{"name": "id", "type": "integer"}, {"name": "value", "type": field_type}]
+    metadata = {"resources": [{"schema": {"fields": fields}}]}
+    data = pd.DataFrame({"id": [1, 2, 3], "value": values})
+    for engine, workers in (("frictionless", 1), ("vectorized", 1), ("arrow", 1), ("vectorized", 2)):
+        report = validation.validate_data(data, metadata=metadata, return_report=True, engine=engine, workers=workers)
+        errors = [] if report is None else report.tasks[0].errors
+        assert [(error.type, error.row_number) for error in errors] == [("type-error", row) for row in expected_rows]
+
+
+@pytest.mark.parametrize("engine", ["frictionless", "vectorized"])
+def test_data_validation_sharded_by_columns(engine: str):
+    """Test that validating groups of columns in parallel gives same errors as validating all columns at once."""
+    validation_path = pathlib.Path(__file__).parent / "test_data" / "validation"
+    with (validation_path / "metadata_for_data_csv.json").open("r") as f:
+        metadata = json.load(f)
+
+    for data_file in ("data.csv", "invalid_data/invalid_datatype.csv", "invalid_data/duplicate_primary_keys.csv"):
+        data = pd.read_csv(validation_path / data_file, delimiter=";")
+        reports = [
+            validation.validate_data_against_metadata(data, metadata, engine=engine, workers=workers)
+            for workers in (1, 3)
+        ]
+        if reports[0] is None:
+            assert reports[1] is None
+            continue
+        assert [error.message for error in reports[0].tasks[0].errors] == [
+            error.message for error in reports[1].tasks[0].errors
+        ]
+
+
+@pytest.mark.parametrize("engine", ["frictionless", "vectorized"])
+def test_data_validation_with_error_limit(engine: str, tmp_path: pathlib.Path):
+    """Test that validation stops once error limit is reached."""
+    metadata = {
+        "resources": [{"schema": {"fields": [{"name": "id", "type": "bigint"}, {"name": "value", "type": "integer"}]}}],
+    }
+    data = pd.DataFrame({"id": range(10), "value": ["a"] * 10})
+
+    report = validation.validate_data(data, metadata=metadata, return_report=True, engine=engine, max_errors=3)
+    assert [error.row_number for error in report.tasks[0].errors] == [2, 3, 4]
+    assert report.tasks[0].warnings == ["reached error limit: 3"]
+    report = validation.validate_data(data, metadata=metadata, return_report=True, engine=engine, fail_fast=True)
+    assert len(report.tasks[0].errors) == 1
+    with pytest.raises(validation.ValidationError, match="Maximum number of errors must be at least 1."):
+        validation.validate_data(data, metadata=metadata, engine=engine, max_errors=0)
+
+    data_file = tmp_path / "data.csv"
+    data.to_csv(data_file, sep=";", index=False)
+    report = validation.validate_data_file_against_metadata(
+        data_file,
+        metadata,
+        chunksize=2,
+        engine=engine,
+        max_errors=3,
+    )
+    assert [error.row_number for error in report.tasks[0].errors] == [2, 3, 4]
+    assert report.tasks[0].stats["rows"] == 4
+
+
+def test_arrow_data_validation(tmp_path: pathlib.Path):
+    """Test that arrow engine reports the same errors as frictionless for Arrow tables and parquet files."""
+    pa = pytest.importorskip("pyarrow")
+    from pyarrow import parquet
+
+    validation_path = pathlib.Path(__file__).parent / "test_data" / "validation"
+    with (validation_path / "metadata_for_data_csv.json").open("r") as f:
+        metadata = json.load(f)
+
+    for data_file in ("data.csv", "invalid_data/invalid_datatype.csv", "invalid_data/duplicate_primary_keys.csv"):
+        data = pd.read_csv(validation_path / data_file, delimiter=";")
+        table = pa.Table.from_pandas(data, preserve_index=False)
+        parquet.write_table(table, tmp_path / "data.parquet", row_group_size=2)
+        reports = [
+            validation.validate_data_against_metadata(data, metadata, engine="frictionless"),
+            validation.validate_data_against_metadata(table, metadata, engine="arrow"),
+            validation.validate_data_file_against_metadata(tmp_path / "data.parquet", metadata, engine="arrow"),
+        ]
+        if reports[0] is None:
+            assert reports[1:] == [None, None]
+            continue
+        messages = [error.message for error in reports[0].tasks[0].errors]
+        assert [error.message for error in reports[1].tasks[0].errors] == messages
+        assert [error.message for error in reports[2].tasks[0].errors] == messages
+
+
+def test_arrow_data_validation_of_date_columns():
+    """Test that arrow engine accepts timestamps for date fields only at midnight, like frictionless."""
+    pa = pytest.importorskip("pyarrow")
+
+    fields = [{"name": "id", "type": "integer"}, {"name": "day", "type": "date"}]
+    metadata = {"resources": [{"schema": {"fields": fields}}]}
+    days = pa.array(["2020-01-01", "2020-01-02T12:00", None, "2020-01-04T00:00:00.5"]).cast(pa.timestamp("us"))
+    # UTC midnight is 1 am in Berlin
+    for timezone, invalid_rows in ((None, [3]), ("Europe/Berlin", [2, 3, 5])):
+        table = pa.table({"id": [1, 2, 3, 4], "day": days.cast(pa.timestamp("us", tz=timezone))})
+        data = table.to_pandas().astype({"day": object}).replace({pd.NaT: None})
+        reports = [
+            validation.validate_data_against_metadata(data, metadata, engine="frictionless"),
+            validation.validate_data_against_metadata(table, metadata, engine="arrow"),
+        ]
+        assert [error.row_number for error in reports[1].tasks[0].errors] == invalid_rows
+        assert [error.message for error in reports[1].tasks[0].errors] == [
+            error.message for error in reports[0].tasks[0].errors
+        ]
+    table = pa.table({"id": [1, 2], "day": [dt.date(2020, 1, 1), None]})
+    assert validation.validate_data_against_metadata(table, metadata, engine="arrow") is None
+
+
+def test_arrow_data_validation_reads_only_needed_columns(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch):
+    """Test arrow type checks and that columns valid by type and statistics are not read from parquet file."""
+    pa = pytest.importorskip("pyarrow")
+    from pyarrow import parquet
+
+    metadata = {
+        "resources": [
+            {
+                "schema": {
+                    "fields": [
+                        {"name": "id", "type": "bigint"},
+                        {"name": "value", "type": "integer"},
+                        {"name": "share", "type": "double precision"},
+                        {"name": "name", "type": "text"},
+                    ],
+                },
+            },
+        ],
+    }
+    table = pa.table(
+        {"id": [1, 2, 2, 4], "value": [1, 2.5, 3, None], "share": [0.1, 0.2, None, 0.4], "name": ["a", "b", "c", "d"]},
+    )
+    parquet.write_table(table, tmp_path / "data.parquet", row_group_size=3)
+    read_columns = []
+    read = parquet.ParquetFile.read
+
+    def record_read(self: parquet.ParquetFile, columns: list[str] | None = None, **kwargs: object) -> pa.Table:
+        read_columns.append(columns)
+        return read(self, columns=columns, **kwargs)
+
+    monkeypatch.setattr(parquet.ParquetFile, "read", record_read)
+    report = validation.validate_data_file_against_metadata(tmp_path / "data.parquet", metadata, engine="arrow")
+    assert [(error.type, error.row_number, getattr(error, "field_name", None)) for error in report.tasks[0].errors] == [
+        ("type-error", 3, "value"),
+        ("primary-key", 4, None),
+    ]
+    assert read_columns == [["value"], ["id"]]
+    assert validation.validate_data(table, metadata=metadata, engine="arrow", return_report=True).flatten(
+        ["rowNumber", "type"],
+    ) == report.flatten(["rowNumber", "type"])
+
+    blank_rows = pa.table({"id": [1, None], "value": [1, None], "share": [True, None], "name": ["a", None]})
+    report = validation.validate_data(blank_rows, metadata=metadata, engine="arrow", return_report=True)
+    assert [(error.type, error.row_number) for error in report.tasks[0].errors] == [
+        ("type-error", 2),
+        ("blank-row", 3),
+        ("primary-key", 3),
+    ]
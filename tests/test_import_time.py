@@ -0,0 +1,44 @@
+"""Tests for import time of OMI modules."""
+
+import subprocess
+import sys
+
+# Budget for cumulative import time of `omi.validation` in microseconds (heavy dependencies took ~800 ms alone)
+IMPORT_TIME_BUDGET = 400_000
+LAZY_DEPENDENCIES = (
+    "pandas",
+    "numpy",
+    "pyarrow",
+    "frictionless",
+    "requests",
+    "orjson",
+    "asyncio",
+    "concurrent.futures.process",
+)
+
+
+def test_heavy_dependencies_are_imported_lazily():
+    """Test that importing validation module does not import heavy dependencies nor loads license table."""
+    code = (
+        "import sys, omi.validation, omi.license; "
+        f"print([name for name in {LAZY_DEPENDENCIES!r} if name in sys.modules]); "
+        "print(omi.license.get_license_index.cache_info().currsize)"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)  # noqa: S603
+    assert result.stdout.split("\n")[:2] == ["[]", "0"]
+
+
+def test_import_time_budget():
+    """Test that import time of validation module stays within budget."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import omi.validation"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    import_times = {
+        line.split("|")[2].strip(): int(line.split("|")[1])
+        for line in result.stderr.splitlines()
+        if line.split("|")[1].strip().isdigit()
+    }
+    assert import_times["omi.validation"] < IMPORT_TIME_BUDGET
@@ -1,7 +1,11 @@
 """Tests for `inspection` module of OMI."""
 
+import datetime as dt
+import io
 import pathlib
 
+import pytest
+
 from omi import inspection
 
 CSV_DATA_FILE = pathlib.Path(__file__).parent / "test_data" / "inspection" / "data.csv"
@@ -34,3 +38,256 @@ def test_inspection():
     assert metadata["resources"][0]["schema"]["fields"][6]["type"] == "object"
     assert metadata["resources"][0]["schema"]["fields"][7]["type"] == "date"
     assert metadata["resources"][0]["schema"]["fields"][8]["type"] == "boolean"
+
+
+def test_sampled_inspection(tmp_path: pathlib.Path):
+    """Test that field types are inferred from sampled rows depending on sampling method."""
+    data_file = tmp_path / "data.csv"
+    with data_file.open("w") as f:
+        f.write("id;value;tags\n")
+        for i in range(5000):
+            f.write(f"{i};{i if i < 3500 else i + 0.5};{'[]' if i < 2500 else '[1, 2]'}\n")
+
+    def inferred_types(**kwargs: object) -> list[str]:
+        metadata = inspection.infer_metadata(str(data_file), "OEP", **kwargs)
+        return [field["type"] for field in metadata["resources"][0]["schema"]["fields"]]
+
+    assert inferred_types(sample_size=100) == ["integer", "integer", "array"]
+    assert inferred_types(sample_size=100, sampling="stratified") == ["integer", "float", "array integer"]
+    assert inferred_types(sample_size=1000, sampling="reservoir") == ["integer", "float", "array integer"]
+
+    with pytest.raises(inspection.InspectionError, match="Unknown sampling method 'random'"):
+        inspection.infer_metadata(str(data_file), "OEP", sampling="random")
+    with CSV_DATA_FILE.open("r") as f, pytest.raises(inspection.InspectionError, match="require data to be given as"):
+        inspection.infer_metadata(f, "OEP", sampling="stratified")
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_inspection_of_memory_mapped_ranges(tmp_path: pathlib.Path, workers: int):
+    """Test that reservoir sampling of memory-mapped byte ranges draws distinct rows from the whole file."""
+    data_file = tmp_path / "data.csv"
+    with data_file.open("w") as f:
+        f.write("id;value\n")
+        for i in range(5000):
+            f.write(f"{i};{i if i < 4000 else i + 0.5}\n")
+
+    sample, complete = getattr(inspection, "__sample_reservoir_in_ranges")(str(data_file), 1000, workers=workers)
+    ids = [int(row.split(b";")[0]) for row in sample.splitlines()[1:]]
+    assert len(ids) == len(set(ids)) == 1000
+    assert any(i < 2500 for i in ids) and any(i >= 2500 for i in ids)  # noqa: PT018
+    assert not complete
+    assert getattr(inspection, "__sample_reservoir_in_ranges")(str(data_file), 1000, workers=workers)[0] == sample
+    sample, complete = getattr(inspection, "__sample_reservoir_in_ranges")(str(data_file), 10000, workers=workers)
+    assert sample.count(b"\n") == 5001
+    assert complete
+
+    metadata = inspection.infer_metadata(
+        str(data_file),
+        "OEP",
+        sample_size=1000,
+        sampling="reservoir",
+        reader="mmap",
+        workers=workers,
+    )
+    assert [field["type"] for field in metadata["resources"][0]["schema"]["fields"]] == ["integer", "float"]
+    with pytest.raises(inspection.InspectionError, match="Unknown reader 'pandas'"):
+        inspection.infer_metadata(str(data_file), "OEP", reader="pandas")
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_directory_inspection(tmp_path: pathlib.Path, workers: int):
+    """Test that each CSV file in directory becomes a resource named after it and that failing files are reported."""
+    (tmp_path / "scenario").mkdir()
+    (tmp_path / "capacities.csv").write_text("id;capacity\n1;2.5\n2;3\n")
+    (tmp_path / "scenario" / "demand.csv").write_text("region;value\nBE;1\nBB;2\n")
+    (tmp_path / "notes.txt").write_text("not a CSV file")
+
+    metadata = inspection.infer_metadata_from_directory(tmp_path, "OEP", pattern="**/*.csv", workers=workers)
+    assert [resource["name"] for resource in metadata["resources"]] == ["capacities", "scenario_demand"]
+    assert metadata["resources"][0]["schema"]["fields"] == [
+        {"name": "id", "type": "integer", "nullable": False},
+        {"name": "capacity", "type": "float", "nullable": False},
+    ]
+    assert metadata["resources"][1]["schema"]["fields"][0] == {"name": "region", "type": "string", "nullable": False}
+
+    sources = [tmp_path / "capacities.csv", tmp_path / "missing.csv"]
+    results = list(inspection.infer_metadata_batch(sources, "OEP", workers=workers))
+    assert results[0].metadata["resources"][0]["name"] == "capacities"
+    assert isinstance(results[1].error, inspection.InspectionError)
+    with pytest.raises(inspection.InspectionError, match="Got 1 names for 2 sources."):
+        list(inspection.infer_metadata_batch(sources, "OEP", workers=workers, names=["capacities"]))
+
+    with pytest.raises(inspection.InspectionError, match="No files matching"):
+        inspection.infer_metadata_from_directory(tmp_path, "OEP", pattern="*.json")
+
+
+@pytest.mark.parametrize(
+    ("sample", "expected"),
+    [
+        (CSV_DATA_FILE.read_bytes(), inspection.CsvDialect(";", '"', "utf-8", header=True)),
+        (b'id,name\n1,"Berlin, Mitte"\n2,Potsdam\n', inspection.CsvDialect(",", '"', "utf-8", header=True)),
+        (b"id\tvalue\n1\t2.5\n", inspection.CsvDialect("\t", '"', "utf-8", header=True)),
+        (b"id|text\n1|'a|b'\n2|'c'\n", inspection.CsvDialect("|", "'", "utf-8", header=True)),
+        (b"\xef\xbb\xbf1,2.5\n2,3.5\n", inspection.CsvDialect(",", '"', "utf-8-sig", header=False)),
+        ("Ort;Wert\nK\xf6ln;1\nM\xfcnchen;2\n".encode("cp1252"), inspection.CsvDialect(";", '"', "cp1252")),
+    ],
+)
+def test_sniff_dialect(sample: bytes, expected: inspection.CsvDialect):
+    """Test detection of delimiter, quote char, encoding and header, including JSON cells holding delimiters."""
+    assert inspection.sniff_dialect(sample) == expected
+
+
+def test_inspection_of_sniffed_dialect(tmp_path: pathlib.Path):
+    """Test that sniffed dialect is used to infer fields and is recorded in metadata, reading each byte once."""
+    data_file = tmp_path / "data.csv"
+    rows = (b'%d,"R%d, Mitte",%d.5\n' % (i, i, i) for i in range(3000))
+    data_file.write_bytes(b"id,region,value\n" + b"".join(rows))
+
+    class CountingFile(io.FileIO):
+        bytes_read = 0
+
+        def readinto(self, buffer: bytearray) -> int:
+            size = super().readinto(buffer)
+            CountingFile.bytes_read += size
+            return size
+
+    with io.BufferedReader(CountingFile(data_file)) as f:
+        metadata = inspection.infer_metadata(f, "OEP")
+    # Sample does not hold all rows, thus fields are not set to be not nullable
+    assert metadata["resources"][0]["schema"]["fields"] == [
+        {"name": "id", "type": "integer"},
+        {"name": "region", "type": "string"},
+        {"name": "value", "type": "float"},
+    ]
+    assert metadata["resources"][0]["dialect"]["delimiter"] == ","
+    assert metadata["resources"][0]["encoding"] == "UTF-8"
+    assert CountingFile.bytes_read <= inspection.SNIFF_SIZE < data_file.stat().st_size
+
+
+def test_column_profiles(tmp_path: pathlib.Path):
+    """Test that types are refined and statistics collected from sampled cells and applied to metadata template."""
+    data_file = tmp_path / "data.csv"
+    data_file.write_text(
+        "region;id;capacity;share;timestamp;day;active;details;values\n"
+        'BE;1;3000000000;0.5;2024-01-01T00:00:00;2024-01-01;true;{"a": 1};[1, 2.5]\n'
+        'BB;2;1;0.123456789;2024-01-01T01:00:00+01:00;;false;[1];[]\n'
+        "BE;3;2;;2024-01-02 00:00:00;2023-12-31;;{};[3]\n",
+    )
+    profiles = inspection.profile_data(str(data_file))
+    assert [(profile.name, profile.type) for profile in profiles] == [
+        ("region", "string"),
+        ("id", "integer"),
+        ("capacity", "bigint"),
+        ("share", "double precision"),
+        ("timestamp", "datetime"),
+        ("day", "date"),
+        ("active", "boolean"),
+        ("details", "json"),
+        ("values", "array float"),
+    ]
+    assert profiles[1] == inspection.ColumnProfile("id", "integer", 3, 0, 1, 3, 3)
+    assert (profiles[0].null_count, profiles[0].cardinality) == (0, 2)
+    assert (profiles[3].null_count, profiles[3].minimum, profiles[3].maximum) == (1, 0.123456789, 0.5)
+    assert (profiles[4].minimum, profiles[4].maximum) == ("2024-01-01T00:00:00+00:00", "2024-01-02T00:00:00+00:00")
+    assert (profiles[5].minimum, profiles[5].maximum) == ("2023-12-31", "2024-01-01")
+
+    resource = inspection.infer_metadata(str(data_file), "OEP")["resources"][0]
+    assert [field["nullable"] for field in resource["schema"]["fields"]] == [
+        profile.nullable for profile in profiles
+    ] == [False, False, False, True, False, True, True, False, False]
+    assert resource["schema"]["primaryKey"] == ["id"]
+    assert resource["temporal"]["timeseries"][0]["start"] == "2023-12-31"
+    assert resource["temporal"]["timeseries"][0]["end"] == "2024-01-02T00:00:00+00:00"
+
+
+@pytest.mark.parametrize("sampling", ["head", "stratified", "reservoir"])
+def test_sampled_statistics_of_file_larger_than_sample(tmp_path: pathlib.Path, sampling: str):
+    """Test that fields are only set not nullable and primary key is only set if sample holds all rows."""
+    data_file = tmp_path / "data.csv"
+    rows = [f"{i};{'' if i == 0 else i};{'' if i == 15 else i}" for i in range(20)]
+    data_file.write_text("id;value;late\n" + "\n".join(rows) + "\n")
+
+    resource = inspection.infer_metadata(str(data_file), "OEP", sample_size=10, sampling=sampling)["resources"][0]
+    assert resource["schema"]["fields"][0] == {"name": "id", "type": "integer"}
+    assert resource["schema"]["primaryKey"] == [""]
+    if sampling == "head":
+        assert resource["schema"]["fields"][1:] == [
+            {"name": "value", "type": "integer", "nullable": True},
+            {"name": "late", "type": "integer"},
+        ]
+
+    resource = inspection.infer_metadata(str(data_file), "OEP", sample_size=21, sampling=sampling)["resources"][0]
+    assert resource["schema"]["fields"] == [
+        {"name": "id", "type": "integer", "nullable": False},
+        {"name": "value", "type": "integer", "nullable": True},
+        {"name": "late", "type": "integer", "nullable": True},
+    ]
+    assert resource["schema"]["primaryKey"] == ["id"]
+
+
+@pytest.mark.parametrize("sampling", ["head", "stratified", "reservoir"])
+def test_sampled_statistics_of_uneven_rows(tmp_path: pathlib.Path, sampling: str):
+    """Test that statistics only cover all rows if sampling read every row, regardless of number of sampled rows."""
+    data_file = tmp_path / "data.csv"
+    rows = [f"{i};{'' if i == 50 else 'short'}" for i in range(80)] + [f"{i};{'long' * 50}" for i in range(80, 90)]
+    data_file.write_text("id;value\n" + "\n".join(rows) + "\n")
+
+    resource = inspection.infer_metadata(str(data_file), "OEP", sample_size=100, sampling=sampling)["resources"][0]
+    if sampling == "stratified":
+        # Sections are spaced by bytes, thus most of the short rows are skipped
+        assert resource["schema"]["fields"] == [{"name": "id", "type": "integer"}, {"name": "value", "type": "string"}]
+        assert resource["schema"]["primaryKey"] == [""]
+    else:
+        assert resource["schema"]["fields"] == [
+            {"name": "id", "type": "integer", "nullable": False},
+            {"name": "value", "type": "string", "nullable": True},
+        ]
+        assert resource["schema"]["primaryKey"] == ["id"]
+
+
+def test_inspection_of_parquet_file(tmp_path: pathlib.Path):
+    """Test that field types and statistics of parquet files are taken from their Arrow schema and footer."""
+    pa = pytest.importorskip("pyarrow")
+    from pyarrow import parquet
+
+    table = pa.table(
+        {
+            "id": pa.array([1, 2], pa.int32()),
+            "value": [0.5, None],
+            "region": pa.array(["BE", "BB"]).dictionary_encode(),
+            "values": [[1.5], []],
+            "flags": [[True], [False]],
+            "details": [{"a": 1}, {"a": 2}],
+            "day": pa.array([dt.date(2024, 12, 31), dt.date(2024, 1, 1)]),
+        },
+    )
+    parquet.write_table(table, tmp_path / "data.parquet")
+    metadata = inspection.infer_metadata(str(tmp_path / "data.parquet"), "OEP", name="data")
+    assert metadata["resources"][0]["name"] == "data"
+    assert metadata["resources"][0]["schema"]["fields"] == [
+        {"name": "id", "type": "integer", "nullable": False},
+        {"name": "value", "type": "double precision", "nullable": True},
+        {"name": "region", "type": "string", "nullable": False},
+        {"name": "values", "type": "array float", "nullable": True},
+        {"name": "flags", "type": "array", "nullable": True},
+        {"name": "details", "type": "object", "nullable": True},
+        {"name": "day", "type": "date", "nullable": False},
+    ]
+    assert metadata["resources"][0]["temporal"]["timeseries"][0]["start"] == "2024-01-01"
+    assert metadata["resources"][0]["temporal"]["timeseries"][0]["end"] == "2024-12-31"
+
+    table_metadata = inspection.infer_metadata(table, "OEP")
+    assert [field["type"] for field in table_metadata["resources"][0]["schema"]["fields"]] == [
+        field["type"] for field in metadata["resources"][0]["schema"]["fields"]
+    ]
+    assert table_metadata["resources"][0]["schema"]["primaryKey"] == ["id"]
+    profiles = inspection.profile_data(table)
+    assert (profiles[0].minimum, profiles[0].maximum, profiles[0].cardinality) == (1, 2, 2)
+    assert inspection.profile_data(pa.schema([("id", pa.int64()), ("value", pa.float32())]))[:2] == [
+        inspection.ColumnProfile("id", "bigint"),
+        inspection.ColumnProfile("value", "float"),
+    ]
+    wide_types = pa.schema([("amount", pa.decimal128(38, 2)), ("count", pa.uint64()), ("small", pa.uint32())])
+    assert [profile.type for profile in inspection.profile_data(wide_types)] == ["numeric", "numeric", "bigint"]
+    wide_table = pa.table({"count": pa.array([1, 2**64 - 1], pa.uint64()), "small": pa.array([1, 2], pa.uint64())})
+    assert [profile.type for profile in inspection.profile_data(wide_table)] == ["numeric", "integer"]
@@ -0,0 +1,85 @@
+"""Tests for license module of OMI."""
+
+import json
+
+import pytest
+
+from omi import base, license
+
+
+def test_license_index_is_up_to_date():
+    """Test that shipped license index has been built from shipped SPDX licenses."""
+    with license.LICENSE_INDEX_FILE.open("r", encoding="utf-8") as f:
+        assert json.load(f) == license.build_license_index()
+
+
+def test_license_lookup():
+    """Test lookup of licenses via ID, name and alias."""
+    assert license.find_license_id("ODbL-1.0") == "ODbL-1.0"
+    assert license.find_license_id("cc-by-4.0") == "CC-BY-4.0"
+    assert license.find_license_id("Creative Commons Zero v1.0 Universal") == "CC0-1.0"
+    assert license.find_license_id("Open Data Commons Open Database License 1.0") == "ODbL-1.0"
+    assert license.find_license_id("Open Data Commons Open Database License (ODbL) v1.0") == "ODbL-1.0"
+    assert license.find_license_id("unknown license") is None
+
+    record = license.find_license("odbl-1.0")
+    assert record["name"] == "Open Data Commons Open Database License v1.0"
+    record["name"] = "changed"
+    assert license.find_license("odbl-1.0")["name"] == "Open Data Commons Open Database License v1.0"
+    assert license.validate_license("CC0-1.0")
+    assert not license.validate_license("unknown license")
+
+
+def test_deprecated_license_table():
+    """Test that deprecated license table is still provided on access, but warns about deprecation."""
+    with pytest.warns(DeprecationWarning, match="LICENSES"):
+        from omi.license import LICENSES
+    assert ("ODBL-1.0", "OPEN-DATA-COMMONS-OPEN-DATABASE-LICENSE-V1.0") in LICENSES
+    with pytest.warns(DeprecationWarning, match="LICENSES"):
+        assert license.LICENSES is LICENSES
+    with pytest.raises(AttributeError, match="no attribute 'UNKNOWN'"):
+        license.UNKNOWN  # noqa: B018
+
+
+def test_oemetadata_license_validation():
+    """Test that licenses are valid if either name or title is found."""
+    metadata = base.get_metadata_specification("OEMetadata-2.0").example
+    license.validate_oemetadata_licenses(metadata)
+    metadata["resources"][0]["licenses"][0]["title"] = "unknown license"
+    license.validate_oemetadata_licenses(metadata)
+    metadata["resources"][0]["licenses"][0]["name"] = "unknown license"
+    with pytest.raises(license.LicenseError, match="was not found in the SPDX licenses list"):
+        license.validate_oemetadata_licenses(metadata)
+
+
+def test_license_suggestions():
+    """Test ranked suggestions for license variants."""
+    assert license.suggest_licenses("CC BY 4.0")[0] == ("CC-BY-4.0", 1.0)
+    assert license.suggest_licenses("dl-de/by-2-0")[0] == ("DL-DE-BY-2.0", 1.0)
+    assert license.suggest_licenses("Creative Commons Attribution 4.0")[0][0] == "CC-BY-4.0"
+    assert license.suggest_licenses("Creative Commons Attribution Share Alike 4.0")[0][0] == "CC-BY-SA-4.0"
+    suggestions = license.suggest_licenses("Open Database License", limit=3)
+    assert len(suggestions) == 3
+    assert suggestions[0][0] == "ODbL-1.0"
+    assert suggestions == sorted(suggestions, key=lambda suggestion: -suggestion[1])
+    assert license.suggest_licenses("xyz", min_score=0.5) == []
+
+
+def test_oemetadata_license_suggestions_and_fixes():
+    """Test that unknown licenses are reported with suggestions or are fixed in fix mode."""
+    metadata = base.get_metadata_specification("OEMetadata-2.0").example
+    metadata["resources"][0]["licenses"][0].update(name="Open Database License", title="")
+    with pytest.raises(license.LicenseError, match=r"Did you mean one of: ODbL-1.0 \(0.702\)"):
+        license.validate_oemetadata_licenses(metadata)
+
+    fixes = license.validate_oemetadata_licenses(metadata, fix=True)
+    assert fixes == [
+        {
+            "resource": 1,
+            "license": 1,
+            "original": {**metadata["resources"][0]["licenses"][0], "name": "Open Database License", "title": ""},
+            "replacement": {"name": "ODbL-1.0", "title": "Open Data Commons Open Database License v1.0"},
+        },
+    ]
+    assert metadata["resources"][0]["licenses"][0]["name"] == "ODbL-1.0"
+    assert license.validate_oemetadata_licenses(metadata) == []
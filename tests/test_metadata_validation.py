@@ -1,8 +1,10 @@
 """Tests for validation module of OMI."""
 
+import importlib.util
 import json
 import pathlib
 import re
+import sys
 
 import pytest
 
@@ -162,3 +164,125 @@ def test_metadata_against_oep_table_with_incompatible_field_types():
         match="Field type 'bigint' from OEP table field 'id' differs from type 'string' defined in metadata schema.",
     ):
         validation.validate_oep_table_against_metadata(oep_table=table, oep_schema="model_draft", metadata=metadata)
+
+
+@pytest.mark.parametrize("fast", [True, False])
+def test_metadata_parsing_detects_duplicate_keys(fast: bool, monkeypatch: pytest.MonkeyPatch):  # noqa: FBT001
+    """Test that duplicate keys are detected with and without fast JSON parser."""
+    import_orjson = getattr(validation, "__import_orjson")
+    import_orjson.cache_clear()
+    if not fast:
+        monkeypatch.setitem(sys.modules, "orjson", None)
+    assert (import_orjson() is not None) == (fast and importlib.util.find_spec("orjson") is not None)
+
+    assert validation.parse_metadata('{"a": "x\\": y", "b": [{"c": 1}]}') == {"a": 'x": y', "b": [{"c": 1}]}
+    for metadata_string in (
+        '{"a": 1, "b": {"c": 1, "c": 2}}',
+        '{"c" : 1, "c": 2}',
+        '{"c": "\\u0022:", "c": 1}',
+        '{"b": [1, {"c": 1, "c": 1}]}',
+    ):
+        with pytest.raises(validation.ValidationError, match="Duplicate keys in metadata: 'c'"):
+            validation.parse_metadata(metadata_string)
+    with pytest.raises(validation.ValidationError, match="Failed to decode JSON: Expecting ',' delimiter at line 1"):
+        validation.parse_metadata('{"a": 1')
+    import_orjson.cache_clear()
+
+
+def test_metadata_validator_is_cached():
+    """Test that JSON schema validators are built once per metadata version."""
+    validator = validation.get_metadata_validator("OEP-1.6.0")
+    assert validation.get_metadata_validator("OEP-1.6.0") is validator
+    assert validation.get_metadata_validator("OEP-1.6.0", check_formats=True) is not validator
+    assert validation.get_metadata_validator("OEMetadata-2.0") is not validator
+
+
+def test_metadata_validation_with_format_check():
+    """Test that string formats are only checked if requested."""
+    metadata = base.get_metadata_specification("OEMetadata-2.0").example
+    metadata["resources"][0]["publicationDate"] = "not a date"
+    validation.validate_metadata(metadata, check_license=False)
+    with pytest.raises(validation.ValidationError, match="'not a date' is not a 'date'"):
+        validation.validate_metadata(metadata, check_license=False, check_formats=True)
+
+
+def test_incremental_metadata_validation():
+    """Test that only units touched by JSON patch are re-validated and results match full validation."""
+    metadata = base.get_metadata_specification("OEMetadata-2.0").example
+    result = validation.revalidate_metadata(metadata)
+    assert result.valid
+    assert len(result.revalidated) == 1 + 1 + len(metadata["resources"][0]["schema"]["fields"])
+
+    metadata["resources"][0]["schema"]["fields"][1]["type"] = 5
+    patch = [{"op": "replace", "path": "/resources/0/schema/fields/1/type", "value": 5}]
+    result = validation.revalidate_metadata(metadata, result, patch)
+    assert result.revalidated == [("resources", 0, "schema", "fields", 1)]
+    assert [list(error.path) for error in result.errors] == [["resources", 0, "schema", "fields", 1, "type"]]
+    with pytest.raises(validation.ValidationError, match="5 is not of type 'string', 'null'"):
+        result.raise_on_error()
+
+    # Removing a field shifts following fields, thus these and related resource are re-validated
+    del metadata["resources"][0]["schema"]["fields"][1]
+    patch = [{"op": "remove", "path": "/resources/0/schema/fields/1"}]
+    result = validation.revalidate_metadata(metadata, result, patch)
+    assert result.revalidated[0] == ("resources", 0)
+    assert len(result.revalidated) == len(metadata["resources"][0]["schema"]["fields"])
+    assert result.valid
+
+    metadata["resources"][0]["licenses"][0].update(name="unknown license", title="")
+    patch = [{"op": "replace", "path": "/resources/0/licenses/0/name", "value": "unknown license"}]
+    result = validation.revalidate_metadata(metadata, result, patch)
+    assert result.revalidated == [("resources", 0)]
+    with pytest.raises(license.LicenseError, match="was not found in the SPDX licenses list"):
+        result.raise_on_error()
+
+    metadata["name"] = 1
+    result = validation.revalidate_metadata(metadata, result, [{"op": "replace", "path": "/name", "value": 1}])
+    assert result.revalidated == [()]
+    assert len(result.errors) == 1
+    assert len(result.license_errors) == 1
+
+
+def test_metadata_report_holds_all_errors():
+    """Test that report collects all schema violations and license errors in a single pass."""
+    metadata = base.get_metadata_specification("OEMetadata-2.0").example
+    report = validation.validate_metadata(metadata, return_report=True)
+    assert report.valid
+
+    metadata["name"] = 3
+    metadata["resources"][0]["schema"]["fields"][1]["type"] = 5
+    metadata["resources"][0]["licenses"][0].update(name="unknown license", title="")
+    metadata["resources"][0]["licenses"].append({"name": "Open Database License", "title": ""})
+    report = validation.validate_metadata(metadata, return_report=True)
+    assert not report.valid
+    assert [(error["path"], error["validator"]) for error in report.errors] == [
+        ("$.name", "type"),
+        ("$.resources[0].schema.fields[1].type", "type"),
+    ]
+    assert [error["path"] for error in report.license_errors] == [
+        "$.resources[0].licenses[0]",
+        "$.resources[0].licenses[1]",
+    ]
+    assert "Did you mean one of: ODbL-1.0" in report.license_errors[1]["message"]
+    assert json.loads(json.dumps(report.to_dict()))["errors"] == report.errors
+
+
+def test_missing_optional_fields():
+    """Test that missing optional fields are found in array items as well and are reported as a single warning."""
+    assert validation.get_optional_field_paths("OEP-1.6.0") is validation.get_optional_field_paths("OEP-1.6.0")
+    metadata = base.get_metadata_specification("OEMetadata-2.0").example
+    assert validation.find_missing_optional_fields(metadata) == []
+
+    del metadata["name"]
+    del metadata["resources"][0]["title"]
+    del metadata["resources"][0]["schema"]["fields"][2]["description"]
+    missing = validation.find_missing_optional_fields(metadata)
+    assert [(warning["path"], warning["field"]) for warning in missing] == [
+        ("$", "name"),
+        ("$.resources[0]", "title"),
+        ("$.resources[0].schema.fields[2]", "description"),
+    ]
+    assert validation.validate_metadata(metadata, return_report=True).warnings == missing
+    with pytest.warns(UserWarning, match=r"3 optional fields not found in metadata \(i.e. \$.name, ") as record:
+        validation.validate_metadata(metadata)
+    assert len(record) == 1
@@ -0,0 +1,144 @@
+"""Tests for OEP client using a local stub server."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import pathlib
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING
+
+import pytest
+
+from omi import base, oep, validation
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterator
+
+TABLES = {
+    "/api/v0/schema/model_draft/tables/my_table/meta/": {"name": "my_table", "resources": []},
+    "/api/v0/schema/model_draft/tables/my_table/columns": {"id": {"data_type": "bigint"}},
+}
+with (pathlib.Path(__file__).parent / "test_data" / "validation" / "metadata_oep_validation.json").open() as f:
+    OEP_METADATA = json.load(f)
+for i in range(6):
+    OEP_METADATA["resources"][0]["name"] = f"model_draft.table_{i}"
+    TABLES[f"/api/v0/schema/model_draft/tables/table_{i}/meta/"] = json.loads(json.dumps(OEP_METADATA))
+    TABLES[f"/api/v0/schema/model_draft/tables/table_{i}/columns"] = {
+        field["name"]: {"data_type": field["type"] if i != 0 else "text"}
+        for field in OEP_METADATA["resources"][0]["schema"]["fields"]
+    }
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Serve tables and count requests, supporting ETags."""
+
+    requests: list[tuple[str, str | None]] = []
+    active: list[int] = [0, 0]  # Number of current requests and maximum number of concurrent requests
+    lock = threading.Lock()
+
+    def do_GET(self) -> None:
+        """Respond with table content, 304 if ETag matches or 404 for unknown paths."""
+        with self.lock:
+            self.active[0] += 1
+            self.active[1] = max(self.active)
+        time.sleep(0.05)
+        with self.lock:
+            self.active[0] -= 1
+        etag = self.headers.get("If-None-Match")
+        self.requests.append((self.path, etag))
+        if self.path not in TABLES:
+            self.send_response(404)
+            self.end_headers()
+            return
+        if etag == '"v1"':
+            self.send_response(304)
+            self.end_headers()
+            return
+        body = json.dumps(TABLES[self.path]).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("ETag", '"v1"')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: object) -> None:
+        """Silence logging."""
+
+
+@pytest.fixture
+def oep_url() -> Iterator[str]:
+    """Run stub server and use it as OEP for shared client."""
+    StubHandler.requests.clear()
+    StubHandler.active[:] = [0, 0]
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://127.0.0.1:{server.server_port}"
+    yield url
+    oep.set_oep_client(None)
+    server.shutdown()
+    server.server_close()
+
+
+def test_oep_client_caches_responses(oep_url: str):
+    """Test that shared client requests each resource only once."""
+    oep.set_oep_client(oep.OEPClient(oep_url, retries=0))
+    metadata = base.get_metadata_from_oep_table("my_table")
+    metadata["name"] = "changed"
+    assert base.get_metadata_from_oep_table("my_table")["name"] == "my_table"
+    get_fields_from_oep_table = getattr(validation, "__get_fields_from_oep_table")
+    assert get_fields_from_oep_table("my_table", "model_draft") == {"id": "bigint"}
+    get_fields_from_oep_table("my_table", "model_draft")
+    assert len(StubHandler.requests) == 2
+
+    with pytest.raises(base.MetadataError, match="Could not retrieve metadata from OEP table 'model_draft.unknown'."):
+        base.get_metadata_from_oep_table("unknown")
+
+
+def test_oep_client_revalidates_expired_responses(oep_url: str, tmp_path: pathlib.Path):
+    """Test ETag revalidation of expired responses and on-disk cache, which only clears its own files."""
+    unrelated_file = tmp_path / "data.json"
+    unrelated_file.write_text("{}")
+    client = oep.OEPClient(oep_url, retries=0, cache_ttl=0, cache_dir=tmp_path)
+    assert client.get_table_metadata("my_table", "model_draft")["name"] == "my_table"
+    assert client.get_table_metadata("my_table", "model_draft")["name"] == "my_table"
+    assert [etag for _, etag in StubHandler.requests] == [None, '"v1"']
+
+    # Expired response on disk is revalidated once, afterwards it is used by other clients without request
+    for _ in range(2):
+        client = oep.OEPClient(oep_url, retries=0, cache_ttl=300, cache_dir=tmp_path)
+        assert client.get_table_metadata("my_table", "model_draft")["name"] == "my_table"
+    assert len(StubHandler.requests) == 3
+
+    assert len(list((tmp_path / "omi-oep").glob("*.json"))) == 1
+    client.clear_cache()
+    assert not list((tmp_path / "omi-oep").glob("*.json"))
+    assert unrelated_file.read_text() == "{}"
+    with pytest.raises(oep.OEPError, match="failed with status code 404") as error:
+        client.get_json("/unknown")
+    assert error.value.status_code == 404
+
+
+def test_bulk_fetching_and_validation_of_oep_tables(oep_url: str):
+    """Test that tables are fetched and validated concurrently with bounded concurrency."""
+    oep.set_oep_client(oep.OEPClient(oep_url, retries=0))
+    tables = [("model_draft", f"table_{i}") for i in range(6)] + [("model_draft", "unknown")]
+
+    async def collect(results: AsyncIterator[oep.OEPTableResult]) -> dict[str, oep.OEPTableResult]:
+        return {result.oep_table: result async for result in results}
+
+    results = asyncio.run(collect(base.get_metadata_from_oep_tables(iter(tables), concurrency=3)))
+    assert len(results) == len(tables)
+    assert results["table_1"].result["resources"][0]["name"] == "model_draft.table_1"
+    assert isinstance(results["unknown"].error, base.MetadataError)
+    assert StubHandler.active[1] == 3
+
+    results = asyncio.run(collect(validation.validate_oep_tables_against_metadata(tables, concurrency=3)))
+    assert sorted(table for table, result in results.items() if result.error is None) == [
+        f"table_{i}" for i in range(1, 6)
+    ]
+    assert "differs from type" in str(results["table_0"].error)
+    assert isinstance(results["unknown"].error, base.MetadataError)
@@ -0,0 +1,39 @@
+"""Tests for memory-mapped reader of OMI."""
+
+import pathlib
+
+import pytest
+
+from omi import reader
+
+
+@pytest.mark.parametrize("trailing_line_break", [True, False])
+def test_split_file_into_ranges_of_whole_rows(tmp_path: pathlib.Path, trailing_line_break: bool):  # noqa: FBT001
+    """Test that byte ranges hold whole rows, cover all rows after the header and can be read independently."""
+    rows = [f"{i};{'x' * (i % 7)}\n".encode() for i in range(100)]
+    if not trailing_line_break:
+        rows[-1] = rows[-1].rstrip(b"\n")
+    data_file = tmp_path / "data.csv"
+    data_file.write_bytes(b"id;value\n" + b"".join(rows))
+
+    assert reader.read_header(data_file) == b"id;value\n"
+    for chunk_bytes in (1, 10, 100, 10_000):
+        ranges = reader.split_file(data_file, chunk_bytes=chunk_bytes)
+        assert ranges[0][0] == len(b"id;value\n")
+        assert [start for start, _ in ranges[1:]] == [end for _, end in ranges[:-1]]
+        chunks = [reader.read_range(data_file, start, end) for start, end in ranges]
+        assert all(chunk.endswith(b"\n") for chunk in chunks[:-1])
+        assert b"".join(chunks) == b"".join(rows)
+    assert b"".join(reader.iter_blocks(data_file, 9, data_file.stat().st_size)) == b"".join(rows)
+
+    with pytest.raises(ValueError, match="at least 1 byte"):
+        reader.split_file(data_file, chunk_bytes=0)
+
+
+def test_split_empty_file(tmp_path: pathlib.Path):
+    """Test that empty files and files holding a header only are split into no ranges."""
+    (tmp_path / "empty.csv").write_bytes(b"")
+    (tmp_path / "header.csv").write_bytes(b"id;value\n")
+    assert reader.read_header(tmp_path / "empty.csv") == b""
+    assert reader.split_file(tmp_path / "empty.csv", chunk_bytes=10) == []
+    assert reader.split_file(tmp_path / "header.csv", chunk_bytes=10) == []